@@ -1,957 +1,18 @@
-import streamlit as st
-import pandas as pd
-import graphviz  # For AST visualization
-import math
-from typing import List
-import re
-import matplotlib.pyplot as plt
-import numpy as np
-
-# maheshwara_core/hash.py
-
-MAHESHWARA_ORDER = [
-    "a","i","u","R",
-    "L","e","o","ai","au",
-    "h","y","v","r","l",
-    "n","m","ng","n"
-]
-
-PRIME = 12289          # lattice-friendly prime (used in PQ crypto)
-ROUNDS = 12            # diffusion rounds
-OUTPUT_HEX_LEN = 32    # 128-bit output (32 hex chars)
-
-
-# -----------------------------
-# 1. Phoneme → lattice mapping
-# -----------------------------
-def phoneme_index(ch: str) -> int:
-    return MAHESHWARA_ORDER.index(ch) if ch in MAHESHWARA_ORDER else ord(ch) % len(MAHESHWARA_ORDER)
-
-
-def lattice_vector(text: str) -> List[int]:
-    vec = []
-    for i, ch in enumerate(text):
-        idx = phoneme_index(ch)
-        # map into lattice space
-        v = (idx * (i + 1) ** 2 + len(text)) % PRIME
-        vec.append(v)
-    return vec or [0]
-
-
-# -----------------------------
-# 2. Non-linear lattice mixing
-# -----------------------------
-def mix(vec: List[int]) -> List[int]:
-    out = []
-    n = len(vec)
-    for i in range(n):
-        left = vec[i - 1]
-        mid = vec[i]
-        right = vec[(i + 1) % n]
-        mixed = (left * 31 + mid * 17 + right * 13) % PRIME
-        out.append(mixed)
-    return out
-
-
-# -----------------------------
-# 3. Permutation (Avalanche)
-# -----------------------------
-def permute(vec: List[int], r: int) -> List[int]:
-    n = len(vec)
-    perm = [(vec[(i * 7 + r * 3) % n] ^ (r + i)) % PRIME for i in range(n)]
-    return perm
-
-
-# -----------------------------
-# 4. Sponge rounds
-# -----------------------------
-def sponge(vec: List[int]) -> List[int]:
-    state = vec[:]
-    for r in range(ROUNDS):
-        state = mix(state)
-        state = permute(state, r)
-    return state
-
-
-# -----------------------------
-# 5. Squeeze → hex digest
-# -----------------------------
-def squeeze(state: List[int]) -> str:
-    acc = 0
-    for v in state:
-        acc ^= (v << (v % 13)) & ((1 << 256) - 1)
-
-    hex_out = hex(acc)[2:].zfill(OUTPUT_HEX_LEN)
-    return hex_out[:OUTPUT_HEX_LEN]
-
-
-# -----------------------------
-# Public API
-# -----------------------------
-def maheshwara_hash(text: str) -> str:
-    """
-    Maheshwara Hash v1
-    Post-quantum inspired lattice-phonetic hash
-    """
-    lattice = lattice_vector(text)
-    state = sponge(lattice)
-    return squeeze(state)
-
-# lexer
-def tokenize(src: str):
-    tokens = []
-    lines = src.splitlines()
-    indent_stack = [0]
-    for i, line in enumerate(lines):
-        indent = len(line) - len(line.lstrip())
-        line = line.strip()
-        if not line:
-            continue
-        # Handle indent/dedent (upgrade 1: for blocks)
-        if indent > indent_stack[-1]:
-            indent_stack.append(indent)
-            tokens.append(('INDENT',))
-        while indent < indent_stack[-1]:
-            indent_stack.pop()
-            tokens.append(('DEDENT',))
-        # Tokenize words, strings, numbers, operators
-        parts = re.findall(r"[A-Za-z_]+|[0-9]+|'[^']*'|\(|\)|==|!=|<|>|=|\+|\-|\*|\:|in", line)
-        tokens.append(tuple(parts))
-    while len(indent_stack) > 1:
-        indent_stack.pop()
-        tokens.append(('DEDENT',))
-    return tokens
-
-# parser
-class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.pos = 0
-
-    def parse(self):
-        ast = []
-        while self.pos < len(self.tokens):
-            tok = self.tokens[self.pos]
-            if tok[0] == 'bhava':
-                bhava_name = tok[1]
-                if tok[-1] == ':':
-                    body = self.parse_block()
-                else:
-                    body = []
-                ast.append({"type": "bhava_block", "bhava": bhava_name, "body": body})
-                self.pos += 1
-            elif tok[0] == 'kar':
-                name = tok[1]
-                args = []
-                pos = 2
-                if len(tok) > pos and tok[pos] == '(':
-                    pos += 1
-                    while pos < len(tok) and tok[pos] != ')':
-                        args.append(tok[pos])
-                        pos += 1
-                    pos += 1  # skip )
-                body = []
-                if len(tok) > pos and tok[pos] == ':':
-                    body = self.parse_block()
-                ast.append({"type": "function_def", "name": name, "args": args, "body": body})
-                self.pos += 1
-            elif tok[0] == 'yadi':
-                test = " ".join(tok[1:-1]) if tok[-1] == ':' else " ".join(tok[1:])
-                body = self.parse_block() if tok[-1] == ':' else []
-                orelse = []
-                if self.pos + 1 < len(self.tokens) and self.tokens[self.pos + 1][0] == 'anya':
-                    self.pos += 1
-                    anya_tok = self.tokens[self.pos]
-                    if anya_tok[-1] == ':':
-                        orelse = self.parse_block()
-                ast.append({"type": "if", "test": test, "body": body, "orelse": orelse})
-                self.pos += 1
-            elif tok[0] == 'yugma':
-                var = tok[1]
-                if tok[2] == 'in':
-                    iter_ = tok[3]
-                else:
-                    raise ValueError("Expected 'in'")
-                body = self.parse_block() if tok[-1] == ':' else []
-                ast.append({"type": "for", "var": var, "iter": iter_, "body": body})
-                self.pos += 1
-            elif tok[0] == 'yatra':
-                test = " ".join(tok[1:-1]) if tok[-1] == ':' else " ".join(tok[1:])
-                body = self.parse_block() if tok[-1] == ':' else []
-                ast.append({"type": "while", "test": test, "body": body})
-                self.pos += 1
-            elif tok[0] == 'ch':
-                value = " ".join(tok[1:])
-                ast.append({"type": "print", "value": value})
-                self.pos += 1
-            else:  # Assignment or call
-                if '=' in tok:
-                    ast.append({"type": "assign", "target": tok[0], "value": " ".join(tok[2:])})
-                else:
-                    ast.append({"type": "call", "expr": " ".join(tok)})
-                self.pos += 1
-        return ast
-
-    def parse_block(self):
-        body = []
-        self.pos += 1  # consume INDENT
-        while self.pos < len(self.tokens) and self.tokens[self.pos][0] != 'DEDENT':
-            body += self.parse()
-        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == 'DEDENT':
-            self.pos += 1  # consume DEDENT
-        return body
-
-    def expect(self, val):
-        tok = self.tokens[self.pos]
-        if tok[-1] != val:
-            raise ValueError(f"Expected {val}")
-        self.pos += 1
-
-def parse(tokens):
-    return Parser(tokens).parse()
-
-# transpiler
-def transpile_ast(ast, indent=0):
-    py = []
-    sp = "    " * indent
-    for node in ast:
-        if node['type'] == 'bhava_block':  # Upgrade 2
-            py.append(f"{sp}# Bhāva: {node['bhava']}")
-            py += transpile_ast(node['body'], indent + 1)
-        elif node['type'] == 'function_def':
-            py.append(f"{sp}def {node['name']}({', '.join(node['args'])}):")
-            py += transpile_ast(node['body'], indent + 1)
-        elif node['type'] == 'if':
-            py.append(f"{sp}if {node['test']}:")
-            py += transpile_ast(node['body'], indent + 1)
-            if node['orelse']:
-                py.append(f"{sp}else:")
-                py += transpile_ast(node['orelse'], indent + 1)
-        elif node['type'] == 'for':
-            py.append(f"{sp}for {node['var']} in range({node['iter']}):")  # Assume numeric range for demo
-            py += transpile_ast(node['body'], indent + 1)
-        elif node['type'] == 'while':
-            py.append(f"{sp}while {node['test']}:")
-            py += transpile_ast(node['body'], indent + 1)
-        elif node['type'] == 'print':
-            py.append(f"{sp}print({node['value']})")
-        elif node['type'] == 'assign':
-            py.append(f"{sp}{node['target']} = {node['value']}")
-        elif node['type'] == 'call':
-            py.append(f"{sp}{node['expr']}()")  # Assume no args for simplicity
-    return py
-
-def transpile_ast(ast):
-    return "\n".join(transpile_ast(ast))
-
-# Bytecode optimization
-OP_CODES = {
-    'LOAD_CONST': 1,
-    'LOAD_VAR': 2,
-    'STORE_VAR': 3,
-    'PRINT': 4,
-    'JUMP_IF_FALSE': 5,
-    'JUMP': 6,
-    'CALL': 7,
-    'RETURN': 8,
-    'ADD': 9,
-    'LOOP_START': 10,
-    'LOOP_END': 11,
-    'SUB': 12,
-    'MUL': 13,
-    'DIV': 14,
-    # Add more as needed
-}
-
-def compile_to_bytecode(ast):
-    bytecode = []
-    constants = {}  # Constant folding
-    def compile_node(node):
-        if node['type'] == 'print':
-            compile_expr(node['value'])
-            bytecode.append((OP_CODES['PRINT'],))
-        elif node['type'] == 'assign':
-            compile_expr(node['value'])
-            bytecode.append((OP_CODES['STORE_VAR'], node['target']))
-        elif node['type'] == 'if':
-            compile_expr(node['test'])
-            jump_false_idx = len(bytecode)
-            bytecode.append((OP_CODES['JUMP_IF_FALSE'], 0))  # Placeholder
-            compile_body(node['body'])
-            jump_idx = len(bytecode)
-            bytecode.append((OP_CODES['JUMP'], 0))  # Placeholder
-            bytecode[jump_false_idx] = (OP_CODES['JUMP_IF_FALSE'], len(bytecode))
-            compile_body(node['orelse'])
-            bytecode[jump_idx] = (OP_CODES['JUMP'], len(bytecode))
-        elif node['type'] == 'for':
-            bytecode.append((OP_CODES['LOAD_CONST'], 0))
-            bytecode.append((OP_CODES['STORE_VAR'], node['var']))
-            loop_start = len(bytecode)
-            bytecode.append((OP_CODES['LOAD_VAR'], node['var']))
-            compile_expr(node['iter'])
-            bytecode.append((OP_CODES['JUMP_IF_FALSE'], 0))  # Placeholder for end
-            compile_body(node['body'])
-            bytecode.append((OP_CODES['LOAD_VAR'], node['var']))
-            bytecode.append((OP_CODES['LOAD_CONST'], 1))
-            bytecode.append((OP_CODES['ADD'],))
-            bytecode.append((OP_CODES['STORE_VAR'], node['var']))
-            bytecode.append((OP_CODES['JUMP'], loop_start))
-            end_idx = len(bytecode)
-            for i in range(loop_start, end_idx):
-                if bytecode[i][0] == OP_CODES['JUMP_IF_FALSE'] and bytecode[i][1] == 0:
-                    bytecode[i] = (OP_CODES['JUMP_IF_FALSE'], end_idx)
-        # Add similar for while, function_def, etc.
-        # For bhava_block, just compile body
-        elif node['type'] == 'bhava_block':
-            compile_body(node['body'])
-        # ... expand for other nodes
-
-    def compile_body(body):
-        for subnode in body:
-            compile_node(subnode)
-
-    def compile_expr(expr):
-        if expr.isdigit():
-            const_id = constants.setdefault(int(expr), len(constants))
-            bytecode.append((OP_CODES['LOAD_CONST'], const_id))
-        elif '+' in expr or '-' in expr or '*' in expr or '/' in expr:  # Simple parsing
-            parts = re.split(r'(\+|\-|\*|/)', expr)
-            compile_expr(parts[0].strip())
-            for op, val in zip(parts[1::2], parts[2::2]):
-                compile_expr(val.strip())
-                if op == '+':
-                    bytecode.append((OP_CODES['ADD'],))
-                elif op == '-':
-                    bytecode.append((OP_CODES['SUB'],))
-                elif op == '*':
-                    bytecode.append((OP_CODES['MUL'],))
-                elif op == '/':
-                    bytecode.append((OP_CODES['DIV'],))
-        else:
-            bytecode.append((OP_CODES['LOAD_VAR'], expr))
-
-    compile_body(ast)
-    return bytecode, constants
-
-def execute_bytecode(bytecode, constants, env=None):
-    if env is None:
-        env = {}
-    stack = []
-    pc = 0
-    output = []
-    const_list = list(constants.keys())  # For fast lookup
-    while pc < len(bytecode):
-        op = bytecode[pc]
-        pc += 1
-        if op[0] == OP_CODES['LOAD_CONST']:
-            stack.append(const_list[op[1]])
-        elif op[0] == OP_CODES['LOAD_VAR']:
-            stack.append(env.get(op[1], 0))
-        elif op[0] == OP_CODES['STORE_VAR']:
-            env[op[1]] = stack.pop()
-        elif op[0] == OP_CODES['PRINT']:
-            output.append(str(stack.pop()))
-        elif op[0] == OP_CODES['JUMP_IF_FALSE']:
-            if not stack.pop():
-                pc = op[1]
-        elif op[0] == OP_CODES['JUMP']:
-            pc = op[1]
-        elif op[0] == OP_CODES['ADD']:
-            b = stack.pop()
-            a = stack.pop()
-            stack.append(a + b)
-        elif op[0] == OP_CODES['SUB']:
-            b = stack.pop()
-            a = stack.pop()
-            stack.append(a - b)
-        elif op[0] == OP_CODES['MUL']:
-            b = stack.pop()
-            a = stack.pop()
-            stack.append(a * b)
-        elif op[0] == OP_CODES['DIV']:
-            b = stack.pop()
-            a = stack.pop()
-            stack.append(a / b)
-        # Add handlers for more ops
-    return output
-
-def interpret_ast(ast, env=None):
-    bytecode, constants = compile_to_bytecode(ast)
-    return execute_bytecode(bytecode, {v: k for k, v in constants.items()}, env)  # Invert for lookup
-
-# bhava_map
-BHAVA_TABLE = [
-    {"phoneme": "ma", "bhava": "Maitri", "chakra": "Anahata", "rasa": "Shanta"},
-    {"phoneme": "ra", "bhava": "Vira", "chakra": "Manipura", "rasa": "Vira"},
-    {"phoneme": "sha", "bhava": "Shanta", "chakra": "Sahasrara", "rasa": "Shanta"},
-    {"phoneme": "ka", "bhava": "Karuna", "chakra": "Anahata", "rasa": "Karuna"},  # Added more Bhavas
-    {"phoneme": "ha", "bhava": "Hasya", "chakra": "Vishuddha", "rasa": "Hasya"},
-    {"phoneme": "sa", "bhava": "Shringara", "chakra": "Swadhisthana", "rasa": "Shringara"},
-    {"phoneme": "ba", "bhava": "Bibhatsa", "chakra": "Muladhara", "rasa": "Bibhatsa"},
-    {"phoneme": "da", "bhava": "Adbhuta", "chakra": "Ajna", "rasa": "Adbhuta"},
-    {"phoneme": "pa", "bhava": "Bhayanaka", "chakra": "Manipura", "rasa": "Bhayanaka"},
-]
+import os
 
-def apply_bhava(code_or_env, bhava):
-    # Upgrade 2: Simple Bhāva application (demo: prefix comments or modify env)
-    if isinstance(code_or_env, str):
-        return f"# Bhāva {bhava}\n{code_or_env}"
-    else:  # Env modification
-        code_or_env['bhava_mode'] = bhava  # e.g., could affect print styles
-        # More rules: e.g., if 'vira', add assert
-        if bhava == 'Vira':
-            code_or_env['assert_mode'] = True
-        elif bhava == 'Shanta':
-            code_or_env['calm_mode'] = True
-        elif bhava == 'Karuna':
-            code_or_env['compassion_mode'] = True
-        # Add more bhava-specific rules
-        return code_or_env
-
-# mantras (NEW: Upgrade 6 — Mantra-based execution)
-def gayatri_ast():
-    return [{"type": "print", "value": "'Wisdom unlocked'"}]
-
-def mahamrityunjaya_ast():
-    return [{"type": "call", "expr": "protect"}]
-
-chant_to_ast = {
-    "gayatri": gayatri_ast,
-    "mahamrityunjaya": mahamrityunjaya_ast,
-    # Add more mantras → AST mappings
-}
-
-# Vedic Math functions expanded
-VEDIC_SUTRAS = [
-    {"name": "Ekadhikena Purvena", "desc": "By one more than the previous one.", "example": "Square numbers ending in 5."},
-    {"name": "Nikhilam Navatashcaramam Dashatah", "desc": "All from 9 and the last from 10.", "example": "Multiplication near bases."},
-    {"name": "Urdhva-Tiryagbhyam", "desc": "Vertically and crosswise.", "example": "General multiplication."},
-    {"name": "Paraavartya Yojayet", "desc": "Transpose and adjust.", "example": "Division near base."},
-    {"name": "Shunyam Samyasamuccaye", "desc": "When the sum is the same then zero.", "example": "Equations."},
-    {"name": "Anurupye Shunyamanyat", "desc": "If one is in ratio, the other is zero.", "example": "Proportions."},
-    {"name": "Sankalana-vyavakalanabhyam", "desc": "By addition and subtraction.", "example": "Equations."},
-    {"name": "Puranapuranabhyam", "desc": "By the completion or non-completion.", "example": "Fractions."},
-    {"name": "Chalana-Kalanabhyam", "desc": "Differences and similarities.", "example": "Calculus."},
-    {"name": "Yaavadunam", "desc": "Whatever the extent of its deficiency.", "example": "Squaring near base."},
-    {"name": "Vyashtisamanstih", "desc": "Part and whole.", "example": "Division."},
-    {"name": "Shesanyankena Charamena", "desc": "The remainders by the last digit.", "example": "Divisibility."},
-    {"name": "Sopaantyadvayamantyam", "desc": "The ultimate and twice the penultimate.", "example": "Divisibility by 11."},
-    {"name": "Ekanyunena Purvena", "desc": "By one less than the previous one.", "example": "Multiplication by 9, 99."},
-    {"name": "Gunitasamuchyah", "desc": "The product of the sum is equal to the sum of the product.", "example": "Verification."},
-    {"name": "Gunakasamuchyah", "desc": "The factors of the sum is equal to the sum of the factors.", "example": "Factorization."},
-]
-
-def vedic_multiply(a, b):
-    # Nikhilam sutra - advanced for larger bases
-    if a > 100 or b > 100:
-        base = 100
-    else:
-        base = 10
-    diff_a = a - base
-    diff_b = b - base
-    cross = (a + diff_b) * base
-    prod_diff = diff_a * diff_b
-    return cross + prod_diff
-
-def vedic_square(n):
-    # Ekadhikena Purvena - advanced for numbers close to base
-    base = 10 ** (len(str(n)) - 1)
-    if n % base == base // 2:  # For ending in 5 (generalized)
-        base_n = n // (base // 10)
-        return (base_n * (base_n + 1)) * (base ** 2) + (base // 2) ** 2
-    else:
-        # Yaavadunam integration
-        diff = n - base
-        return (n - diff) * base + diff**2
-
-def vedic_divide(dividend, divisor):
-    # Paraavartya Yojayet - advanced with adjustment
-    if divisor == 0:
-        return "Division by zero"
-    base = 10 ** (len(str(divisor)) - 1)
-    adjust = base - divisor
-    # Advanced: flag method for division
-    # For simplicity, use basic with note
-    quotient = dividend // divisor
-    remainder = dividend % divisor
-    return f"{quotient} remainder {remainder} (advanced flag method would adjust for larger)"
-
-def vedic_add(numbers):
-    # Sankalana-vyavakalanabhyam - advanced pairwise
-    if len(numbers) == 2:
-        return numbers[0] + numbers[1]
-    return sum(numbers)  # Recursive or pairwise for large
-
-# Add advanced implementations for all
-def shunyam_equation(coeffs):
-    # Shunyam Samyasamuccaye - solve linear system where sums equal
-    # Assume coeffs = [a, b, c, d] for a x + b = c x + d
-    if len(coeffs) == 4 and coeffs[0] + coeffs[1] == coeffs[2] + coeffs[3]:
-        return (coeffs[3] - coeffs[1]) / (coeffs[0] - coeffs[2]) if coeffs[0] != coeffs[2] else "Infinite"
-    return "No solution or invalid"
-
-def anurupye_proportion(a, b, ratio):
-    # Anurupye Shunyamanyat - if a in ratio, b zero
-    if b == 0:
-        return a * ratio
-    elif a == 0:
-        return b / ratio
-    return 0  # Placeholder
-
-def purana_fraction(num, den):
-    # Puranapuranabhyam - completion for fractions
-    # Advanced: complete incomplete fractions
-    return num / den  # Placeholder for advanced
-
-def chalana_diff(a, b):
-    # Chalana-Kalanabhyam - differences for calculus approx
-    return (a**2 - b**2) / (a - b) if a != b else 2 * a  # Derivative like
-
-def yaavadunam_square(n, base=10):
-    diff = n - base
-    return (n - diff) * base + diff**2
-
-def vyashti_div(dividend, divisor):
-    # Vyashtisamanstih - part and whole division
-    return dividend / divisor  # Advanced for polynomials, but basic
-
-def sheshanyankena_remainder(n, d):
-    # Shesanyankena Charamena - remainders by last digit
-    last_digit = int(str(d)[-1])
-    return n % last_digit  # Simplified, actual for divisibility
-
-def sopaantyadvayam_div_by_11(n):
-    # Sopaantyadvayamantyam - ultimate and twice penultimate for div by 11
-    digits = [int(d) for d in str(n)]
-    alt_sum = sum(digits[::2]) - sum(digits[1::2])
-    return alt_sum % 11 == 0
-
-def ekanyunena_mult_by_9(n):
-    # Ekanyunena Purvena - by one less
-    return n * 9  # Advanced for 99, 999: n * (10^k - 1) = (n-1) followed by k-1 9's minus n-1, but basic
-
-def gunita_product_sum(a, b, c):
-    # Gunitasamuchyah - product of sum = sum of product
-    return (a + b) * c == a * c + b * c
-
-def gunaka_factor_sum(a, b, c):
-    # Gunakasamuchyah - factors of sum = sum of factors
-    # Check if a + b == c for simplification
-    return a + b == c  # Placeholder for factorization
-
-def urdhva_multiply(a, b):
-    a_str = str(a)
-    b_str = str(b)
-    # Pad with zeros
-    max_len = max(len(a_str), len(b_str))
-    a_str = a_str.zfill(max_len)
-    b_str = b_str.zfill(max_len)
-    n = max_len
-    # Result array
-    res = [0] * (2 * n)
-    # Crosswise multiplication
-    for i in range(2 * n - 1):
-        temp = 0
-        for j in range(max(0, i - n + 1), min(i + 1, n)):
-            temp += int(a_str[n - 1 - j]) * int(b_str[n - 1 - (i - j)])
-        res[2 * n - 1 - i] = temp
-    # Carry over
-    carry = 0
-    for i in range(2 * n - 1, -1, -1):
-        temp = res[i] + carry
-        res[i] = temp % 10
-        carry = temp // 10
-    # Convert to int
-    result_str = ''.join(map(str, res)).lstrip('0')
-    return int(result_str) if result_str else 0
-
-# Tantric Geometry function
-def draw_sri_yantra():
-    fig, ax = plt.subplots()
-    ax.set_aspect('equal')
-    ax.set_xlim(-2, 2)
-    ax.set_ylim(-2, 2)
-    ax.axis('off')
-    
-    # Draw triangles (simplified)
-    for i in range(4):
-        theta = np.linspace(0, 2*np.pi, 4) + i * np.pi / 4
-        r = 1 + i * 0.2
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        ax.fill(x, y, alpha=0.2, color='blue')
-    
-    # Circles
-    circle = plt.Circle((0, 0), 1.5, color='red', fill=False)
-    ax.add_artist(circle)
-    
-    st.pyplot(fig)
-
-# Panini Grammar Data
-PANINI_CONCEPTS = [
-    {"sutra": "1.1.1: vṛddhir ādaic", "desc": "Defines vṛddhi vowels: ā, ai, au."},
-    {"sutra": "1.4.14: sup-tiṅantaṃ padam", "desc": "A word ends with nominal or verbal suffix."},
-    {"sutra": "3.1.91: dhātoḥ", "desc": "After a root (for verb formation)."},
-    {"sutra": "6.1.77: iko yaṇaci", "desc": "i,u,ṛ,ḷ become y,v,r,l before dissimilar vowels (sandhi)."},
-    {"sutra": "6.1.87: ād guṇaḥ", "desc": "a + i/u = e/o (guṇa sandhi)."},
-    {"sutra": "6.1.101: akaḥ savarṇe dīrghaḥ", "desc": "Same vowels combine to long vowel."},
-    {"sutra": "8.3.23: mo 'nusvāraḥ", "desc": "m before consonant becomes anusvāra."},
-    {"sutra": "3.2.123: vartamāne laṭ", "desc": "Present tense uses laṭ endings."},
-    {"sutra": "2.3.2: karmaṇi dvitīyā", "desc": "Accusative for object."},
-    {"sutra": "4.1.2: svaujasamauṭchṣṭa...", "desc": "Nominal endings list."},
-    # Add more sutras...
-]
+import streamlit as st
 
-SANDHI_RULES = [
-    "Vowel Sandhi: a + i = e (guṇa), a + a = ā (dirgha), i + u = yu (yan).",
-    "Visarga Sandhi: aḥ + a = o ' (lop with o), aḥ + c = aś c.",
-    "Consonant Sandhi: t + c = cc (doubling), n + t = nt (no change), m + consonant = anusvāra.",
-    # Examples
-    "deva + indra = devendra (a + i = e).",
-    "rāmaḥ + asti = rāmo 'sti (ḥ + a = o ').",
-    "jagat + nātha = jagannātha (t + n = nn).",
-]
+from sabdastra import trace
+from views import load_page, visible_pages
 
-SANSKRIT_LINGUISTICS = [
-    {"concept": "Vyakarana", "desc": "Sanskrit grammar tradition, primarily Panini's Ashtadhyayi."},
-    {"concept": "Panini", "desc": "Ancient grammarian, author of Ashtadhyayi with 3959 sutras."},
-    {"concept": "Pratyaharas", "desc": "Phoneme abbreviations from Maheshwara Sutras."},
-    {"concept": "Sandhi", "desc": "Euphonic combination of sounds."},
-    {"concept": "Samasa", "desc": "Compound words."},
-    {"concept": "Karaka", "desc": "Semantic roles like agent, object."},
-    {"concept": "Dhatu", "desc": "Verb roots."},
-    {"concept": "Vibhakti", "desc": "Case endings."},
-    {"concept": "Lakara", "desc": "Verb moods and tenses."},
-    {"concept": "Sphota", "desc": "Burst of meaning in philosophy of language."},
-    # From search
-]
+trace.configure(os.environ.get("SABDASTRA_TRACE", ""))
 
 # Streamlit App
 st.set_page_config(page_title="Śabdāstra Lab", layout="wide")
 st.title("Śabdāstra Lab — Learn Sanskrit-Inspired Coding")
 st.caption("Code.org–style learning for Śabdāstra (transliteration only) | Upgraded with all 16 Vedic Sutras, Sanskrit Linguistics, Optimized Bytecode VM")
 
-# Session state for progress (upgrade 4: lesson locking + saving)
-if 'completed_levels' not in st.session_state:
-    st.session_state.completed_levels = set()  # Use set for completed level IDs
-
-page = st.sidebar.radio("Navigate", [
-    "Welcome",
-    "Architecture",
-    "Playground",
-    "Skill Tree",
-    "Bhāva Explorer",
-    "Maheshwara Hash",
-    "Mantra Chanting Mode",
-    "Vedic Mathematics",  # New page
-    "Tantric Geometry",  # New page
-    "Panini Grammar",  # New page
-    "Sanskrit Linguistics",  # New page
-    "Deploy"
-])
-
-if page == "Welcome":
-    st.markdown("""
-    ### What is Śabdāstra?
-    Śabdāstra is a Sanskrit-inspired programming language where **sound → meaning → logic**.
-    This lab teaches it step-by-step:
-    - Tokenizer → AST → Transpiler / Interpreter
-    - Bhāva-tagged semantics (expanded)
-    - Maheshwara-based hashing
-    - NEW: Full grammar (if/else/loops), Bhāva blocks, AST viewer, progress saving, VM (bytecode optimized with constant folding), Mantra modes, All 16 Vedic Sutras (advanced impl), Tantric Geometry, Panini Grammar, Sanskrit Linguistics
-    """)
-
-if page == "Architecture":
-    st.markdown("""
-    ## Architecture
-    1. **Maheshwara Core** — phoneme order + cryptographic hash
-    2. **Lexer** — turns transliterated code into tokens (upgraded for yadi/anya/yugma/yatra)
-    3. **Parser** — builds an AST (upgraded for control flow + Bhāva blocks)
-    4. **Transpiler** — converts AST → Python
-    5. **Interpreter** — executes bytecode compiled from AST (optimized with constants, opcodes)
-    6. **Bhāva Layer** — semantic/emotional tagging (upgraded with more rules)
-    7. **Mantra Mode** — chant → AST mapping
-    8. **Vedic Math** — All 16 sutras implemented (advanced)
-    9. **Tantric Geometry** — Coding yantras
-    10. **Panini Grammar** — Sutras, sandhi, quizzes
-    11. **Sanskrit Linguistics** — Key concepts, Vyakarana overview
-    """)
-
-if page == "Playground":
-    src = st.text_area("Śabdāstra Code", """bhava vira:
-    kar greet(nama):
-        yadi nama == 'Mahan':
-            ch 'Namaste' nama
-        anya:
-            ch 'Hello' nama
-    yugma i in 3:
-        greet 'Mahan'
-""", height=220)
-    mode = st.radio("Execution Mode", ["Transpile to Python", "Interpret in VM"])
-    if st.button("Compile"):
-        try:
-            tokens = tokenize(src)
-            ast = parse(tokens)
-            # Upgrade 3: Visual AST Tree Viewer
-            st.subheader("AST Visualization")
-            dot = graphviz.Digraph()
-            def build_graph(node, parent=None):
-                nid = str(id(node))
-                label = node['type']
-                if 'name' in node: label += f": {node['name']}"
-                dot.node(nid, label)
-                if parent: dot.edge(parent, nid)
-                for key in ['body', 'orelse']:
-                    child = node.get(key)
-                    if isinstance(child, list):
-                        for c in child:
-                            build_graph(c, nid)
-                    elif isinstance(child, dict):
-                        build_graph(child, nid)
-                for key in ['test', 'iter']:
-                    child = node.get(key)
-                    if isinstance(child, dict):
-                        build_graph(child, nid)
-                return
-            build_graph({"type": "program", "body": ast})
-            st.graphviz(dot)
-            st.subheader("Tokens")
-            st.json(tokens)
-            st.subheader("AST")
-            st.json(ast)
-            if mode == "Transpile to Python":
-                py = transpile_ast(ast)
-                st.subheader("Python Output")
-                st.code(py, language="python")
-            else:
-                st.subheader("Bytecode")
-                bytecode, constants = compile_to_bytecode(ast)
-                st.json({"bytecode": bytecode, "constants": constants})
-                st.subheader("VM Output")
-                output = interpret_ast(ast)
-                st.code("\n".join(output))
-        except Exception as e:
-            st.error(f"Compilation error: {e}")
-
-if page == "Skill Tree":
-    st.markdown("""
-    ## Skill Tree
-    Complete levels sequentially. Mark as done to unlock next.
-    """)
-    levels = [
-        {'id':1,'title':'Level 1 — Basics','desc':'Tokens, kar (def), ch (print), basic function.','code':'kar greet(nama):\n    ch "Namaste" nama\ngreet "Mahan"'},
-        {'id':2,'title':'Level 2 — Control flow','desc':'yadi (if), anya (else).','code':'yadi 1 == 1:\n    ch "True"\nanya:\n    ch "False"'},
-        {'id':3,'title':'Level 3 — Loops','desc':'yugma (for), yatra (while).','code':'yugma i in 3:\n    ch i\nyatra i < 5:\n    ch i\n    i = i + 1'},
-        {'id':4,'title':'Level 4 — Bhāva Syntax','desc':'bhava blocks for semantic tagging.','code':'bhava vira:\n    ch "Heroic mode"'},
-        {'id':5,'title':'Level 5 — Advanced (Sādhanā)','desc':'Integrate Maheshwara Hash, Mantras, VM.','code':'ch maheshwara_hash("secret")'},
-        {'id':6,'title':'Level 6 — Vedic Math','desc':'Use Vedic functions.','code':'ch vedic_multiply(8, 9)'},
-        {'id':7,'title':'Level 7 — Tantric Geometry','desc':'Draw yantras.','code':'draw_sri_yantra()'},
-        {'id':8,'title':'Level 8 — Panini Grammar','desc':'Explore sutras and sandhi.','code':'# See Panini page'},
-        {'id':9,'title':'Level 9 — Sanskrit Linguistics','desc':'Key concepts in Vyakarana.','code':'# See Linguistics page'},
-    ]
-    for lvl in levels:
-        unlocked = all(st.session_state.completed_levels.issuperset({i for i in range(1, lvl['id'])}))  # Previous must be done
-        with st.expander(f"{lvl['title']} {'(Unlocked)' if unlocked else '(Locked)'}"):
-            if unlocked:
-                st.write(lvl['desc'])
-                st.code(lvl['code'])
-                if st.button(f"Mark Level {lvl['id']} Complete"):
-                    st.session_state.completed_levels.add(lvl['id'])
-                    st.success(f"Level {lvl['id']} completed! XP +100")
-            else:
-                st.info("Complete previous levels to unlock.")
-
-if page == "Bhāva Explorer":
-    df = pd.DataFrame(BHAVA_TABLE)
-    q = st.text_input("Search phoneme")
-    if q:
-        df = df[df.phoneme.str.contains(q)]
-    st.dataframe(df)
-    # Demo Bhāva application (upgrade 2)
-    bhava_code = st.text_area("Apply Bhāva to code", "ch 'Hello'")
-    bhava_select = st.selectbox("Bhāva", [b['bhava'] for b in BHAVA_TABLE])
-    if st.button("Apply Bhāva"):
-        modified = apply_bhava(bhava_code, bhava_select)
-        st.code(modified)
-
-if page == "Maheshwara Hash":
-    txt = st.text_area("Text / Code")
-    if st.button("Hash"):
-        st.code(maheshwara_hash(txt))
-
-if page == "Mantra Chanting Mode":
-    # Upgrade 6: Mantra-based execution
-    st.markdown("Chant a mantra to generate and execute code.")
-    mantra = st.selectbox("Mantra", list(chant_to_ast.keys()))
-    if st.button("Chant"):
-        ast = chant_to_ast[mantra]()
-        py = transpile_ast(ast)
-        st.subheader("Generated AST")
-        st.json(ast)
-        st.subheader("Generated Code")
-        st.code(py)
-        st.subheader("VM Execution")
-        output = interpret_ast(ast)
-        st.code("\n".join(output))
-
-if page == "Vedic Mathematics":
-    st.header("Explore Vedic Mathematics 🔢🕉️")
-    st.write("""
-    All 16 sutras with advanced algorithms. Select to explore.
-    """)
-    df_sutras = pd.DataFrame(VEDIC_SUTRAS)
-    st.dataframe(df_sutras)
-    sutra_select = st.selectbox("Select Sutra", df_sutras['name'].tolist())
-    desc = df_sutras[df_sutras['name'] == sutra_select]['desc'].values[0]
-    example = df_sutras[df_sutras['name'] == sutra_select]['example'].values[0]
-    st.write(f"Description: {desc}")
-    st.write(f"Example: {example}")
-    col1, col2 = st.columns(2)
-    with col1:
-        if "Multiply" in sutra_select or "Nikhilam" in sutra_select:
-            a = st.number_input("A", value=8)
-            b = st.number_input("B", value=9)
-            if st.button("Calculate"):
-                result = vedic_multiply(a, b)
-                st.success(f"Result: {result}")
-        elif "Square" in sutra_select or "Ekadhikena" in sutra_select:
-            n = st.number_input("N", value=15)
-            if st.button("Calculate"):
-                result = vedic_square(n)
-                st.success(f"Result: {result}")
-        elif "Yaavadunam" in sutra_select:
-            n = st.number_input("N", value=15)
-            base = st.number_input("Base", value=10)
-            if st.button("Calculate"):
-                result = yaavadunam_square(n, base)
-                st.success(f"Result: {result}")
-        elif "Divide" in sutra_select or "Paraavartya" in sutra_select:
-            dividend = st.number_input("Dividend", value=10)
-            divisor = st.number_input("Divisor", value=2)
-            if st.button("Calculate"):
-                result = vedic_divide(dividend, divisor)
-                st.success(result)
-        elif "Add" in sutra_select or "Sankalana" in sutra_select:
-            nums = st.text_input("Numbers (comma sep)", "1,2,3")
-            if st.button("Calculate"):
-                numbers = [int(x) for x in nums.split(",")]
-                result = vedic_add(numbers)
-                st.success(f"Sum: {result}")
-        elif "Shunyam" in sutra_select:
-            coeffs = st.text_input("Coeffs (comma sep a,b,c,d)", "1,2,1,2")
-            if st.button("Calculate"):
-                coeffs_list = [int(x) for x in coeffs.split(",")]
-                result = shunyam_equation(coeffs_list)
-                st.success(f"Result: {result}")
-        elif "Anurupye" in sutra_select:
-            a = st.number_input("A", value=2)
-            b = st.number_input("B", value=0)
-            ratio = st.number_input("Ratio", value=3)
-            if st.button("Calculate"):
-                result = anurupye_proportion(a, b, ratio)
-                st.success(f"Result: {result}")
-        elif "Purana" in sutra_select:
-            num = st.number_input("Numerator", value=1)
-            den = st.number_input("Denominator", value=2)
-            if st.button("Calculate"):
-                result = purana_fraction(num, den)
-                st.success(f"Result: {result}")
-        elif "Chalana" in sutra_select:
-            a = st.number_input("A", value=5)
-            b = st.number_input("B", value=3)
-            if st.button("Calculate"):
-                result = chalana_diff(a, b)
-                st.success(f"Result: {result}")
-        elif "Vyashti" in sutra_select:
-            dividend = st.number_input("Dividend", value=10)
-            divisor = st.number_input("Divisor", value=2)
-            if st.button("Calculate"):
-                result = vyashti_div(dividend, divisor)
-                st.success(f"Result: {result}")
-        elif "Sheshanyankena" in sutra_select:
-            n = st.number_input("N", value=10)
-            d = st.number_input("D", value=3)
-            if st.button("Calculate"):
-                result = sheshanyankena_remainder(n, d)
-                st.success(f"Remainder: {result}")
-        elif "Sopaantyadvayam" in sutra_select:
-            n = st.number_input("N", value=22)
-            if st.button("Calculate"):
-                result = sopaantyadvayam_div_by_11(n)
-                st.success(f"Divisible by 11: {result}")
-        elif "Ekanyunena" in sutra_select:
-            n = st.number_input("N", value=10)
-            if st.button("Calculate"):
-                result = ekanyunena_mult_by_9(n)
-                st.success(f"Result: {result}")
-        elif "Gunitasamuchyah" in sutra_select:
-            a = st.number_input("A", value=2)
-            b = st.number_input("B", value=3)
-            c = st.number_input("C", value=4)
-            if st.button("Calculate"):
-                result = gunita_product_sum(a, b, c)
-                st.success(f"Equal: {result}")
-        elif "Gunakasamuchyah" in sutra_select:
-            a = st.number_input("A", value=2)
-            b = st.number_input("B", value=3)
-            c = st.number_input("Sum", value=5)
-            if st.button("Calculate"):
-                result = gunaka_factor_sum(a, b, c)
-                st.success(f"True: {result}")
-    with col2:
-        st.write("Example: ...")  # Add from search
-    st.code("""
-# Example in Śabdāstra
-ch vedic_multiply(8, 9)
-""")
-
-if page == "Tantric Geometry":
-    st.header("Explore Tantric Geometry 🌀🕉️")
-    st.write("""
-    Code to draw sacred yantras like Sri Yantra using Matplotlib.
-    """)
-    if st.button("Draw Sri Yantra"):
-        draw_sri_yantra()
-
-if page == "Panini Grammar":
-    st.header("Explore Panini Grammar 📜🕉️")
-    st.write("""
-    Panini's Ashtadhyayi with sutras, sandhi rules, quiz.
-    """)
-    tab1, tab2, tab3 = st.tabs(["Sutras", "Sandhi Rules", "Quiz"])
-    with tab1:
-        df_panini = pd.DataFrame(PANINI_CONCEPTS)
-        st.dataframe(df_panini)
-    with tab2:
-        for rule in SANDHI_RULES:
-            st.write(rule)
-    with tab3:
-        questions = [
-            {"q": "What is sutra 6.1.77 for?", "options": ["Vowel sandhi", "Verb endings"], "ans": "Vowel sandhi"},
-            # Add more
-        ]
-        score = 0
-        for q in questions:
-            ans = st.radio(q["q"], q["options"])
-            if ans == q["ans"]:
-                score += 1
-        if st.button("Submit"):
-            st.write(f"Score: {score}/{len(questions)}")
-
-if page == "Sanskrit Linguistics":
-    st.header("Explore Sanskrit Linguistics 🗣️🕉️")
-    st.write("""
-    Key concepts in Sanskrit linguistics, Vyakarana, Panini.
-    """)
-    df_ling = pd.DataFrame(SANSKRIT_LINGUISTICS)
-    st.dataframe(df_ling)
-    st.write("Overview: Sanskrit linguistics centers on Vyakarana, the science of grammar, pioneered by Panini in Ashtadhyayi. It includes phonetics, morphology, syntax, semantics. Key: sphota theory, eternal words (nitya), pratyaharas, etc.")
+page = st.sidebar.radio("Navigate", visible_pages(st.query_params.get("admin")))
 
-if page == "Deploy":
-    st.markdown("""
-    ## Deploy Instructions
-    1. Copy this app.py to GitHub
-    2. Add requirements.txt: streamlit pandas graphviz matplotlib numpy
-    3. `streamlit run app.py`
-    4. Deploy via Streamlit Community Cloud
-    """)
+# Only the selected page (and its heavy imports) is loaded on this rerun
+load_page(page).render()
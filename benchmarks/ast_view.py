@@ -0,0 +1,91 @@
+"""
+AST render time against node count: full graph vs level-of-detail view.
+
+For each size a synthetic AST is built and timed for
+  full   - every node in one DOT graph (what the Playground used to draw)
+  lod    - AstView indexing + the budgeted DOT (cold)
+  expand - one more subtree expanded on the same view (warm fragment cache)
+and, when Graphviz's `dot` binary is on PATH, the SVG layout time of both graphs.
+
+    python benchmarks/ast_view.py
+    python benchmarks/ast_view.py --sizes 100 1000 10000 100000 --no-layout
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.astview import AstView  # noqa: E402
+
+
+def synthetic_ast(n_nodes: int, width: int = 4) -> List[dict]:
+    """A program of nested if/for blocks with roughly n_nodes nodes."""
+    def block(budget: int, depth: int) -> List[dict]:
+        out = []
+        while budget > 0:
+            if budget == 1 or depth > 6:
+                out.append({"type": "print", "value": "i"})
+                budget -= 1
+            else:
+                share = min(budget - 1, max(1, (budget - 1) // width))
+                kind = "if" if depth % 2 else "for"
+                node = {"type": kind, "body": block(share, depth + 1)}
+                if kind == "if":
+                    node.update(test="i", orelse=[])
+                else:
+                    node.update(var="i", iter="3")
+                out.append(node)
+                budget -= share + 1
+        return out
+    return block(n_nodes - 1, 0)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def layout_ms(dot_src: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(["dot", "-Tsvg"], input=dot_src.encode(), capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    ap.add_argument("--no-layout", action="store_true", help="skip `dot -Tsvg` even if available")
+    args = ap.parse_args(argv)
+
+    do_layout = not args.no_layout and shutil.which("dot") is not None
+    header = f"{'nodes':>8} {'full ms':>9} {'lod ms':>8} {'expand ms':>10} {'shown':>6}"
+    if do_layout:
+        header += f" {'full layout':>12} {'lod layout':>11}"
+    print(header)
+    for size in args.sizes:
+        ast = synthetic_ast(size)
+        full_dot, full_ms = timed(lambda: AstView(ast).full_dot())
+        view, index_ms = timed(AstView, ast)
+        lod_dot, dot_ms = timed(view.to_dot)
+        options = view.expandable()
+        expanded = {options[0][0]} if options else set()
+        _, expand_ms = timed(view.to_dot, expanded)
+        row = (f"{view.total_nodes:>8} {full_ms:>9.2f} {index_ms + dot_ms:>8.2f} {expand_ms:>10.2f} "
+               f"{view.visible_nodes():>6}")
+        if do_layout:
+            row += f" {layout_ms(full_dot):>12.1f} {layout_ms(lod_dot):>11.1f}"
+        print(row)
+    if not do_layout:
+        print("(layout times skipped: Graphviz `dot` not on PATH)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
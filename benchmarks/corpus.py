@@ -0,0 +1,143 @@
+"""
+Synthetic Śabdāstra programs for the toolchain benchmarks.
+
+generate_program() emits a program of roughly --lines lines, shaped by the
+maximum block nesting, the yugma loop bound and the statement mix. Programs
+only use constructs the transpiler and the VM both define, so they can be
+run through both and compared: a fixed pool of variables is assigned up
+front (no name is ever undefined), kar definitions are never called, and
+divisors are non-zero literals. Loops run at least once, so a loop variable
+may also be read after its loop (it keeps its last value). Operands may be
+negated with unary minus. Assignments grow values additively, so long loops
+stay in small integers/floats.
+
+    python benchmarks/corpus.py --lines 50 --seed 3
+    python benchmarks/corpus.py --lines 1000000 --mix kar=1,yadi=3,yugma=1,bhava=1 > big.sab
+"""
+
+import argparse
+import random
+import sys
+from typing import Dict, List, Optional
+
+POOL = [f"v{i}" for i in range(8)]
+BHAVAS = ["vira", "shanta", "karuna", "raudra"]
+DEFAULT_MIX = {"assign": 4, "ch": 2, "yadi": 2, "yugma": 1, "kar": 1, "bhava": 1}
+COMPOUND = {"yadi", "yugma", "kar", "bhava"}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """"kar=1,yadi=2" -> weights, on top of DEFAULT_MIX."""
+    mix = dict(DEFAULT_MIX)
+    for part in filter(None, spec.split(",")):
+        key, _, weight = part.partition("=")
+        if key.strip() not in DEFAULT_MIX:
+            raise ValueError(f"Unknown statement kind: {key}")
+        mix[key.strip()] = float(weight)
+    return mix
+
+
+class _Generator:
+    def __init__(self, rng: random.Random, depth: int, loops: int, mix: Dict[str, float]):
+        self.rng = rng
+        self.depth = depth
+        self.loops = loops
+        self.kinds = list(mix)
+        self.weights = [mix[k] for k in self.kinds]
+        self.out: List[str] = []
+
+    def operand(self, scope: List[str]) -> str:
+        r = self.rng.random()
+        if r < 0.4 and scope:
+            value = self.rng.choice(scope)
+        elif r < 0.75:
+            value = self.rng.choice(POOL)
+        else:
+            value = str(self.rng.randint(0, 9))
+        return "-" + value if self.rng.random() < 0.1 else value
+
+    def expr(self, scope: List[str]) -> str:
+        # pool/loop var plus literal-scaled terms: additive growth only
+        parts = [self.operand(scope)]
+        for _ in range(self.rng.randint(0, 2)):
+            op = self.rng.choice(["+", "-", "+", "*", "/"])
+            if op == "*" and parts[-1].split()[-1].lstrip("-") in POOL:
+                op = "+"  # v * c inside a loop would grow geometrically
+            if op in "*/":
+                parts.append(f"{op} {self.rng.randint(1, 5)}")
+            else:
+                term = self.operand(scope)
+                if term.lstrip("-") in POOL:  # keep pool values from compounding
+                    term = self.rng.choice(scope) if scope else str(self.rng.randint(1, 9))
+                parts.append(f"{op} {term}")
+        return " ".join(parts)
+
+    def test(self, scope: List[str]) -> str:
+        return f"{self.operand(scope)} {self.rng.choice(['<', '>', '==', '!='])} {self.rng.randint(-3, 9)}"
+
+    def block(self, level: int, scope: List[str], budget: int) -> None:
+        # at least one statement, so every header has a body
+        start = len(self.out)
+        while True:
+            self.statement(level, scope, max(budget - (len(self.out) - start), 1))
+            if len(self.out) - start >= budget or self.rng.random() < 0.3:
+                break
+
+    def statement(self, level: int, scope: List[str], budget: int) -> None:
+        pad = "    " * level
+        kind = self.rng.choices(self.kinds, self.weights)[0]
+        if kind in COMPOUND and (level >= self.depth or budget < 2):
+            kind = "assign"
+        body = min(budget - 1, self.rng.randint(1, 6))
+        if kind == "assign":
+            self.out.append(f"{pad}{self.rng.choice(POOL)} = {self.expr(scope)}")
+        elif kind == "ch":
+            r = self.rng.random()
+            value = f"'{self.rng.choice(BHAVAS)}'" if r < 0.2 else self.test(scope) if r < 0.35 else self.expr(scope)
+            self.out.append(f"{pad}ch {value}")
+        elif kind == "yadi":
+            self.out.append(f"{pad}yadi {self.test(scope)}:")
+            self.block(level + 1, scope, body)
+            if self.rng.random() < 0.5:
+                self.out.append(f"{pad}anya:")
+                self.block(level + 1, scope, body)
+        elif kind == "yugma":
+            var = f"i{level}"
+            self.out.append(f"{pad}yugma {var} in {self.rng.randint(1, self.loops)}:")
+            self.block(level + 1, scope + [var], body)
+            if self.rng.random() < 0.3:
+                self.out.append(f"{pad}ch {var}")  # its last value, as in Python
+        elif kind == "kar":
+            args = [f"a{j}" for j in range(self.rng.randint(0, 2))]
+            self.out.append(f"{pad}kar f{len(self.out)}({', '.join(args)}):")
+            self.block(level + 1, scope + args, body)
+        elif kind == "bhava":
+            self.out.append(f"{pad}bhava {self.rng.choice(BHAVAS)}:")
+            self.block(level + 1, scope, body)
+
+
+def generate_program(lines: int = 100, depth: int = 3, loops: int = 3,
+                     mix: Optional[Dict[str, float]] = None, seed: int = 0) -> str:
+    """A program of about `lines` lines (never fewer than the variable pool)."""
+    gen = _Generator(random.Random(seed), depth, loops, mix or DEFAULT_MIX)
+    gen.out = [f"{v} = {i + 1}" for i, v in enumerate(POOL)]
+    while len(gen.out) < lines:
+        gen.statement(0, [], lines - len(gen.out))
+    gen.out.append(f"ch {' + '.join(POOL)}")
+    return "\n".join(gen.out) + "\n"
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--lines", type=int, default=100)
+    ap.add_argument("--depth", type=int, default=3, help="maximum block nesting")
+    ap.add_argument("--loops", type=int, default=3, help="upper bound of each yugma range")
+    ap.add_argument("--mix", default="", help="statement weights, e.g. kar=1,yadi=2,yugma=1,bhava=1")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    sys.stdout.write(generate_program(args.lines, args.depth, args.loops, parse_mix(args.mix), args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
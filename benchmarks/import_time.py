@@ -0,0 +1,74 @@
+"""
+Import-time budget for the Śabdāstra core and page modules.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter,
+takes the best cumulative time over a few runs and fails (exit code 1)
+when a module goes over its budget or pulls in a heavy UI/plotting
+dependency it should not need.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 10 --scale 1.5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = {"streamlit", "pandas", "graphviz", "matplotlib", "numpy"}
+
+# module -> (budget in ms, heavy modules it is allowed to load)
+BUDGETS: Dict[str, Tuple[float, Set[str]]] = {
+    "sabdastra": (5.0, set()),
+    "sabdastra.hash": (10.0, set()),
+    "sabdastra.lexer": (15.0, set()),
+    "sabdastra.parser": (10.0, set()),
+    "sabdastra.transpiler": (10.0, set()),
+    "sabdastra.vm": (15.0, set()),
+    "sabdastra.vedic": (10.0, set()),
+    "views": (10.0, set()),
+}
+
+
+def measure(module: str) -> Tuple[float, Set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative_us = 0
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, loaded
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5, help="fresh interpreters per module (best time is kept)")
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. on slow CI hosts")
+    args = ap.parse_args(argv)
+
+    failed = False
+    for module, (budget_ms, allowed) in BUDGETS.items():
+        runs = [measure(module) for _ in range(args.runs)]
+        best_ms = min(ms for ms, _ in runs)
+        heavy = (runs[0][1] & HEAVY) - allowed
+        limit = budget_ms * args.scale
+        ok = best_ms <= limit and not heavy
+        failed |= not ok
+        note = f" pulls in {', '.join(sorted(heavy))}" if heavy else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<22} {best_ms:8.2f} ms  (budget {limit:.1f} ms){note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Bhāva lexicon load and query latency on a synthetic phoneme table.
+
+Writes a .sblx file with --entries random phoneme strings, then times the
+lazy open, the first query (mmap + dictionary decode) and prefix, exact,
+fuzzy and contains searches, reporting the median of --repeat runs.
+
+    python benchmarks/lexicon.py
+    python benchmarks/lexicon.py --entries 500000 --keep lexicon.sblx
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.hash import MAHESHWARA_ORDER  # noqa: E402
+from sabdastra.bhava import BHAVA_TABLE  # noqa: E402
+from sabdastra.lexicon import Lexicon, write_lexicon  # noqa: E402
+
+CONSONANTS = ["k", "kh", "g", "gh", "c", "j", "t", "d", "n", "p", "b", "m", "y", "r", "l", "v", "sh", "s", "h"]
+
+
+def synthetic_rows(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    vowels = MAHESHWARA_ORDER[:9]
+    seen = set()
+    while len(seen) < n:
+        word = "".join(rng.choice(CONSONANTS) + rng.choice(vowels) for _ in range(rng.randint(1, 4)))
+        if word in seen:
+            continue
+        seen.add(word)
+        tag = rng.choice(BHAVA_TABLE)
+        yield {"phoneme": word, "bhava": tag["bhava"], "chakra": tag["chakra"], "rasa": tag["rasa"]}
+
+
+def median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--entries", type=int, default=300000)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--keep", help="write the lexicon here instead of a temp file")
+    args = ap.parse_args(argv)
+
+    path = args.keep or os.path.join(tempfile.mkdtemp(), "lexicon.sblx")
+    start = time.perf_counter()
+    write_lexicon(path, synthetic_rows(args.entries))
+    print(f"write {args.entries} entries   {(time.perf_counter() - start) * 1000:9.1f} ms  "
+          f"({os.path.getsize(path) / 1e6:.1f} MB)")
+
+    start = time.perf_counter()
+    lex = Lexicon(path)
+    print(f"open (lazy)                {(time.perf_counter() - start) * 1000:9.3f} ms")
+    start = time.perf_counter()
+    first = lex.search("ka")
+    print(f"first query (load)         {(time.perf_counter() - start) * 1000:9.1f} ms  ({first.total} hits)")
+
+    queries = [
+        ("prefix 'ka'", lambda: lex.search("ka")),
+        ("prefix 'ki' page 5", lambda: lex.search("ki", page=5)),
+        ("exact 'mira'", lambda: lex.search("mira", mode="exact")),
+        ("fuzzy 'kamala' d<=1", lambda: lex.search("kamala", mode="fuzzy", max_distance=1)),
+        ("fuzzy 'kamala' d<=2", lambda: lex.search("kamala", mode="fuzzy", max_distance=2)),
+        ("bhava exact 'Vira'", lambda: lex.search("Vira", field="bhava", mode="exact", page=100)),
+        ("contains 'shau'", lambda: lex.search("shau", mode="contains")),
+    ]
+    for name, fn in queries:
+        print(f"{name:<26} {median_ms(fn, args.repeat):9.3f} ms  ({fn().total} hits)")
+    lex.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
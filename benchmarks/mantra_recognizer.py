@@ -0,0 +1,78 @@
+"""
+Mantra recognizer throughput on multi-megabyte transcripts.
+
+Registers --mantras synthetic mantras (plus the built-in ones), builds the
+automaton, then scans a --megabytes transcript of random syllables with
+known mantras spliced in, reporting MB/s, phonemes/s and matches found.
+
+    python benchmarks/mantra_recognizer.py
+    python benchmarks/mantra_recognizer.py --mantras 20000 --megabytes 16
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.mantras import chant_to_ast, mantra_texts  # noqa: E402
+from sabdastra.recognizer import MantraRegistry, phonemes  # noqa: E402
+
+SYLLABLES = [c + v for c in ["", "k", "g", "t", "d", "n", "p", "b", "m", "y", "r", "v", "sh", "s", "h"]
+             for v in ["a", "i", "u", "e", "o", "ai", "au"]]
+
+
+def synthetic_mantra(rng: random.Random) -> str:
+    return " ".join("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+                    for _ in range(rng.randint(3, 6)))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--mantras", type=int, default=5000)
+    ap.add_argument("--megabytes", type=float, default=4.0)
+    ap.add_argument("--density", type=float, default=0.02, help="share of chunks that are a known mantra")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    registry = MantraRegistry()
+    for name, factory in chant_to_ast.items():
+        registry.register(name, mantra_texts.get(name, [name]), factory)
+    texts = [synthetic_mantra(rng) for _ in range(args.mantras)]
+    for i, text in enumerate(texts):
+        registry.register(f"m{i}", [text], chant_to_ast["gayatri"])
+
+    start = time.perf_counter()
+    registry.recognize("")
+    print(f"build automaton: {len(registry)} patterns in {time.perf_counter() - start:.2f} s")
+
+    target = int(args.megabytes * 1_000_000)
+    chunks, size = [], 0
+    while size < target:
+        chunk = rng.choice(texts) if rng.random() < args.density else \
+            " ".join(rng.choice(SYLLABLES) for _ in range(8))
+        chunks.append(chunk)
+        size += len(chunk) + 1
+    transcript = "\n".join(chunks)
+    n_phonemes = len(phonemes(transcript))
+
+    start = time.perf_counter()
+    matches = registry.recognize(transcript)
+    elapsed = time.perf_counter() - start
+    print(f"scan {len(transcript) / 1e6:.1f} MB ({n_phonemes:,} phonemes): {elapsed:.2f} s, "
+          f"{len(transcript) / 1e6 / elapsed:.2f} MB/s, {n_phonemes / elapsed:,.0f} phonemes/s, "
+          f"{len(matches):,} matches")
+
+    start = time.perf_counter()
+    for m in matches[:10000]:
+        registry.run(m.name)
+    dispatched = min(len(matches), 10000)
+    print(f"dispatch {dispatched:,} matches to cached bytecode: {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Pratyāhāra membership: bitset vs list vs set.
+
+Times `phoneme in ac-class` over a random IAST phoneme stream three ways
+(list.__contains__, set.__contains__, id lookup + bit test), a membership
+check against a precomputed union of several pratyāhāras, and whole-string
+classification with classify().
+
+    python benchmarks/pratyahara.py
+    python benchmarks/pratyahara.py --phonemes 5000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.pratyahara import PHONEME_ID, PHONEMES, bits, classify, union  # noqa: E402
+
+MISSING = len(PHONEMES)   # id with no bit in any mask
+
+
+def spellings(mask: int):
+    # every accepted spelling (long vowels, ASCII aliases) so all three agree
+    return [p for p, i in PHONEME_ID.items() if mask >> i & 1]
+
+
+def timed(label: str, fn, n: int) -> float:
+    start = time.perf_counter()
+    hits = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:8.1f} ms  {n / elapsed:>14,.0f} checks/s  ({hits:,} hits)")
+    return elapsed
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--phonemes", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    inventory = sorted(PHONEME_ID) + ["ṃ", "ḥ", " "]
+    stream = [rng.choice(inventory) for _ in range(args.phonemes)]
+    n = len(stream)
+
+    for name in ("ac", "hal", "yaṇ"):
+        mask = bits(name)
+        as_list = spellings(mask)
+        as_set = set(as_list)
+        ids = PHONEME_ID
+        print(f"-- {name} ({len(as_list)} spellings)")
+        timed("list", lambda: sum(1 for p in stream if p in as_list), n)
+        timed("set", lambda: sum(1 for p in stream if p in as_set), n)
+        timed("bitset", lambda: sum(1 for p in stream if mask >> ids.get(p, MISSING) & 1), n)
+
+    # several classes at once: one mask vs a chain of set lookups
+    names = ("ik", "ec", "jhaś", "khay")
+    sets = [set(spellings(bits(x))) for x in names]
+    mask = union(*names)
+    print(f"-- any of {', '.join(names)}")
+    timed("sets (chained)", lambda: sum(1 for p in stream if any(p in s for s in sets)), n)
+    timed("bitset (union)", lambda: sum(1 for p in stream if mask >> PHONEME_ID.get(p, MISSING) & 1), n)
+
+    text = "".join(stream)
+    start = time.perf_counter()
+    labels = classify(text, ("ac", "haś", "khar"))
+    elapsed = time.perf_counter() - start
+    print(f"classify {len(text) / 1e6:.1f} MB into ac/haś/khar: {elapsed:.2f} s, "
+          f"{len(labels) / elapsed:,.0f} phonemes/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
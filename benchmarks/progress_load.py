@@ -0,0 +1,116 @@
+"""
+Load test for the SQLite progress store under contention.
+
+Starts --replicas processes (each with its own store, like several app
+processes on one host), each running --threads session threads. Every simulated
+rerun reads one of --learners learners' bitmaps and, with probability
+--write-ratio, marks a level complete. Reports read, write (enqueue) and
+flush (durable commit) latency percentiles across all replicas.
+
+    python benchmarks/progress_load.py
+    python benchmarks/progress_load.py --replicas 4 --threads 32 --learners 5000 --ops 2000
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.progress import SQLiteProgressStore, levels_from_bitmap  # noqa: E402
+
+LEVELS = 9
+
+
+def replica(args, replica_id, results):
+    store = SQLiteProgressStore(args.db)
+    reads, writes, flushes = [], [], []
+    lock = threading.Lock()
+
+    def session(seed):
+        rng = random.Random(seed)
+        r, w = [], []
+        for _ in range(args.ops):
+            learner = f"learner-{rng.randrange(args.learners)}"
+            start = time.perf_counter()
+            bitmap = store.completed(learner)
+            r.append(time.perf_counter() - start)
+            if rng.random() < args.write_ratio:
+                done = levels_from_bitmap(bitmap)
+                level = (max(done) + 1) if done else 1
+                start = time.perf_counter()
+                store.mark_complete(learner, min(level, LEVELS))
+                w.append(time.perf_counter() - start)
+        with lock:
+            reads.extend(r)
+            writes.extend(w)
+
+    threads = [threading.Thread(target=session, args=(replica_id * 1000 + i,)) for i in range(args.threads)]
+    for t in threads:
+        t.start()
+    # time to durability for a write issued while the sessions are running
+    while any(t.is_alive() for t in threads):
+        store.mark_complete(f"probe-{replica_id}", 1)
+        start = time.perf_counter()
+        store.flush()
+        flushes.append(time.perf_counter() - start)
+        time.sleep(0.01)
+    for t in threads:
+        t.join()
+    store.close()
+    results.put((reads, writes, flushes, store.stats))
+
+
+def pct(samples, q):
+    if not samples:
+        return float("nan")
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--replicas", type=int, default=2)
+    ap.add_argument("--threads", type=int, default=16, help="concurrent sessions per replica")
+    ap.add_argument("--learners", type=int, default=2000)
+    ap.add_argument("--ops", type=int, default=1000, help="reruns per session")
+    ap.add_argument("--write-ratio", type=float, default=0.2)
+    ap.add_argument("--db", help="database path (default: a temp file)")
+    args = ap.parse_args(argv)
+    args.db = args.db or os.path.join(tempfile.mkdtemp(), "progress.db")
+
+    results = multiprocessing.Queue()
+    start = time.perf_counter()
+    procs = [multiprocessing.Process(target=replica, args=(args, i, results)) for i in range(args.replicas)]
+    for p in procs:
+        p.start()
+    collected = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - start
+
+    reads = [x for r in collected for x in r[0]]
+    writes = [x for r in collected for x in r[1]]
+    flushes = [x for r in collected for x in r[2]]
+    hits = sum(r[3]["cache_hits"] for r in collected)
+    batches = sum(r[3]["batches"] for r in collected)
+    rows = sum(r[3]["rows_written"] for r in collected)
+    print(f"{args.replicas} replicas x {args.threads} sessions, {args.learners} learners, "
+          f"{len(reads) + len(writes)} ops in {elapsed:.2f} s ({(len(reads) + len(writes)) / elapsed:,.0f} ops/s)")
+    print(f"{'':<8} {'count':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, samples in (("read", reads), ("write", writes), ("flush", flushes)):
+        print(f"{name:<8} {len(samples):>8} {pct(samples, .5):>9.3f} {pct(samples, .95):>9.3f} "
+              f"{pct(samples, .99):>9.3f} {(max(samples) * 1000 if samples else float('nan')):>9.3f}")
+    print(f"cache hit rate {hits / max(len(reads), 1):.1%}, {rows} rows in {batches} batches "
+          f"({rows / max(batches, 1):.1f} rows/commit), mean read {statistics.mean(reads) * 1e6:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
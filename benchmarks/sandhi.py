@@ -0,0 +1,68 @@
+"""
+Sandhi engine throughput in words per second.
+
+Builds a synthetic IAST corpus of --lines lines of 2-6 '+'-separated words
+drawn from a --vocab word vocabulary, then times join_stream over it and
+split() over a sample of the joined compounds (with and without a known
+vocabulary), and reports the junction memo hit rate.
+
+    python benchmarks/sandhi.py
+    python benchmarks/sandhi.py --lines 500000 --vocab 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.sandhi import CONSONANTS, VOWELS, SandhiEngine  # noqa: E402
+
+
+def vocabulary(n: int, rng: random.Random):
+    words = set()
+    while len(words) < n:
+        syllables = [rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.4:
+            syllables.insert(0, rng.choice(VOWELS))
+        ending = rng.choice(["", "", "m", "ḥ", "t"])
+        words.add("".join(syllables) + ending)
+    return sorted(words)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--lines", type=int, default=100000)
+    ap.add_argument("--vocab", type=int, default=5000)
+    ap.add_argument("--splits", type=int, default=20000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    vocab = vocabulary(args.vocab, rng)
+    corpus = [" + ".join(rng.choice(vocab) for _ in range(rng.randint(2, 6))) for _ in range(args.lines)]
+    n_words = sum(line.count("+") + 1 for line in corpus)
+
+    engine = SandhiEngine()
+    start = time.perf_counter()
+    joined = list(engine.join_stream(corpus))
+    elapsed = time.perf_counter() - start
+    info = engine.junction.cache_info()
+    print(f"join   {n_words:>9,} words in {elapsed:6.2f} s  {n_words / elapsed:>12,.0f} words/s  "
+          f"(junction memo hit rate {info.hits / max(info.hits + info.misses, 1):.1%}, {info.currsize} entries)")
+
+    compounds = [w for line in joined[:args.splits] for w in line.split() if len(w) > 3][:args.splits]
+    known = set(vocab)
+    for label, vocab_filter in (("split", None), ("split+vocab", known)):
+        start = time.perf_counter()
+        candidates = sum(len(c) for _, c in engine.split_stream(compounds, vocab_filter))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<12} {len(compounds):>6,} words in {elapsed:6.2f} s  {len(compounds) / elapsed:>12,.0f} words/s  "
+              f"({candidates / max(len(compounds), 1):.1f} candidates/word)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
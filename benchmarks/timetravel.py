@@ -0,0 +1,98 @@
+"""
+Time-travel recording: overhead, memory per million instructions, seek cost.
+
+Runs a nested-loop program (about --instructions VM instructions) with
+plain execute_bytecode and with record_execution, then reports the
+recording slowdown, bytes per instruction (Recording.nbytes and tracemalloc
+peak), the naive alternative of copying env and stack after every
+instruction (measured on the first --naive-steps steps and scaled), and the
+latency of random seeks and single forward/back steps.
+
+    python benchmarks/timetravel.py
+    python benchmarks/timetravel.py --instructions 5000000 --checkpoint-every 4096
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra.lexer import tokenize  # noqa: E402
+from sabdastra.parser import parse  # noqa: E402
+from sabdastra.timetravel import Cursor, record_execution  # noqa: E402
+from sabdastra.vm import compile_to_bytecode, execute_bytecode  # noqa: E402
+
+PROGRAM = """total = 0
+yugma i in {outer}:
+    yugma j in 100:
+        total = total + i * j - 3
+        yadi j == 50:
+            ch total
+ch total
+"""
+
+
+def compiled(outer: int):
+    bytecode, constants = compile_to_bytecode(parse(tokenize(PROGRAM.format(outer=outer))))
+    return bytecode, {v: k for k, v in constants.items()}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--instructions", type=int, default=1_000_000)
+    ap.add_argument("--checkpoint-every", type=int, default=1024)
+    ap.add_argument("--naive-steps", type=int, default=200_000)
+    ap.add_argument("--seeks", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    # instructions per outer iteration, from two short runs
+    per_outer = len(record_execution(*compiled(2))) - len(record_execution(*compiled(1)))
+    bytecode, constants = compiled(max(1, args.instructions // per_outer))
+
+    plain_out, plain = timed(lambda: execute_bytecode(bytecode, constants))
+    rec, recorded = timed(lambda: record_execution(bytecode, constants, checkpoint_every=args.checkpoint_every))
+    assert rec.output == plain_out, "recorded run printed something else"
+    n = len(rec)
+    print(f"{n:,} instructions: plain {plain:.2f} s, recording {recorded:.2f} s ({recorded / plain:.2f}x)")
+
+    tracemalloc.start()
+    record_execution(bytecode, constants, checkpoint_every=args.checkpoint_every)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"memory: {rec.nbytes() / n:.1f} B/instruction by nbytes(), traced peak {peak / n:.1f} B/instruction "
+          f"(= MB per million); {len(rec.checkpoints)} checkpoints, {len(rec.values):,} distinct values")
+
+    steps = min(args.naive_steps, n)
+    _, naive_time = timed(lambda: record_execution(bytecode, constants, checkpoint_every=1, max_steps=steps))
+    tracemalloc.start()
+    record_execution(bytecode, constants, checkpoint_every=1, max_steps=steps)
+    naive_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"naive per-instruction snapshots ({steps:,} steps): {naive_time / steps * 1e6:.2f} µs and "
+          f"{naive_peak / steps:.0f} B per instruction")
+
+    rng = random.Random(args.seed)
+    targets = [rng.randint(0, n) for _ in range(args.seeks)]
+    _, seek = timed(lambda: [rec.state(t) for t in targets])
+    cursor = Cursor(rec)
+    cursor.seek(n // 2)
+    _, fwd = timed(lambda: [cursor.forward() for _ in range(args.seeks)])
+    _, back = timed(lambda: [cursor.back() for _ in range(args.seeks)])
+    print(f"random seek {seek / args.seeks * 1e6:.0f} µs, step forward {fwd / args.seeks * 1e6:.2f} µs, "
+          f"step back {back / args.seeks * 1e6:.2f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
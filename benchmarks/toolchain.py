@@ -0,0 +1,203 @@
+"""
+Throughput, memory and regression baselines for the Śabdāstra toolchain.
+
+For each program size in --sizes (lines; generated by corpus.py with the
+given --depth/--loops/--mix), measures tokenize, Parser.parse,
+transpile_ast, compile_to_bytecode, execute_bytecode and maheshwara_hash:
+best-of---repeat wall time, lines/s (chars/s for the hash, which runs over
+the first --hash-chars characters) and peak traced allocation per stage.
+
+Results can be saved as a JSON baseline and compared against one; any
+stage/size slower or larger than baseline * (1 + --threshold) is reported
+and the exit status is 1. Baselines are per machine: save one on the
+machine that will compare against it.
+
+A differential check runs --diff-programs small random programs plus the
+benchmark programs of at most --diff-max-lines lines (CPython's own compile()
+of a million-line module takes minutes) through the transpiler (exec) and
+the VM, and fails if their printed output differs.
+
+    python benchmarks/toolchain.py
+    python benchmarks/toolchain.py --sizes 10,1000,100000,1000000 --save benchmarks/baseline.json
+    python benchmarks/toolchain.py --baseline benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import generate_program, parse_mix  # noqa: E402
+from sabdastra.hash import maheshwara_hash  # noqa: E402
+from sabdastra.lexer import tokenize  # noqa: E402
+from sabdastra.parser import Parser  # noqa: E402
+from sabdastra.transpiler import transpile_ast  # noqa: E402
+from sabdastra.vm import compile_to_bytecode, execute_bytecode  # noqa: E402
+
+STAGES = ["tokenize", "parse", "transpile", "compile", "execute", "hash"]
+# baseline values below these are timer/allocator noise and are not compared
+NOISE_FLOOR = {"seconds": 0.001, "peak_mb": 0.1}
+
+
+def pipeline(src: str, hash_chars: int) -> List[Tuple[str, Callable[[], object]]]:
+    """(stage, thunk) pairs; each thunk stores its result for the next stage."""
+    state: Dict[str, object] = {}
+
+    def run(name, fn):
+        def thunk():
+            state[name] = fn()
+        return name, thunk
+
+    return [
+        run("tokenize", lambda: tokenize(src)),
+        run("parse", lambda: Parser(state["tokenize"]).parse()),
+        run("transpile", lambda: transpile_ast(state["parse"])),
+        run("compile", lambda: compile_to_bytecode(state["parse"])),
+        run("execute", lambda: execute_bytecode(state["compile"][0],
+                                                {v: k for k, v in state["compile"][1].items()})),
+        run("hash", lambda: maheshwara_hash(src[:hash_chars])),
+    ]
+
+
+def measure(src: str, repeat: int, hash_chars: int) -> Dict[str, dict]:
+    lines = src.count("\n")
+    results = {name: {"seconds": float("inf")} for name in STAGES}
+    for _ in range(repeat):
+        for name, thunk in pipeline(src, hash_chars):
+            start = time.perf_counter()
+            thunk()
+            results[name]["seconds"] = min(results[name]["seconds"], time.perf_counter() - start)
+    # separate pass: tracemalloc slows allocation-heavy code down
+    for name, thunk in pipeline(src, hash_chars):
+        tracemalloc.start()
+        thunk()
+        results[name]["peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    for name, r in results.items():
+        units = min(len(src), hash_chars) if name == "hash" else lines
+        r["per_second"] = units / r["seconds"] if r["seconds"] else float("inf")
+    return results
+
+
+# -----------------------------
+# Differential check
+# -----------------------------
+def run_transpiled(ast) -> List[str]:
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        exec(compile(transpile_ast(ast), "<transpiled>", "exec"), {})
+    return buf.getvalue().splitlines()
+
+
+def run_vm(ast) -> List[str]:
+    bytecode, constants = compile_to_bytecode(ast)
+    return execute_bytecode(bytecode, {v: k for k, v in constants.items()})
+
+
+def differential(programs: List[str]) -> List[str]:
+    """Descriptions of the programs whose transpiled and VM output differ."""
+    failures = []
+    for i, src in enumerate(programs):
+        ast = Parser(tokenize(src)).parse()
+        try:
+            expected = run_transpiled(ast)
+        except Exception as e:
+            failures.append(f"program {i}: transpiled code raised {e!r}")
+            continue
+        try:
+            got = run_vm(ast)
+        except Exception as e:
+            failures.append(f"program {i}: VM raised {e!r}")
+            continue
+        if got != expected:
+            at = next((j for j, (a, b) in enumerate(zip(expected, got)) if a != b), min(len(expected), len(got)))
+            failures.append(f"program {i}: first difference at output line {at} "
+                            f"(python {expected[at:at + 1]}, vm {got[at:at + 1]})")
+    return failures
+
+
+# -----------------------------
+# Baselines
+# -----------------------------
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    regressions = []
+    for size, stages in baseline.items():
+        for name, base in stages.items():
+            now = results.get(size, {}).get(name)
+            if now is None:
+                continue
+            for metric, floor in NOISE_FLOOR.items():
+                if base.get(metric, 0) >= floor and now[metric] > base[metric] * (1 + threshold):
+                    regressions.append(f"{name} @ {size} lines: {metric} {now[metric]:.4g} "
+                                       f"vs baseline {base[metric]:.4g} (+{now[metric] / base[metric] - 1:.0%})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="10,1000,100000", help="comma separated program sizes in lines")
+    ap.add_argument("--depth", type=int, default=3)
+    ap.add_argument("--loops", type=int, default=3)
+    ap.add_argument("--mix", default="", help="statement weights, e.g. kar=1,yadi=2,yugma=1,bhava=1")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--hash-chars", type=int, default=20000)
+    ap.add_argument("--diff-programs", type=int, default=200)
+    ap.add_argument("--diff-max-lines", type=int, default=100000)
+    ap.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    ap.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown/growth, 0.25 = 25%%")
+    args = ap.parse_args(argv)
+    mix = parse_mix(args.mix)
+
+    programs = {}
+    results: Dict[str, Dict[str, dict]] = {}
+    print(f"{'lines':>9} {'stage':<10} {'time':>10} {'throughput':>16} {'peak':>9}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        src = programs[size] = generate_program(size, args.depth, args.loops, mix, args.seed)
+        results[str(size)] = measure(src, args.repeat, args.hash_chars)
+        for name in STAGES:
+            r = results[str(size)][name]
+            unit = "chars/s" if name == "hash" else "lines/s"
+            print(f"{size:>9,} {name:<10} {r['seconds'] * 1000:8.2f}ms {r['per_second']:>10,.0f} {unit} "
+                  f"{r['peak_mb']:7.2f}MB")
+
+    small = [generate_program(20 + i % 60, args.depth, args.loops, mix, args.seed + 1000 + i)
+             for i in range(args.diff_programs)]
+    checked = small + [src for size, src in programs.items() if size <= args.diff_max_lines]
+    failures = differential(checked)
+    skipped = len(small) + len(programs) - len(checked)
+    print(f"differential: {len(checked) - len(failures)}/{len(checked)} programs agree"
+          + (f" ({skipped} larger than --diff-max-lines not checked)" if skipped else ""))
+    for failure in failures[:10]:
+        print("  " + failure)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f)["results"], args.threshold)
+        print(f"baseline: {len(regressions)} regression(s) past {args.threshold:.0%}")
+        for line in regressions:
+            print("  " + line)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.platform(),
+                "shape": {"depth": args.depth, "loops": args.loops, "mix": mix, "seed": args.seed},
+                "results": results,
+            }, f, indent=2)
+        print(f"saved baseline to {args.save}")
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
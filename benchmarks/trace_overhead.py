@@ -0,0 +1,73 @@
+"""
+Cost of the tracing layer on the instrumented pipeline.
+
+Times tokenize and maheshwara_hash on small inputs (where per-call overhead
+is most visible, best of 5 rounds) three ways: the undecorated function (__wrapped__), the
+decorated function with tracing off, and with tracing on; also an empty
+`with span(...)` block in both states.
+
+    python benchmarks/trace_overhead.py
+    python benchmarks/trace_overhead.py --calls 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sabdastra import trace  # noqa: E402
+from sabdastra.hash import maheshwara_hash  # noqa: E402
+from sabdastra.lexer import tokenize  # noqa: E402
+
+
+ROUNDS = 5
+
+
+def per_call_ns(fn, arg, calls: int) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e9
+
+
+def empty_span_ns(calls: int) -> float:
+    span = trace.span
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(calls):
+            with span("bench"):
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e9
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--calls", type=int, default=100000)
+    args = ap.parse_args(argv)
+
+    for label, fn, arg in (("tokenize", tokenize, "x = 1"), ("maheshwara_hash", maheshwara_hash, "om")):
+        trace.disable()
+        raw = per_call_ns(fn.__wrapped__, arg, args.calls)
+        off = per_call_ns(fn, arg, args.calls)
+        trace.enable()
+        on = per_call_ns(fn, arg, args.calls)
+        trace.disable()
+        print(f"{label:<16} raw {raw:8.0f} ns   off {off:8.0f} ns (+{off - raw:5.0f})   on {on:8.0f} ns (+{on - raw:5.0f})")
+
+    off = empty_span_ns(args.calls)
+    trace.enable()
+    on = empty_span_ns(args.calls)
+    trace.disable()
+    print(f"{'empty span':<16} off {off:8.0f} ns   on {on:8.0f} ns")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
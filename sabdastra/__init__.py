@@ -0,0 +1,41 @@
+# Śabdāstra core: hash, lexer, parser, transpiler, VM, Bhāva, mantras, Vedic math.
+# Nothing in here may import streamlit, pandas, graphviz, matplotlib or numpy
+# (yantra.py is the one plotting module and is never loaded from here).
+# Submodules are imported on first attribute access to keep cold start cheap.
+
+import importlib
+
+_EXPORTS = {
+    "MAHESHWARA_ORDER": "hash",
+    "maheshwara_hash": "hash",
+    "tokenize": "lexer",
+    "Parser": "parser",
+    "parse": "parser",
+    "transpile_ast": "transpiler",
+    "OP_CODES": "vm",
+    "compile_to_bytecode": "vm",
+    "execute_bytecode": "vm",
+    "interpret_ast": "vm",
+    "StepLimitExceeded": "vm",
+    "BHAVA_TABLE": "bhava",
+    "apply_bhava": "bhava",
+    "chant_to_ast": "mantras",
+    "VEDIC_SUTRAS": "vedic",
+    "PANINI_CONCEPTS": "grammar",
+    "SANDHI_RULES": "grammar",
+    "SANSKRIT_LINGUISTICS": "grammar",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
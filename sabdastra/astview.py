@@ -0,0 +1,164 @@
+# Level-of-detail AST viewer
+# Emits Graphviz DOT text for only the visible part of an AST: levels below
+# a depth picked from a node budget are collapsed, wide blocks show their
+# first children plus a "+N more" node, and any node can be expanded on request.
+# DOT fragments are cached per (subtree, depth left, expansions inside it).
+
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+Path = Tuple[int, ...]
+
+MAX_DEPTH = 4        # never auto-expand deeper than this
+MAX_NODES = 150      # node budget used to pick the automatic depth
+MAX_CHILDREN = 20    # children shown per node before "+N more"
+FRAGMENT_CACHE_SIZE = 20000  # cached subtree fragments per view
+
+
+def children(node: dict) -> List[dict]:
+    out = []
+    for key in ('body', 'orelse'):
+        child = node.get(key)
+        if isinstance(child, list):
+            out += child
+        elif isinstance(child, dict):
+            out.append(child)
+    for key in ('test', 'iter'):
+        child = node.get(key)
+        if isinstance(child, dict):
+            out.append(child)
+    return out
+
+
+def node_label(node: dict) -> str:
+    label = node['type']
+    if 'name' in node:
+        label += f": {node['name']}"
+    return label
+
+
+def node_id(path: Path) -> str:
+    # stable across reruns, unlike id(node)
+    return "n" + "".join(f"_{i}" for i in path)
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+class AstView:
+    def __init__(self, ast: List[dict], max_depth: int = MAX_DEPTH, max_nodes: int = MAX_NODES,
+                 max_children: int = MAX_CHILDREN):
+        self.root = {"type": "program", "body": ast}
+        self.max_children = max_children
+        self.nodes: Dict[Path, dict] = {}
+        self.kids: Dict[Path, int] = {}
+        self.sizes: Dict[Path, int] = {}
+        level_counts: List[int] = []
+
+        # one iterative preorder pass: index paths, count nodes per level that
+        # survive the fan-out cap, then fold subtree sizes bottom-up
+        order = []
+        stack = [((), self.root, True)]
+        while stack:
+            path, node, visible = stack.pop()
+            self.nodes[path] = node
+            order.append(path)
+            if visible:
+                if len(level_counts) <= len(path):
+                    level_counts.append(0)
+                level_counts[len(path)] += 1
+            kids = children(node)
+            self.kids[path] = len(kids)
+            for i in range(len(kids) - 1, -1, -1):
+                stack.append((path + (i,), kids[i], visible and i < max_children))
+        for path in reversed(order):
+            self.sizes[path] = self.sizes.get(path, 0) + 1
+            if path:
+                parent = path[:-1]
+                self.sizes[parent] = self.sizes.get(parent, 0) + self.sizes[path]
+        self.total_nodes = self.sizes[()]
+
+        # deepest level such that everything down to it fits the node budget
+        self.depth = 0
+        shown = 0
+        for depth, count in enumerate(level_counts):
+            shown += count
+            if depth > max_depth or shown > max_nodes:
+                break
+            self.depth = depth
+        self._fragments: Dict[Tuple[Path, int, FrozenSet[Path]], List[str]] = {}
+
+    # -----------------------------
+    # DOT generation
+    # -----------------------------
+    def _fragment(self, path: Path, depth_left: int, expanded: FrozenSet[Path]) -> List[str]:
+        key = (path, depth_left, expanded)
+        cached = self._fragments.get(key)
+        if cached is not None:
+            return cached
+        node = self.nodes[path]
+        nid = node_id(path)
+        n_kids = self.kids[path]
+        is_open = path in expanded
+        if is_open:
+            depth_left = max(depth_left, 1)
+        if n_kids and depth_left == 0:
+            hidden = self.sizes[path] - 1
+            lines = [f"{nid} [label={_quote(node_label(node) + f' [+{hidden}]')}, style=dashed];"]
+        else:
+            lines = [f"{nid} [label={_quote(node_label(node))}];"]
+            limit = n_kids if is_open else min(n_kids, self.max_children)
+            # split the expansions below this node by child, once per node
+            below: Dict[int, set] = {}
+            for p in expanded:
+                if len(p) > len(path):
+                    below.setdefault(p[len(path)], set()).add(p)
+            for i in range(limit):
+                child = path + (i,)
+                lines += self._fragment(child, depth_left - 1, frozenset(below.get(i, ())))
+                lines.append(f"{nid} -> {node_id(child)};")
+            if limit < n_kids:
+                more = f"{nid}_more"
+                lines.append(f"{more} [label={_quote(f'+{n_kids - limit} more')}, shape=plaintext];")
+                lines.append(f"{nid} -> {more} [style=dotted];")
+        if len(self._fragments) >= FRAGMENT_CACHE_SIZE:
+            self._fragments.clear()
+        self._fragments[key] = lines
+        return lines
+
+    def to_dot(self, expanded: Iterable[Path] = (), focus: Path = ()) -> str:
+        """
+        DOT for the visible region rooted at `focus` (default: whole program).
+        `expanded` holds paths whose children are shown regardless of budget.
+        """
+        expanded = frozenset(p for p in expanded if p[:len(focus)] == focus)
+        return "digraph {\n" + "\n".join(self._fragment(focus, self.depth, expanded)) + "\n}"
+
+    def full_dot(self) -> str:
+        # every node, as the old build_graph produced; for comparison/benchmarks
+        return self.to_dot(expanded=(p for p, n in self.kids.items() if n))
+
+    def visible_nodes(self, expanded: Iterable[Path] = (), focus: Path = ()) -> int:
+        dot = self.to_dot(expanded, focus)
+        return dot.count("[label=") - dot.count("shape=plaintext")
+
+    def expandable(self, expanded: Iterable[Path] = (), focus: Path = ()) -> List[Tuple[Path, str]]:
+        """Visible nodes that still hide children, as (path, description)."""
+        expanded = frozenset(expanded)
+        out = []
+        stack = [(focus, self.depth)]
+        while stack:
+            path, depth_left = stack.pop()
+            is_open = path in expanded
+            if is_open:
+                depth_left = max(depth_left, 1)
+            n_kids = self.kids[path]
+            if not n_kids:
+                continue
+            limit = n_kids if is_open else min(n_kids, self.max_children)
+            if depth_left == 0 or limit < n_kids:
+                out.append((path, f"{node_label(self.nodes[path])} @ {'/'.join(map(str, path)) or 'root'} "
+                                  f"({self.sizes[path] - 1} nodes below)"))
+            if depth_left > 0:
+                stack += [(path + (i,), depth_left - 1) for i in range(limit)]
+        return sorted(out)
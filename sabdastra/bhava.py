@@ -0,0 +1,28 @@
+# bhava_map
+BHAVA_TABLE = [
+    {"phoneme": "ma", "bhava": "Maitri", "chakra": "Anahata", "rasa": "Shanta"},
+    {"phoneme": "ra", "bhava": "Vira", "chakra": "Manipura", "rasa": "Vira"},
+    {"phoneme": "sha", "bhava": "Shanta", "chakra": "Sahasrara", "rasa": "Shanta"},
+    {"phoneme": "ka", "bhava": "Karuna", "chakra": "Anahata", "rasa": "Karuna"},  # Added more Bhavas
+    {"phoneme": "ha", "bhava": "Hasya", "chakra": "Vishuddha", "rasa": "Hasya"},
+    {"phoneme": "sa", "bhava": "Shringara", "chakra": "Swadhisthana", "rasa": "Shringara"},
+    {"phoneme": "ba", "bhava": "Bibhatsa", "chakra": "Muladhara", "rasa": "Bibhatsa"},
+    {"phoneme": "da", "bhava": "Adbhuta", "chakra": "Ajna", "rasa": "Adbhuta"},
+    {"phoneme": "pa", "bhava": "Bhayanaka", "chakra": "Manipura", "rasa": "Bhayanaka"},
+]
+
+def apply_bhava(code_or_env, bhava):
+    # Upgrade 2: Simple Bhāva application (demo: prefix comments or modify env)
+    if isinstance(code_or_env, str):
+        return f"# Bhāva {bhava}\n{code_or_env}"
+    else:  # Env modification
+        code_or_env['bhava_mode'] = bhava  # e.g., could affect print styles
+        # More rules: e.g., if 'vira', add assert
+        if bhava == 'Vira':
+            code_or_env['assert_mode'] = True
+        elif bhava == 'Shanta':
+            code_or_env['calm_mode'] = True
+        elif bhava == 'Karuna':
+            code_or_env['compassion_mode'] = True
+        # Add more bhava-specific rules
+        return code_or_env
@@ -0,0 +1,168 @@
+"""
+Headless Śabdāstra runner.
+
+    sabdastra run prog.sab [--time] [--profile] [--trace spans.jsonl] [--max-steps N]
+    sabdastra transpile prog.sab
+    sabdastra disasm prog.sab
+    cat progs.txt | sabdastra run --stream     # programs separated by '---' lines
+
+Never imports streamlit; only the core pipeline is loaded.
+"""
+
+import argparse
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import time
+from typing import Dict, Iterator, List, TextIO
+
+from . import trace
+from .lexer import tokenize
+from .parser import parse
+from .transpiler import transpile_ast
+from .vm import MAX_STEPS, OP_NAMES, StepLimitExceeded, compile_to_bytecode, execute_bytecode
+
+
+# -----------------------------
+# Pipeline with per-stage timing
+# -----------------------------
+def _stage(timings: Dict[str, float], name: str, fn, *args):
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:  # a stage that fails still spent the time
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def run_source(src: str, timings: Dict[str, float], max_steps: int = MAX_STEPS) -> List[str]:
+    tokens = _stage(timings, "tokenize", tokenize, src)
+    ast = _stage(timings, "parse", parse, tokens)
+    bytecode, constants = _stage(timings, "compile", compile_to_bytecode, ast)
+    # same constant inversion as interpret_ast
+    return _stage(timings, "execute", execute_bytecode, bytecode, {v: k for k, v in constants.items()},
+                  None, max_steps)
+
+
+def transpile_source(src: str, timings: Dict[str, float]) -> List[str]:
+    tokens = _stage(timings, "tokenize", tokenize, src)
+    ast = _stage(timings, "parse", parse, tokens)
+    return [_stage(timings, "transpile", transpile_ast, ast)]
+
+
+def disasm_source(src: str, timings: Dict[str, float]) -> List[str]:
+    tokens = _stage(timings, "tokenize", tokenize, src)
+    ast = _stage(timings, "parse", parse, tokens)
+    bytecode, constants = _stage(timings, "compile", compile_to_bytecode, ast)
+    lines = [f"{pc:4d} {OP_NAMES.get(op[0], op[0]):<14} {' '.join(map(str, op[1:]))}".rstrip()
+             for pc, op in enumerate(bytecode)]
+    if constants:
+        lines.append("constants: " + ", ".join(f"{cid}={value}" for value, cid in constants.items()))
+    return lines
+
+
+COMMANDS = {
+    "run": run_source,
+    "transpile": transpile_source,
+    "disasm": disasm_source,
+}
+
+
+# -----------------------------
+# Input handling
+# -----------------------------
+def iter_programs(stream: TextIO, separator: str) -> Iterator[str]:
+    """Yield programs from a stream as soon as each separator line is read."""
+    buf = []
+    for line in stream:
+        if line.rstrip("\r\n") == separator:
+            yield "".join(buf)
+            buf = []
+        else:
+            buf.append(line)
+    if any(line.strip() for line in buf):
+        yield "".join(buf)
+
+
+def report_timings(timings: Dict[str, float], programs: int, out: TextIO) -> None:
+    total = sum(timings.values())
+    out.write(f"-- timings ({programs} program{'s' if programs != 1 else ''}) --\n")
+    for name, secs in timings.items():
+        share = secs / total * 100 if total else 0.0
+        out.write(f"{name:<10} {secs * 1000:10.3f} ms  {share:5.1f}%\n")
+    out.write(f"{'total':<10} {total * 1000:10.3f} ms\n")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="sabdastra", description="Run, transpile or disassemble Śabdāstra programs.")
+    ap.add_argument("command", choices=sorted(COMMANDS))
+    ap.add_argument("file", nargs="?", default="-", help="source file ('-' or omitted for stdin)")
+    ap.add_argument("--time", action="store_true", help="report time spent in each stage on stderr")
+    ap.add_argument("--profile", action="store_true", help="print a cProfile summary on stderr")
+    ap.add_argument("--trace", metavar="FILE", help="append one JSON line per traced span to FILE ('-' for stderr)")
+    ap.add_argument("--max-steps", type=int, default=MAX_STEPS,
+                    help="abort a run after this many VM instructions (default %(default)s)")
+    ap.add_argument("--stream", action="store_true", help="read programs from stdin continuously")
+    ap.add_argument("--separator", default="---", help="line separating programs in --stream mode")
+    args = ap.parse_args(argv)
+    trace.configure(os.environ.get("SABDASTRA_TRACE", ""))
+
+    handler = COMMANDS[args.command]
+    if handler is run_source:
+        handler = functools.partial(run_source, max_steps=args.max_steps)
+    timings: Dict[str, float] = {}
+    profiler = cProfile.Profile() if args.profile else None
+    exporter = None
+    if args.trace:
+        exporter = trace.JsonLinesExporter(sys.stderr if args.trace == "-" else args.trace)
+        trace.add_exporter(exporter)
+        trace.enable()
+
+    if args.stream:
+        programs = iter_programs(sys.stdin, args.separator)
+    elif args.file == "-":
+        programs = iter([sys.stdin.read()])
+    else:
+        with open(args.file, encoding="utf-8") as f:
+            programs = iter([f.read()])
+
+    count = 0
+    status = 0
+    for src in programs:
+        count += 1
+        try:
+            if profiler:
+                profiler.enable()
+            lines = handler(src, timings)
+        except StepLimitExceeded as e:
+            lines = e.output  # what it printed before running out of steps
+            sys.stderr.write(f"{e}\n")
+            status = 1
+        except Exception as e:
+            sys.stderr.write(f"Compilation error: {e}\n")
+            status = 1
+            lines = []  # still emit the separator: output stays aligned with input
+        finally:
+            if profiler:
+                profiler.disable()
+        for line in lines:
+            sys.stdout.write(line + "\n")
+        if args.stream:
+            sys.stdout.write(args.separator + "\n")
+            sys.stdout.flush()
+
+    if args.time:
+        report_timings(timings, count, sys.stderr)
+    if profiler:
+        buf = io.StringIO()
+        pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(20)
+        sys.stderr.write(buf.getvalue())
+    if exporter:
+        exporter.close()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
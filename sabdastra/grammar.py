@@ -0,0 +1,41 @@
+# Panini Grammar Data
+PANINI_CONCEPTS = [
+    {"sutra": "1.1.1: vṛddhir ādaic", "desc": "Defines vṛddhi vowels: ā, ai, au."},
+    {"sutra": "1.4.14: sup-tiṅantaṃ padam", "desc": "A word ends with nominal or verbal suffix."},
+    {"sutra": "3.1.91: dhātoḥ", "desc": "After a root (for verb formation)."},
+    {"sutra": "6.1.77: iko yaṇaci", "desc": "i,u,ṛ,ḷ become y,v,r,l before dissimilar vowels (sandhi)."},
+    {"sutra": "6.1.78: eco 'yavāyāvaḥ", "desc": "e,o,ai,au become ay,av,āy,āv before vowels (sandhi)."},
+    {"sutra": "6.1.109: eṅaḥ padāntād ati", "desc": "Word-final e/o absorb a following a, written e '/o '."},
+    {"sutra": "6.1.87: ād guṇaḥ", "desc": "a + i/u = e/o (guṇa sandhi)."},
+    {"sutra": "6.1.101: akaḥ savarṇe dīrghaḥ", "desc": "Same vowels combine to long vowel."},
+    {"sutra": "8.3.23: mo 'nusvāraḥ", "desc": "m before consonant becomes anusvāra."},
+    {"sutra": "3.2.123: vartamāne laṭ", "desc": "Present tense uses laṭ endings."},
+    {"sutra": "2.3.2: karmaṇi dvitīyā", "desc": "Accusative for object."},
+    {"sutra": "4.1.2: svaujasamauṭchṣṭa...", "desc": "Nominal endings list."},
+    # Add more sutras...
+]
+
+SANDHI_RULES = [
+    "Vowel Sandhi: a + i = e (guṇa), a + a = ā (dirgha), i + u = yu (yan).",
+    "Visarga Sandhi: aḥ + a = o ' (lop with o), aḥ + c = aś c.",
+    "Consonant Sandhi: t + c = cc (doubling), n + t = nt (no change), m + consonant = anusvāra.",
+    # Examples
+    "deva + indra = devendra (a + i = e).",
+    "rāmaḥ + asti = rāmo 'sti (ḥ + a = o ').",
+    "jagat + nātha = jagannātha (t + n = nn).",
+    "nau + ika = nāvika (au + i = āvi).",
+]
+
+SANSKRIT_LINGUISTICS = [
+    {"concept": "Vyakarana", "desc": "Sanskrit grammar tradition, primarily Panini's Ashtadhyayi."},
+    {"concept": "Panini", "desc": "Ancient grammarian, author of Ashtadhyayi with 3959 sutras."},
+    {"concept": "Pratyaharas", "desc": "Phoneme abbreviations from Maheshwara Sutras."},
+    {"concept": "Sandhi", "desc": "Euphonic combination of sounds."},
+    {"concept": "Samasa", "desc": "Compound words."},
+    {"concept": "Karaka", "desc": "Semantic roles like agent, object."},
+    {"concept": "Dhatu", "desc": "Verb roots."},
+    {"concept": "Vibhakti", "desc": "Case endings."},
+    {"concept": "Lakara", "desc": "Verb moods and tenses."},
+    {"concept": "Sphota", "desc": "Burst of meaning in philosophy of language."},
+    # From search
+]
@@ -0,0 +1,100 @@
+# maheshwara_core/hash.py
+
+from typing import List
+
+from .trace import traced
+
+MAHESHWARA_ORDER = [
+    "a","i","u","R",
+    "L","e","o","ai","au",
+    "h","y","v","r","l",
+    "n","m","ng","n"
+]
+
+PRIME = 12289          # lattice-friendly prime (used in PQ crypto)
+ROUNDS = 12            # diffusion rounds
+OUTPUT_HEX_LEN = 32    # 128-bit output (32 hex chars)
+
+# first position of each phoneme ("n" repeats); same values as list.index
+_ORDER_INDEX = {}
+for _i, _p in enumerate(MAHESHWARA_ORDER):
+    _ORDER_INDEX.setdefault(_p, _i)
+
+
+# -----------------------------
+# 1. Phoneme → lattice mapping
+# -----------------------------
+def phoneme_index(ch: str) -> int:
+    idx = _ORDER_INDEX.get(ch)
+    return idx if idx is not None else ord(ch) % len(MAHESHWARA_ORDER)
+
+
+def lattice_vector(text: str) -> List[int]:
+    vec = []
+    for i, ch in enumerate(text):
+        idx = phoneme_index(ch)
+        # map into lattice space
+        v = (idx * (i + 1) ** 2 + len(text)) % PRIME
+        vec.append(v)
+    return vec or [0]
+
+
+# -----------------------------
+# 2. Non-linear lattice mixing
+# -----------------------------
+def mix(vec: List[int]) -> List[int]:
+    out = []
+    n = len(vec)
+    for i in range(n):
+        left = vec[i - 1]
+        mid = vec[i]
+        right = vec[(i + 1) % n]
+        mixed = (left * 31 + mid * 17 + right * 13) % PRIME
+        out.append(mixed)
+    return out
+
+
+# -----------------------------
+# 3. Permutation (Avalanche)
+# -----------------------------
+def permute(vec: List[int], r: int) -> List[int]:
+    n = len(vec)
+    perm = [(vec[(i * 7 + r * 3) % n] ^ (r + i)) % PRIME for i in range(n)]
+    return perm
+
+
+# -----------------------------
+# 4. Sponge rounds
+# -----------------------------
+def sponge(vec: List[int]) -> List[int]:
+    state = vec[:]
+    for r in range(ROUNDS):
+        state = mix(state)
+        state = permute(state, r)
+    return state
+
+
+# -----------------------------
+# 5. Squeeze → hex digest
+# -----------------------------
+def squeeze(state: List[int]) -> str:
+    acc = 0
+    for v in state:
+        acc ^= (v << (v % 13)) & ((1 << 256) - 1)
+
+    hex_out = hex(acc)[2:].zfill(OUTPUT_HEX_LEN)
+    return hex_out[:OUTPUT_HEX_LEN]
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+@traced()
+def maheshwara_hash(text: str) -> str:
+    """
+    Maheshwara Hash v1
+    Post-quantum inspired lattice-phonetic hash
+    """
+    lattice = lattice_vector(text)
+    state = sponge(lattice)
+    return squeeze(state)
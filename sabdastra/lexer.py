@@ -0,0 +1,30 @@
+# lexer
+import re
+
+from .trace import traced
+
+
+@traced()
+def tokenize(src: str):
+    tokens = []
+    lines = src.splitlines()
+    indent_stack = [0]
+    for i, line in enumerate(lines):
+        indent = len(line) - len(line.lstrip())
+        line = line.strip()
+        if not line:
+            continue
+        # Handle indent/dedent (upgrade 1: for blocks)
+        if indent > indent_stack[-1]:
+            indent_stack.append(indent)
+            tokens.append(('INDENT',))
+        while indent < indent_stack[-1]:
+            indent_stack.pop()
+            tokens.append(('DEDENT',))
+        # Tokenize words, strings, numbers, operators
+        parts = re.findall(r"[A-Za-z_][A-Za-z_0-9]*|[0-9]+|'[^']*'|\(|\)|==|!=|<|>|=|\+|\-|\*|/|\:|in", line)
+        tokens.append(tuple(parts))
+    while len(indent_stack) > 1:
+        indent_stack.pop()
+        tokens.append(('DEDENT',))
+    return tokens
@@ -0,0 +1,277 @@
+# Indexed phoneme → bhāva/chakra/rasa lexicon
+#
+# File format (.sblx, native-endian uint32, 4-byte aligned), one block per column:
+#   sorted distinct values (NUL-joined UTF-8), posting offsets (m + 1),
+#   postings (row ids grouped by value), codes (value id per row)
+# The file is memory-mapped and only read on the first query. Because values
+# are sorted, the values sharing a prefix form one contiguous dictionary range,
+# and therefore one contiguous slice of postings: the sorted dictionary acts
+# as a flattened prefix trie and the postings as the inverted index.
+
+import bisect
+import csv
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+MAGIC = b"SBLX"
+VERSION = 1
+FIELDS = ("phoneme", "bhava", "chakra", "rasa")
+PAGE_SIZE = 50
+MAX_CHAR = chr(0x10FFFF)  # sorts after any character, closes a prefix range
+
+assert array("I").itemsize == 4
+
+
+class Page(NamedTuple):
+    rows: List[dict]
+    total: int
+    page: int
+    page_size: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.total // self.page_size))
+
+
+class Column:
+    def __init__(self, values: List[str], offsets: Sequence[int], postings: Sequence[int], codes: Sequence[int]):
+        self.values = values        # sorted distinct values
+        self.offsets = offsets      # postings[offsets[v]:offsets[v + 1]] are the rows of value v
+        self.postings = postings
+        self.codes = codes          # codes[row] is the value id of that row
+
+    @classmethod
+    def build(cls, raw: List[str]) -> "Column":
+        values = sorted(set(raw))
+        index = {v: i for i, v in enumerate(values)}
+        codes = array("I", (index[v] for v in raw))
+        counts = [0] * (len(values) + 1)
+        for c in codes:
+            counts[c + 1] += 1
+        for i in range(len(values)):
+            counts[i + 1] += counts[i]
+        offsets = array("I", counts)
+        fill = list(counts[:-1])
+        postings = array("I", bytes(4 * len(raw)))
+        for row, c in enumerate(codes):
+            postings[fill[c]] = row
+            fill[c] += 1
+        return cls(values, offsets, postings, codes)
+
+    # -----------------------------
+    # Lookups → ranges of value ids
+    # -----------------------------
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect.bisect_left(self.values, prefix)
+        hi = bisect.bisect_left(self.values, prefix + MAX_CHAR, lo)
+        return lo, hi
+
+    def exact(self, value: str) -> List[int]:
+        i = bisect.bisect_left(self.values, value)
+        return [i] if i < len(self.values) and self.values[i] == value else []
+
+    def contains(self, part: str) -> List[int]:
+        return [i for i, v in enumerate(self.values) if part in v]
+
+    def fuzzy(self, query: str, max_distance: int) -> List[Tuple[int, int]]:
+        """
+        (distance, value id) for values within `max_distance` edits of `query`.
+        Walks the sorted values as a trie, carrying one Levenshtein row per
+        prefix and pruning any branch whose row minimum exceeds the bound.
+        """
+        values = self.values
+        out = []
+        first_row = list(range(len(query) + 1))
+        stack = [(0, 0, len(values), first_row)]
+        while stack:
+            depth, lo, hi, row = stack.pop()
+            if lo < hi and len(values[lo]) == depth:
+                # exactly the prefix itself (sorts first in its range)
+                if row[-1] <= max_distance:
+                    out.append((row[-1], lo))
+                lo += 1
+            i = lo
+            while i < hi:
+                ch = values[i][depth]
+                prefix = values[i][:depth + 1]
+                j = bisect.bisect_left(values, prefix + MAX_CHAR, i, hi)
+                new = [row[0] + 1]
+                for k in range(1, len(row)):
+                    new.append(min(new[k - 1] + 1, row[k] + 1, row[k - 1] + (query[k - 1] != ch)))
+                if min(new) <= max_distance:
+                    stack.append((depth + 1, i, j, new))
+                i = j
+        out.sort(key=lambda m: (m[0], values[m[1]]))
+        return out
+
+    def posting_ranges(self, value_ids: Iterable[int]) -> List[Tuple[int, int]]:
+        return [(self.offsets[v], self.offsets[v + 1]) for v in value_ids]
+
+
+class Lexicon:
+    def __init__(self, path: Optional[str] = None, rows: Optional[List[dict]] = None):
+        """Opened lazily: nothing is read until the first query."""
+        self.path = path
+        self._rows = rows
+        self._columns: Optional[Dict[str, Column]] = None
+        self._size = 0
+        self._mmap = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, rows: List[dict]) -> "Lexicon":
+        return cls(rows=rows)
+
+    # -----------------------------
+    # Loading
+    # -----------------------------
+    @property
+    def columns(self) -> Dict[str, Column]:
+        if self._columns is None:
+            with self._lock:
+                if self._columns is None:
+                    self._columns = self._load()
+        return self._columns
+
+    def _load(self) -> Dict[str, Column]:
+        if self.path is None:
+            rows = self._rows or []
+            self._size = len(rows)
+            return {f: Column.build([r[f] for r in rows]) for f in FIELDS}
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mmap)
+        magic, version, n, ncols = struct.unpack_from("4sIII", buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a v{VERSION} lexicon file")
+        self._size = n
+        pos = 16
+        columns = {}
+
+        def u32s(count):
+            nonlocal pos
+            view = buf[pos:pos + 4 * count].cast("I")
+            pos += 4 * count
+            return view
+
+        for _ in range(ncols):
+            name_len, = struct.unpack_from("I", buf, pos)
+            name = bytes(buf[pos + 4:pos + 4 + name_len]).decode("utf-8")
+            pos += 4 + _pad(name_len)
+            m, blob_len = struct.unpack_from("II", buf, pos)
+            pos += 8
+            blob = bytes(buf[pos:pos + blob_len]).decode("utf-8")
+            pos += _pad(blob_len)
+            values = blob.split("\0") if m else []
+            columns[name] = Column(values, u32s(m + 1), u32s(n), u32s(n))
+        return columns
+
+    def close(self) -> None:
+        with self._lock:
+            self._columns = None
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    pass  # views still referenced elsewhere; freed with them
+                self._mmap = None
+
+    def __len__(self) -> int:
+        self.columns
+        return self._size
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def row(self, row_id: int) -> dict:
+        return {f: c.values[c.codes[row_id]] for f, c in self.columns.items()}
+
+    def search(self, query: str = "", field: str = "phoneme", mode: str = "prefix",
+               max_distance: int = 1, page: int = 0, page_size: int = PAGE_SIZE) -> Page:
+        """
+        Paginated rows whose `field` matches `query`.
+        mode: "prefix", "exact", "contains" or "fuzzy" (bounded edit distance).
+        Fuzzy results are ordered by distance, the others by value.
+        """
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        col = self.columns[field]
+        if mode == "prefix":
+            lo, hi = col.prefix_range(query)
+            ranges = [(col.offsets[lo], col.offsets[hi])]
+        elif mode == "exact":
+            ranges = col.posting_ranges(col.exact(query))
+        elif mode == "contains":
+            ranges = col.posting_ranges(col.contains(query))
+        elif mode == "fuzzy":
+            ranges = col.posting_ranges(v for _, v in col.fuzzy(query, max_distance))
+        else:
+            raise ValueError(f"Unknown search mode: {mode}")
+        return self._page(col, ranges, page, page_size)
+
+    def _page(self, col: Column, ranges: List[Tuple[int, int]], page: int, page_size: int) -> Page:
+        total = sum(hi - lo for lo, hi in ranges)
+        skip = page * page_size
+        ids = []
+        for lo, hi in ranges:
+            if skip >= hi - lo:
+                skip -= hi - lo
+                continue
+            take = min(hi, lo + skip + page_size - len(ids))
+            ids.extend(col.postings[lo + skip:take])
+            skip = 0
+            if len(ids) >= page_size:
+                break
+        return Page([self.row(r) for r in ids], total, page, page_size)
+
+
+# -----------------------------
+# Writing
+# -----------------------------
+def _pad(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def write_lexicon(path: str, rows: Iterable[dict]) -> int:
+    rows = list(rows)
+    with open(path, "wb") as f:
+        f.write(struct.pack("4sIII", MAGIC, VERSION, len(rows), len(FIELDS)))
+        for field in FIELDS:
+            col = Column.build([r[field] for r in rows])
+            name = field.encode("utf-8")
+            f.write(struct.pack("I", len(name)) + name.ljust(_pad(len(name)), b"\0"))
+            blob = "\0".join(col.values).encode("utf-8")
+            f.write(struct.pack("II", len(col.values), len(blob)) + blob.ljust(_pad(len(blob)), b"\0"))
+            for arr in (col.offsets, col.postings, col.codes):
+                f.write(arr.tobytes())
+    return len(rows)
+
+
+_DEFAULT: Optional[Lexicon] = None
+
+
+def default_lexicon() -> Lexicon:
+    """The lexicon at $SABDASTRA_LEXICON if set, else the built-in BHAVA_TABLE."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        path = os.environ.get("SABDASTRA_LEXICON")
+        if path and os.path.exists(path):
+            _DEFAULT = Lexicon(path)
+        else:
+            from .bhava import BHAVA_TABLE
+            _DEFAULT = Lexicon.from_rows(BHAVA_TABLE)
+    return _DEFAULT
+
+
+# python -m sabdastra.lexicon lexicon.csv lexicon.sblx
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m sabdastra.lexicon <phoneme,bhava,chakra,rasa csv> <out.sblx>")
+    with open(sys.argv[1], newline="", encoding="utf-8") as f:
+        count = write_lexicon(sys.argv[2], csv.DictReader(f))
+    print(f"wrote {count} entries to {sys.argv[2]}")
@@ -0,0 +1,18 @@
+# mantras (NEW: Upgrade 6 — Mantra-based execution)
+def gayatri_ast():
+    return [{"type": "print", "value": "'Wisdom unlocked'"}]
+
+def mahamrityunjaya_ast():
+    return [{"type": "call", "expr": "protect"}]
+
+chant_to_ast = {
+    "gayatri": gayatri_ast,
+    "mahamrityunjaya": mahamrityunjaya_ast,
+    # Add more mantras → AST mappings
+}
+
+# Chant text each mantra is recognized by (transliterated, spacing ignored)
+mantra_texts = {
+    "gayatri": ["om bhur bhuvah svah tat savitur varenyam", "gayatri"],
+    "mahamrityunjaya": ["om tryambakam yajamahe sugandhim pushtivardhanam", "mahamrityunjaya"],
+}
@@ -0,0 +1,94 @@
+# parser
+from .trace import traced
+
+
+class Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self):
+        ast = []
+        while self.pos < len(self.tokens):
+            tok = self.tokens[self.pos]
+            if tok[0] == 'DEDENT':  # end of the enclosing block
+                break
+            if tok[0] == 'INDENT':
+                raise ValueError("Unexpected indent")
+            if tok[0] == 'bhava':
+                bhava_name = tok[1]
+                if tok[-1] == ':':
+                    body = self.parse_block()
+                else:
+                    body = []
+                ast.append({"type": "bhava_block", "bhava": bhava_name, "body": body})
+                self.pos += 1
+            elif tok[0] == 'kar':
+                name = tok[1]
+                args = []
+                pos = 2
+                if len(tok) > pos and tok[pos] == '(':
+                    pos += 1
+                    while pos < len(tok) and tok[pos] != ')':
+                        args.append(tok[pos])
+                        pos += 1
+                    pos += 1  # skip )
+                body = []
+                if len(tok) > pos and tok[pos] == ':':
+                    body = self.parse_block()
+                ast.append({"type": "function_def", "name": name, "args": args, "body": body})
+                self.pos += 1
+            elif tok[0] == 'yadi':
+                test = " ".join(tok[1:-1]) if tok[-1] == ':' else " ".join(tok[1:])
+                body = self.parse_block() if tok[-1] == ':' else []
+                orelse = []
+                if self.pos + 1 < len(self.tokens) and self.tokens[self.pos + 1][0] == 'anya':
+                    self.pos += 1
+                    anya_tok = self.tokens[self.pos]
+                    if anya_tok[-1] == ':':
+                        orelse = self.parse_block()
+                ast.append({"type": "if", "test": test, "body": body, "orelse": orelse})
+                self.pos += 1
+            elif tok[0] == 'yugma':
+                var = tok[1]
+                if tok[2] == 'in':
+                    iter_ = tok[3]
+                else:
+                    raise ValueError("Expected 'in'")
+                body = self.parse_block() if tok[-1] == ':' else []
+                ast.append({"type": "for", "var": var, "iter": iter_, "body": body})
+                self.pos += 1
+            elif tok[0] == 'yatra':
+                test = " ".join(tok[1:-1]) if tok[-1] == ':' else " ".join(tok[1:])
+                body = self.parse_block() if tok[-1] == ':' else []
+                ast.append({"type": "while", "test": test, "body": body})
+                self.pos += 1
+            elif tok[0] == 'ch':
+                value = " ".join(tok[1:])
+                ast.append({"type": "print", "value": value})
+                self.pos += 1
+            else:  # Assignment or call
+                if '=' in tok:
+                    ast.append({"type": "assign", "target": tok[0], "value": " ".join(tok[2:])})
+                else:
+                    ast.append({"type": "call", "expr": " ".join(tok)})
+                self.pos += 1
+        return ast
+
+    def parse_block(self):
+        # Called on a header line ending in ':'; leaves pos on the block's
+        # closing DEDENT so the caller's `self.pos += 1` moves past it.
+        if self.pos + 1 >= len(self.tokens) or self.tokens[self.pos + 1][0] != 'INDENT':
+            return []  # header without an indented body
+        self.pos += 2  # skip header and INDENT
+        return self.parse()
+
+    def expect(self, val):
+        tok = self.tokens[self.pos]
+        if tok[-1] != val:
+            raise ValueError(f"Expected {val}")
+        self.pos += 1
+
+@traced()
+def parse(tokens):
+    return Parser(tokens).parse()
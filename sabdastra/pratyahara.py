@@ -0,0 +1,182 @@
+# Pratyāhāras over the Maheshwara Sutras
+# Every phoneme of the fourteen sutras gets an integer id; a pratyāhāra
+# (start phoneme + closing it-marker, e.g. "ac", "hal", "ik", "yaṇ") is the
+# bitset of ids from its start up to that marker. All of them are precomputed,
+# so membership is a shift-and-mask and set algebra is plain int |, &, ~.
+# Long vowels share the id of their short form (1.1.69 aṇudit savarṇasya).
+
+import re
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# (phonemes, it-marker) — IAST, consonants without their carrier vowel
+MAHESHWARA_SUTRAS: List[Tuple[List[str], str]] = [
+    (["a", "i", "u"], "ṇ"),
+    (["ṛ", "ḷ"], "k"),
+    (["e", "o"], "ṅ"),
+    (["ai", "au"], "c"),
+    (["h", "y", "v", "r"], "ṭ"),
+    (["l"], "ṇ"),
+    (["ñ", "m", "ṅ", "ṇ", "n"], "m"),
+    (["jh", "bh"], "ñ"),
+    (["gh", "ḍh", "dh"], "ṣ"),
+    (["j", "b", "g", "ḍ", "d"], "ś"),
+    (["kh", "ph", "ch", "ṭh", "th", "c", "ṭ", "t"], "v"),
+    (["k", "p"], "y"),
+    (["ś", "ṣ", "s"], "r"),
+    (["h"], "l"),
+]
+
+VOWELS = {"a", "i", "u", "ṛ", "ḷ", "e", "o", "ai", "au"}
+LONG_VOWELS = {"ā": "a", "ī": "i", "ū": "u", "ṝ": "ṛ"}
+# spellings used by MAHESHWARA_ORDER in hash.py
+ASCII_ALIASES = {"R": "ṛ", "L": "ḷ", "ng": "ṅ"}
+
+PHONEMES: List[str] = []            # id -> phoneme
+PHONEME_ID: Dict[str, int] = {}     # phoneme (incl. long vowels and aliases) -> id
+for _phonemes, _ in MAHESHWARA_SUTRAS:
+    for _p in _phonemes:
+        if _p not in PHONEME_ID:
+            PHONEME_ID[_p] = len(PHONEMES)
+            PHONEMES.append(_p)
+for _long, _short in LONG_VOWELS.items():
+    PHONEME_ID[_long] = PHONEME_ID[_short]
+for _alias, _p in ASCII_ALIASES.items():
+    PHONEME_ID[_alias] = PHONEME_ID[_p]
+
+
+def _build() -> Dict[str, int]:
+    flat = [(p, s) for s, (phonemes, _) in enumerate(MAHESHWARA_SUTRAS) for p in phonemes]
+    table: Dict[str, int] = {}
+    for start, (first, first_sutra) in enumerate(flat):
+        prefix = first if first in VOWELS else first + "a"
+        bits = 0
+        pos = start
+        for s in range(first_sutra, len(MAHESHWARA_SUTRAS)):
+            while pos < len(flat) and flat[pos][1] == s:
+                bits |= 1 << PHONEME_ID[flat[pos][0]]
+                pos += 1
+            base = name = prefix + MAHESHWARA_SUTRAS[s][1]
+            # the usual reading is the first one (aṇ up to the first ṇ); later ones get "2"
+            n = 2
+            while name in table:
+                name = f"{base}{n}"
+                n += 1
+            table[name] = bits
+    return table
+
+
+PRATYAHARAS: Dict[str, int] = _build()
+
+
+def _fold(name: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", name) if not unicodedata.combining(c))
+
+
+# plain-ASCII spellings ("jas", "sal") that name exactly one pratyāhāra
+_folded: Dict[str, List[str]] = {}
+for _name in PRATYAHARAS:
+    _folded.setdefault(_fold(_name), []).append(_name)
+ASCII_NAMES = {k: v[0] for k, v in _folded.items() if len(v) == 1 and k not in PRATYAHARAS}
+
+
+# -----------------------------
+# Lookups
+# -----------------------------
+def bits(name: str) -> int:
+    """Bitset for a pratyāhāra name such as "ac", "hal", "ik" or "yaṇ" (or ASCII "jas")."""
+    name = unicodedata.normalize("NFC", name)
+    if name in PRATYAHARAS:
+        return PRATYAHARAS[name]
+    if name in ASCII_NAMES:
+        return PRATYAHARAS[ASCII_NAMES[name]]
+    if len(_folded.get(name, ())) > 1:
+        raise KeyError(f"Ambiguous pratyāhāra: {name} (one of {', '.join(_folded[name])})")
+    raise KeyError(f"Unknown pratyāhāra: {name}")
+
+
+def phoneme_id(phoneme: str) -> Optional[int]:
+    return PHONEME_ID.get(phoneme)
+
+
+def contains(name_or_bits, phoneme: str) -> bool:
+    mask = bits(name_or_bits) if isinstance(name_or_bits, str) else name_or_bits
+    pid = PHONEME_ID.get(phoneme)
+    return pid is not None and mask >> pid & 1 == 1
+
+
+def members(name_or_bits) -> List[str]:
+    """Phonemes of a pratyāhāra, in sutra order (short vowels only)."""
+    mask = bits(name_or_bits) if isinstance(name_or_bits, str) else name_or_bits
+    return [p for i, p in enumerate(PHONEMES) if mask >> i & 1]
+
+
+def union(*names) -> int:
+    out = 0
+    for n in names:
+        out |= bits(n) if isinstance(n, str) else n
+    return out
+
+
+def intersection(*names) -> int:
+    out = -1
+    for n in names:
+        out &= bits(n) if isinstance(n, str) else n
+    return out if names else 0
+
+
+def difference(a, b) -> int:
+    return (bits(a) if isinstance(a, str) else a) & ~(bits(b) if isinstance(b, str) else b)
+
+
+# -----------------------------
+# Strings
+# -----------------------------
+_SEGMENT_RE = re.compile(
+    "|".join(map(re.escape, sorted(PHONEME_ID, key=len, reverse=True))) + r"|(?s:.)"
+)
+
+
+def segment(text: str) -> List[str]:
+    """Longest-match split into phonemes; unknown characters come back one by one."""
+    return _SEGMENT_RE.findall(unicodedata.normalize("NFC", text))
+
+
+def string_bits(text: str) -> int:
+    """Union of the phonemes occurring in `text`."""
+    out = 0
+    for p in segment(text):
+        pid = PHONEME_ID.get(p)
+        if pid is not None:
+            out |= 1 << pid
+    return out
+
+
+def classify(text: str, classes: Sequence[str] = ("ac", "hal")) -> List[Tuple[str, Optional[str]]]:
+    """(phoneme, first matching class or None) for every phoneme of `text`."""
+    label = _class_table(tuple(classes))
+    return [(p, label.get(p)) for p in segment(text)]
+
+
+def iter_classes(texts: Iterable[str], classes: Sequence[str] = ("ac", "hal")) -> Iterator[List[Optional[str]]]:
+    label = _class_table(tuple(classes))
+    for text in texts:
+        yield [label.get(p) for p in segment(text)]
+
+
+_CLASS_TABLES: Dict[Tuple[str, ...], Dict[str, str]] = {}
+
+
+def _class_table(classes: Tuple[str, ...]) -> Dict[str, str]:
+    # phoneme -> class label, resolved once per class tuple
+    table = _CLASS_TABLES.get(classes)
+    if table is None:
+        masks = [(c, bits(c)) for c in classes]
+        table = {}
+        for p, pid in PHONEME_ID.items():
+            for c, mask in masks:
+                if mask >> pid & 1:
+                    table[p] = c
+                    break
+        _CLASS_TABLES[classes] = table
+    return table
@@ -0,0 +1,251 @@
+# Learner progress store
+# Completed levels are kept per learner as an integer bitmap (bit n = level n).
+# ProgressStore is the pluggable interface; SQLiteProgressStore persists to a
+# WAL-mode database, batches writes on a background thread and caches bitmaps
+# in memory for `cache_ttl` seconds (so other processes' updates show up after
+# at most that long). WAL relies on shared memory: every process using the
+# database must run on the same host, never over a network filesystem.
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+DEFAULT_DB = "progress.db"
+CACHE_SIZE = 10000       # learners whose bitmaps are kept in memory
+CACHE_TTL = 5.0          # seconds before a cached bitmap is re-read
+FLUSH_INTERVAL = 0.05    # seconds between background write batches
+BATCH_SIZE = 500         # pending writes that trigger an immediate flush
+BUSY_TIMEOUT = 30.0      # seconds SQLite waits on a lock before reporting "database is locked"
+BUSY_RETRIES = 5         # extra attempts for a batch that finds the database locked
+
+
+def is_unlocked(bitmap: int, level: int) -> bool:
+    # every level 1 .. level-1 must be complete
+    mask = (1 << level) - 2
+    return bitmap & mask == mask
+
+
+def levels_from_bitmap(bitmap: int) -> List[int]:
+    return [i for i in range(bitmap.bit_length()) if bitmap >> i & 1]
+
+
+class ProgressStore(ABC):
+    @abstractmethod
+    def completed(self, learner: str) -> int:
+        """Bitmap of the learner's completed levels."""
+
+    @abstractmethod
+    def mark_complete(self, learner: str, level: int) -> None:
+        """Record `level` as completed for the learner."""
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class MemoryProgressStore(ProgressStore):
+    def __init__(self):
+        self._bitmaps: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def completed(self, learner: str) -> int:
+        return self._bitmaps.get(learner, 0)
+
+    def mark_complete(self, learner: str, level: int) -> None:
+        with self._lock:
+            self._bitmaps[learner] = self._bitmaps.get(learner, 0) | (1 << level)
+
+
+class SQLiteProgressStore(ProgressStore):
+    def __init__(self, path: str = DEFAULT_DB, cache_size: int = CACHE_SIZE, cache_ttl: float = CACHE_TTL,
+                 flush_interval: float = FLUSH_INTERVAL, batch_size: int = BATCH_SIZE,
+                 busy_timeout: float = BUSY_TIMEOUT):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._cache: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._pending: List[Tuple[str, int, float]] = []
+        self._reading: Dict[str, int] = {}   # learner -> reads in flight outside the lock
+        self._raced: Set[str] = set()        # learners written to during one of those reads
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flushed = threading.Condition(self._lock)
+        self._closed = False
+        self._error: Optional[BaseException] = None   # why the writer stopped, if it failed
+        self._queued = 0        # writes accepted so far
+        self._committed = 0     # writes durable so far
+        self.stats = {"reads": 0, "cache_hits": 0, "batches": 0, "rows_written": 0}
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS progress ("
+            " learner TEXT NOT NULL, level INTEGER NOT NULL, completed_at REAL NOT NULL,"
+            " PRIMARY KEY (learner, level)) WITHOUT ROWID"
+        )
+        conn.commit()
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._writer.start()
+
+    def _conn(self) -> sqlite3.Connection:
+        # one connection per thread; WAL lets readers run alongside the writer
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -----------------------------
+    # Reads (cached bitmaps)
+    # -----------------------------
+    def completed(self, learner: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            self.stats["reads"] += 1
+            entry = self._cache.get(learner)
+            if entry is not None and now - entry[1] < self.cache_ttl:
+                self._cache.move_to_end(learner)
+                self.stats["cache_hits"] += 1
+                return entry[0]
+            self._reading[learner] = self._reading.get(learner, 0) + 1
+        bitmap = 0
+        try:
+            for (level,) in self._conn().execute("SELECT level FROM progress WHERE learner = ?", (learner,)):
+                bitmap |= 1 << level
+        except BaseException:
+            with self._lock:
+                self._end_read(learner)
+            raise
+        with self._lock:
+            raced = self._end_read(learner)
+            # writes not yet flushed are still ours
+            for who, level, _ in self._pending:
+                if who == learner:
+                    bitmap |= 1 << level
+            # a write queued during the SELECT may already have been committed
+            # (and left _pending) without the SELECT seeing it: don't cache
+            if not raced:
+                self._remember(learner, bitmap, now)
+        return bitmap
+
+    def _end_read(self, learner: str) -> bool:
+        """Unregister a read (lock held); True if the learner was written to meanwhile."""
+        raced = learner in self._raced
+        self._reading[learner] -= 1
+        if not self._reading[learner]:
+            del self._reading[learner]
+            self._raced.discard(learner)
+        return raced
+
+    def _remember(self, learner: str, bitmap: int, now: float) -> None:
+        self._cache[learner] = (bitmap, now)
+        self._cache.move_to_end(learner)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # -----------------------------
+    # Writes (batched)
+    # -----------------------------
+    def mark_complete(self, learner: str, level: int) -> None:
+        """Visible to this process immediately; durable after the next batch (see flush())."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("progress store is closed")
+            if self._error is not None:
+                raise RuntimeError("progress store writer failed") from self._error
+            entry = self._cache.get(learner)
+            if entry is not None:
+                self._remember(learner, entry[0] | (1 << level), entry[1])
+            if learner in self._reading:
+                self._raced.add(learner)
+            self._pending.append((learner, level, time.time()))
+            self._queued += 1
+            if len(self._pending) >= self.batch_size:
+                self._wake.notify()
+
+    def flush(self) -> None:
+        """Block until every write made so far is committed; raises if the writer failed."""
+        with self._lock:
+            target = self._queued
+            self._wake.notify()
+            while self._committed < target and self._writer.is_alive():
+                self._flushed.wait(1.0)
+            self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("progress store writer failed; unsaved writes remain pending") from self._error
+
+    def _write_loop(self) -> None:
+        conn = self._conn()
+        retries = 0
+        while True:
+            with self._lock:
+                if not self._pending and not self._closed:
+                    self._wake.wait(self.flush_interval)
+                batch, self._pending = self._pending, []
+                closed = self._closed
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO progress (learner, level, completed_at) VALUES (?, ?, ?)", batch)
+                except Exception as e:
+                    with self._lock:
+                        self._pending[:0] = batch  # still readable through completed()
+                        if _is_busy(e) and retries < BUSY_RETRIES:
+                            # still locked by another process after the busy timeout
+                            retries += 1
+                        else:
+                            # missing table, read-only database, full disk, ...: stop
+                            # and let flush()/close() report it
+                            self._error = e
+                            self._flushed.notify_all()
+                    if self._error is not None:
+                        conn.close()
+                        return
+                    time.sleep(self.flush_interval)
+                    continue
+                retries = 0
+                with self._lock:
+                    self._committed += len(batch)
+                    self.stats["batches"] += 1
+                    self.stats["rows_written"] += len(batch)
+            with self._lock:
+                self._flushed.notify_all()
+            if closed and not batch:
+                conn.close()
+                return
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        self._writer.join()
+        with self._lock:
+            self._raise_error()
+
+
+def _is_busy(error: BaseException) -> bool:
+    # SQLITE_BUSY / SQLITE_LOCKED: worth retrying; any other error is not
+    message = str(error)
+    return isinstance(error, sqlite3.OperationalError) and ("locked" in message or "busy" in message)
+
+
+def open_store(path: Optional[str] = None) -> ProgressStore:
+    """SQLite store at `path`, $SABDASTRA_PROGRESS_DB or ./progress.db; ':memory:' gives a MemoryProgressStore."""
+    path = path or os.environ.get("SABDASTRA_PROGRESS_DB", DEFAULT_DB)
+    if path == ":memory:":
+        return MemoryProgressStore()
+    return SQLiteProgressStore(path)
@@ -0,0 +1,160 @@
+# Phoneme-stream mantra recognizer
+# Text is segmented into phonemes (longest match over MAHESHWARA_ORDER, other
+# letters one phoneme each, everything else skipped), then scanned once by an
+# Aho-Corasick automaton over every registered mantra. The automaton is
+# compiled to a dense DFA table (state * alphabet + symbol) so the scan is a
+# single table lookup per phoneme with no failure-link walking.
+# Each match dispatches to that mantra's AST/bytecode, compiled once and cached.
+
+import re
+from array import array
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .hash import MAHESHWARA_ORDER
+from .transpiler import transpile_ast
+from .vm import MAX_STEPS, compile_to_bytecode, execute_bytecode
+
+# multi-letter phonemes first so the regex takes the longest match
+_MULTI = sorted({p.lower() for p in MAHESHWARA_ORDER if len(p) > 1}, key=len, reverse=True)
+PHONEME_RE = re.compile("|".join(map(re.escape, _MULTI)) + r"|[^\W\d_]")
+
+
+def phonemes(text: str) -> List[str]:
+    return PHONEME_RE.findall(text.lower())
+
+
+class Match(NamedTuple):
+    name: str       # mantra key
+    start: int      # character offsets into the transcript
+    end: int
+
+
+class MantraRegistry:
+    def __init__(self):
+        self._patterns: List[Tuple[str, Tuple[str, ...]]] = []   # (mantra, phonemes)
+        self._factories: Dict[str, Callable[[], list]] = {}
+        self._compiled: Dict[str, dict] = {}
+        self._dfa = None
+
+    def register(self, name: str, texts: Iterable[str], ast_factory: Callable[[], list]) -> None:
+        for text in texts:
+            seq = tuple(phonemes(text))
+            if seq:
+                self._patterns.append((name, seq))
+        self._factories[name] = ast_factory
+        self._compiled.pop(name, None)
+        self._dfa = None
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    # -----------------------------
+    # Automaton
+    # -----------------------------
+    def _build(self):
+        alphabet: Dict[str, int] = {}
+        for _, seq in self._patterns:
+            for p in seq:
+                alphabet.setdefault(p, len(alphabet) + 1)   # 0 = not in any mantra
+        width = len(alphabet) + 1
+
+        # trie
+        goto: List[Dict[int, int]] = [{}]
+        outputs: List[List[Tuple[int, int]]] = [[]]        # (pattern index, length)
+        for idx, (_, seq) in enumerate(self._patterns):
+            state = 0
+            for p in seq:
+                sym = alphabet[p]
+                nxt = goto[state].get(sym)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][sym] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((idx, len(seq)))
+
+        # BFS: failure links folded straight into a dense transition table
+        table = array("I", bytes(4 * len(goto) * width))
+        fail = [0] * len(goto)
+        queue = deque()
+        for sym, nxt in goto[0].items():
+            table[sym] = nxt
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            base = state * width
+            fbase = fail[state] * width
+            for sym in range(width):
+                nxt = goto[state].get(sym)
+                if nxt is None:
+                    table[base + sym] = table[fbase + sym]
+                else:
+                    fail[nxt] = table[fbase + sym]
+                    table[base + sym] = nxt
+                    queue.append(nxt)
+        longest = max((len(seq) for _, seq in self._patterns), default=1)
+        names = [name for name, _ in self._patterns]
+        self._dfa = (alphabet, width, table, [tuple(o) for o in outputs], names, longest)
+
+    def recognize(self, text: str) -> List[Match]:
+        """Every (possibly overlapping) occurrence of every registered mantra, in order."""
+        if self._dfa is None:
+            self._build()
+        alphabet, width, table, outputs, names, longest = self._dfa
+        symbols = alphabet.get
+        starts = deque(maxlen=longest)   # start offsets of the last `longest` phonemes
+        matches = []
+        state = 0
+        for m in PHONEME_RE.finditer(text.lower()):
+            starts.append(m.start())
+            state = table[state * width + symbols(m.group(), 0)]
+            if outputs[state]:
+                for idx, length in outputs[state]:
+                    matches.append(Match(names[idx], starts[-length], m.end()))
+        return matches
+
+    # -----------------------------
+    # Dispatch
+    # -----------------------------
+    def compiled(self, name: str) -> dict:
+        """AST, Python and bytecode for a mantra, built on first use."""
+        entry = self._compiled.get(name)
+        if entry is None:
+            ast = self._factories[name]()
+            bytecode, constants = compile_to_bytecode(ast)
+            entry = {
+                "ast": ast,
+                "python": transpile_ast(ast),
+                "bytecode": bytecode,
+                # same constant inversion as interpret_ast
+                "constants": {v: k for k, v in constants.items()},
+            }
+            self._compiled[name] = entry
+        return entry
+
+    def run(self, name: str, env: Optional[dict] = None, max_steps: int = MAX_STEPS) -> List[str]:
+        entry = self.compiled(name)
+        return execute_bytecode(entry["bytecode"], entry["constants"], env, max_steps)
+
+    def dispatch(self, text: str) -> List[Tuple[Match, List[str]]]:
+        return [(m, self.run(m.name)) for m in self.recognize(text)]
+
+
+_DEFAULT: Optional[MantraRegistry] = None
+
+
+def default_registry() -> MantraRegistry:
+    global _DEFAULT
+    if _DEFAULT is None:
+        from .mantras import chant_to_ast, mantra_texts
+        registry = MantraRegistry()
+        for name, factory in chant_to_ast.items():
+            registry.register(name, mantra_texts.get(name, [name]), factory)
+        _DEFAULT = registry
+    return _DEFAULT
@@ -0,0 +1,188 @@
+# Sandhi rule engine (IAST transliteration)
+# The rules behind SANDHI_RULES and the sandhi sutras of PANINI_CONCEPTS are
+# compiled once into a longest-match junction table:
+#   (end of left word, start of right word) -> replacement
+# Joining tries the longest left/right contexts first; frequent junctions are
+# memoized. Splitting looks rule outputs up in a reverse table and keeps the
+# candidates that join back to the original word.
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .pratyahara import members
+
+VOWELS = ["a", "ā", "i", "ī", "u", "ū", "ṛ", "ṝ", "ḷ", "e", "ai", "o", "au"]
+CONSONANTS = members("hal")
+VOICED = members("haś")
+SAVARNA = [("a", "ā"), ("i", "ī"), ("u", "ū"), ("ṛ", "ṝ")]   # short/long pairs of the same vowel
+JUNCTION_CACHE_SIZE = 65536
+
+
+class Rule(NamedTuple):
+    left: str       # consumed from the end of the left word
+    right: str      # consumed from the start of the right word
+    output: str     # written in their place
+    sutra: str
+
+
+# what split() reports for a junction where the words simply run together
+NO_RULE = Rule("", "", "", "no sandhi")
+
+
+def _rules() -> List[Rule]:
+    rules = []
+    # 6.1.101 akaḥ savarṇe dīrghaḥ — same vowels combine to the long vowel
+    for short, long_ in SAVARNA:
+        for x in (short, long_):
+            for y in (short, long_):
+                rules.append(Rule(x, y, long_, "6.1.101"))
+    for a in ("a", "ā"):
+        # 6.1.87 ād guṇaḥ — a + i/u/ṛ/ḷ = e/o/ar/al
+        for right, out in (("i", "e"), ("ī", "e"), ("u", "o"), ("ū", "o"), ("ṛ", "ar"), ("ṝ", "ar"), ("ḷ", "al")):
+            rules.append(Rule(a, right, out, "6.1.87"))
+        # 6.1.88 vṛddhir eci — a + e/ai = ai, a + o/au = au (vṛddhi vowels of 1.1.1)
+        for right, out in (("e", "ai"), ("ai", "ai"), ("o", "au"), ("au", "au")):
+            rules.append(Rule(a, right, out, "6.1.88"))
+    # 6.1.109 eṅaḥ padāntād ati — word-final e/o absorb a following a: e '/o '
+    for ec in ("e", "o"):
+        rules.append(Rule(ec, "a", ec + " '", "6.1.109"))
+    # 6.1.78 eco 'yavāyāvaḥ — e/o/ai/au become ay/av/āy/āv before a vowel.
+    # ai/au are single vowels: as two-letter left contexts they win the
+    # longest match, so their trailing i/u never reaches 6.1.77 below.
+    for ec, out in (("e", "ay"), ("o", "av"), ("ai", "āy"), ("au", "āv")):
+        for v in VOWELS:
+            rules.append(Rule(ec, v, out + v, "6.1.78"))
+    # 6.1.77 iko yaṇaci — i/u/ṛ/ḷ become y/v/r/l before a dissimilar vowel,
+    # paired in order (1.3.10 yathāsaṅkhyam)
+    long_of = dict(SAVARNA)
+    for short, yan in zip(members("ik"), members("yaṇ")):
+        same = (short, long_of[short]) if short in long_of else (short,)
+        for ik in same:
+            for v in VOWELS:
+                if v not in same:
+                    rules.append(Rule(ik, v, yan + v, "6.1.77"))
+    # 8.3.23 mo 'nusvāraḥ — final m before a consonant becomes anusvāra
+    for c in CONSONANTS:
+        rules.append(Rule("m", c, "ṃ" + c, "8.3.23"))
+    # visarga: aḥ + a = o ', aḥ + voiced consonant = o, aḥ + c = aś c
+    rules.append(Rule("aḥ", "a", "o '", "visarga"))
+    for c in VOICED:
+        rules.append(Rule("aḥ", c, "o " + c, "visarga"))
+    for c in ("c", "ch"):
+        rules.append(Rule("aḥ", c, "aś " + c, "visarga"))
+    # consonant: t + c = cc, t + n = nn
+    for c in ("c", "ch"):
+        rules.append(Rule("t", c, "c" + c, "consonant"))
+    rules.append(Rule("t", "n", "nn", "consonant"))
+    return rules
+
+
+RULES = _rules()
+
+
+class SandhiEngine:
+    def __init__(self, rules: Iterable[Rule] = RULES, cache_size: int = JUNCTION_CACHE_SIZE):
+        self.rules = list(rules)
+        self.table: Dict[Tuple[str, str], Rule] = {}
+        self.reverse: Dict[str, List[Rule]] = {}
+        for rule in self.rules:
+            self.table.setdefault((rule.left, rule.right), rule)
+            self.reverse.setdefault(rule.output, []).append(rule)
+        self.max_left = max((len(r.left) for r in self.rules), default=0)
+        self.max_right = max((len(r.right) for r in self.rules), default=0)
+        self.max_output = max((len(r.output) for r in self.rules), default=0)
+        self.junction = lru_cache(maxsize=cache_size)(self._junction)
+
+    def _junction(self, tail: str, head: str) -> Optional[Rule]:
+        # longest left context first, then longest right context
+        for i in range(min(len(tail), self.max_left), 0, -1):
+            for j in range(min(len(head), self.max_right), 0, -1):
+                rule = self.table.get((tail[-i:], head[:j]))
+                if rule is not None:
+                    return rule
+        return None
+
+    # -----------------------------
+    # Joining
+    # -----------------------------
+    def join(self, left: str, right: str) -> str:
+        return self._join(unicodedata.normalize("NFC", left), unicodedata.normalize("NFC", right))
+
+    def _join(self, left: str, right: str) -> str:
+        rule = self.junction(left[-self.max_left:], right[:self.max_right])
+        if rule is None:
+            return left + right
+        return left[:len(left) - len(rule.left)] + rule.output + right[len(rule.right):]
+
+    def explain(self, left: str, right: str) -> Optional[Rule]:
+        left = unicodedata.normalize("NFC", left)
+        right = unicodedata.normalize("NFC", right)
+        return self.junction(left[-self.max_left:], right[:self.max_right])
+
+    def join_words(self, words: Iterable[str]) -> str:
+        out = ""
+        for word in words:
+            word = unicodedata.normalize("NFC", word)
+            out = self._join(out, word) if out else word
+        return out
+
+    def join_stream(self, lines: Iterable[str], sep: str = "+") -> Iterator[str]:
+        """Join each line of `sep`-separated words ("deva + indra"), lazily, for whole corpora."""
+        for line in lines:
+            words = [w.strip() for w in line.split(sep)]
+            yield self.join_words(w for w in words if w)
+
+    # -----------------------------
+    # Splitting
+    # -----------------------------
+    def split(self, word: str, known: Optional[Set[str]] = None) -> List[Tuple[str, str, Rule]]:
+        """
+        Candidate (left, right, rule) splits of `word` that join back to it.
+        With `known`, both halves must be in that vocabulary, and plain
+        concatenations with no sandhi at the junction come back with NO_RULE.
+        """
+        word = unicodedata.normalize("NFC", word)
+        out = []
+        seen = set()
+        for i in range(1, len(word)):
+            if known is not None:
+                # a junction no rule touches: the words just run together
+                left, right = word[:i], word[i:]
+                seen.add((left, right))
+                if left in known and right in known and self._join(left, right) == word:
+                    out.append((left, right, NO_RULE))
+            for k in range(1, min(self.max_output, len(word) - i) + 1):
+                for rule in self.reverse.get(word[i:i + k], ()):
+                    left = word[:i] + rule.left
+                    right = rule.right + word[i + k:]
+                    if (left, right) in seen or not right.strip():
+                        continue
+                    seen.add((left, right))
+                    if known is not None and (left not in known or right not in known):
+                        continue
+                    if self._join(left, right) == word:
+                        out.append((left, right, rule))
+        return out
+
+    def split_stream(self, words: Iterable[str], known: Optional[Set[str]] = None) -> Iterator[Tuple[str, list]]:
+        for word in words:
+            yield word, self.split(word, known)
+
+
+_DEFAULT: Optional[SandhiEngine] = None
+
+
+def default_engine() -> SandhiEngine:
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = SandhiEngine()
+    return _DEFAULT
+
+
+def join(left: str, right: str) -> str:
+    return default_engine().join(left, right)
+
+
+def split(word: str, known: Optional[Set[str]] = None) -> List[Tuple[str, str, Rule]]:
+    return default_engine().split(word, known)
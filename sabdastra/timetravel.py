@@ -0,0 +1,258 @@
+# Time-travel recording for the bytecode VM
+# record_execution() runs bytecode like execute_bytecode but logs, per
+# instruction, only what is needed to undo it: the pc and the ids of the
+# values it popped (plus, for STORE_VAR, the binding it overwrote). Values
+# are interned, so the log is three flat array('I') buffers (about 12-16
+# bytes per instruction). Every `checkpoint_every` steps a full copy of
+# env/stack is kept. Any step is rebuilt from the nearest checkpoint:
+# forwards by re-executing (the VM is deterministic), or backwards by
+# undoing logged pops from the checkpoint above.
+
+import operator
+import sys
+from array import array
+from typing import Dict, List, NamedTuple
+
+from .vm import MAX_STEPS, OP_CODES, OP_NAMES, compile_to_bytecode
+
+CHECKPOINT_EVERY = 1024
+
+_LOAD_CONST = OP_CODES['LOAD_CONST']
+_LOAD_VAR = OP_CODES['LOAD_VAR']
+_STORE_VAR = OP_CODES['STORE_VAR']
+_PRINT = OP_CODES['PRINT']
+_JUMP_IF_FALSE = OP_CODES['JUMP_IF_FALSE']
+_JUMP = OP_CODES['JUMP']
+_NEG = OP_CODES['NEG']
+BINARY = {
+    OP_CODES['ADD']: operator.add,
+    OP_CODES['SUB']: operator.sub,
+    OP_CODES['MUL']: operator.mul,
+    OP_CODES['DIV']: operator.truediv,
+    OP_CODES['LT']: operator.lt,
+    OP_CODES['GT']: operator.gt,
+    OP_CODES['EQ']: operator.eq,
+    OP_CODES['NE']: operator.ne,
+}
+_PUSHES = {_LOAD_CONST: 1, _LOAD_VAR: 1, _NEG: 1, **{code: 1 for code in BINARY}}
+_UNBOUND = object()  # value id 0: STORE_VAR into a name that was not set
+
+
+class Frame(NamedTuple):
+    step: int          # instructions executed so far
+    pc: int
+    env: Dict[str, object]
+    stack: List[object]
+    output_len: int    # lines printed so far (prefix of Recording.output)
+
+
+class Recording:
+    def __init__(self, bytecode, constants, checkpoint_every: int = CHECKPOINT_EVERY):
+        self.bytecode = bytecode
+        self.const_list = [constants[i] for i in range(len(constants))]
+        self.checkpoint_every = checkpoint_every
+        self.pcs = array("I")       # pc of the instruction run at each step
+        self.pop_end = array("I")   # end offset into `popped` after each step
+        self.popped = array("I")    # value ids, in stack order (STORE_VAR: old binding, value)
+        self.values: List[object] = [_UNBOUND]
+        self._ids: Dict[type, Dict[object, int]] = {}
+        self.checkpoints: List[Frame] = []
+        self.output: List[str] = []
+        self.finished = False
+
+    def __len__(self) -> int:
+        return len(self.pcs)
+
+    def _intern(self, value) -> int:
+        # keyed by type as well: 1, 1.0 and True are equal dict keys
+        ids = self._ids.get(type(value))
+        if ids is None:
+            ids = self._ids[type(value)] = {}
+        vid = ids.get(value)
+        if vid is None:
+            vid = ids[value] = len(self.values)
+            self.values.append(value)
+        return vid
+
+    # -----------------------------
+    # Execution (recording or replay)
+    # -----------------------------
+    def _run(self, pc, env, stack, output, limit, record):
+        bytecode = self.bytecode
+        const_list = self.const_list
+        end = len(bytecode)
+        if record:
+            pcs_append = self.pcs.append
+            pop_end_append = self.pop_end.append
+            popped = self.popped
+            push_id = popped.append
+            intern = self._intern
+            every = self.checkpoint_every
+        steps = 0
+        while pc < end and steps < limit:
+            if record:
+                if steps % every == 0:
+                    self.checkpoints.append(Frame(steps, pc, dict(env), list(stack), len(output)))
+                pcs_append(pc)
+            op = bytecode[pc]
+            code = op[0]
+            pc += 1
+            steps += 1
+            if code == _LOAD_CONST:
+                stack.append(const_list[op[1]])
+            elif code == _LOAD_VAR:
+                stack.append(env.get(op[1], 0))
+            elif code == _STORE_VAR:
+                value = stack.pop()
+                if record:
+                    push_id(intern(env[op[1]]) if op[1] in env else 0)
+                    push_id(intern(value))
+                env[op[1]] = value
+            elif code in BINARY:
+                b = stack.pop()
+                a = stack.pop()
+                if record:
+                    push_id(intern(a))
+                    push_id(intern(b))
+                stack.append(BINARY[code](a, b))
+            elif code == _NEG:
+                value = stack.pop()
+                if record:
+                    push_id(intern(value))
+                stack.append(-value)
+            elif code == _PRINT:
+                value = stack.pop()
+                if record:
+                    push_id(intern(value))
+                output.append(str(value))
+            elif code == _JUMP_IF_FALSE:
+                value = stack.pop()
+                if record:
+                    push_id(intern(value))
+                if not value:
+                    pc = op[1]
+            elif code == _JUMP:
+                pc = op[1]
+            if record:
+                pop_end_append(len(popped))
+        return pc, steps
+
+    def _undo(self, step: int, env, stack) -> int:
+        """Undo instruction `step` in place; returns its pc."""
+        pc = self.pcs[step]
+        op = self.bytecode[pc]
+        start = self.pop_end[step - 1] if step else 0
+        ids = self.popped[start:self.pop_end[step]]
+        pushes = _PUSHES.get(op[0], 0)
+        if pushes:
+            del stack[-pushes:]
+        if op[0] == _STORE_VAR:
+            old = ids[0]
+            if old:
+                env[op[1]] = self.values[old]
+            else:
+                env.pop(op[1], None)
+            stack.append(self.values[ids[1]])
+        else:
+            stack.extend(self.values[i] for i in ids)
+        return pc
+
+    # -----------------------------
+    # Seeking
+    # -----------------------------
+    def state(self, step: int) -> Frame:
+        """Machine state after `step` instructions (0 = start, len(self) = end)."""
+        step = max(0, min(step, len(self)))
+        k = min(step // self.checkpoint_every, len(self.checkpoints) - 1)
+        below = self.checkpoints[k]
+        above = self.checkpoints[k + 1] if k + 1 < len(self.checkpoints) else None
+        if above is not None and above.step - step < step - below.step:
+            env, stack = dict(above.env), list(above.stack)
+            out = above.output_len
+            pc = above.pc
+            for s in range(above.step - 1, step - 1, -1):
+                if self.bytecode[self.pcs[s]][0] == _PRINT:
+                    out -= 1
+                pc = self._undo(s, env, stack)
+            return Frame(step, pc, env, stack, out)
+        env, stack, printed = dict(below.env), list(below.stack), []
+        pc, _ = self._run(below.pc, env, stack, printed, step - below.step, record=False)
+        return Frame(step, pc, env, stack, below.output_len + len(printed))
+
+    def instruction(self, pc: int) -> str:
+        if pc >= len(self.bytecode):
+            return "(end)"
+        op = self.bytecode[pc]
+        if op[0] == _LOAD_CONST:
+            return f"LOAD_CONST {op[1]} ({self.const_list[op[1]]!r})"
+        return f"{OP_NAMES.get(op[0], op[0])} {' '.join(map(str, op[1:]))}".rstrip()
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the log, value table and checkpoints."""
+        size = sum(a.buffer_info()[1] * a.itemsize for a in (self.pcs, self.pop_end, self.popped))
+        size += sys.getsizeof(self.values) + sum(sys.getsizeof(v) for v in self.values)
+        for frame in self.checkpoints:
+            size += sys.getsizeof(frame.env) + sys.getsizeof(frame.stack)
+        return size
+
+
+def record_execution(bytecode, constants, env=None, checkpoint_every: int = CHECKPOINT_EVERY,
+                     max_steps: int = MAX_STEPS) -> Recording:
+    """Run like execute_bytecode (same constants map: id -> value), recording every step."""
+    rec = Recording(bytecode, constants, checkpoint_every)
+    env = {} if env is None else env
+    stack: List[object] = []
+    pc, _ = rec._run(0, env, stack, rec.output, max_steps, record=True)
+    rec.finished = pc >= len(bytecode)
+    # final state as the last checkpoint, so late steps can be reached backwards
+    rec.checkpoints.append(Frame(len(rec), pc, dict(env), list(stack), len(rec.output)))
+    return rec
+
+
+class Cursor:
+    """A position in a Recording; single steps are O(1), jumps go through checkpoints."""
+
+    def __init__(self, recording: Recording):
+        self.recording = recording
+        self.frame = recording.state(0)
+
+    @property
+    def step(self) -> int:
+        return self.frame.step
+
+    def forward(self) -> Frame:
+        rec, f = self.recording, self.frame
+        if f.step < len(rec):
+            printed: List[str] = []
+            pc, _ = rec._run(f.pc, f.env, f.stack, printed, 1, record=False)
+            self.frame = Frame(f.step + 1, pc, f.env, f.stack, f.output_len + len(printed))
+        return self.frame
+
+    def back(self) -> Frame:
+        rec, f = self.recording, self.frame
+        if f.step > 0:
+            s = f.step - 1
+            out = f.output_len - (rec.bytecode[rec.pcs[s]][0] == _PRINT)
+            pc = rec._undo(s, f.env, f.stack)
+            self.frame = Frame(s, pc, f.env, f.stack, out)
+        return self.frame
+
+    def seek(self, step: int) -> Frame:
+        step = max(0, min(step, len(self.recording)))
+        # walking is cheaper than a checkpoint rebuild only for short hops
+        if abs(step - self.frame.step) * 2 <= self.recording.checkpoint_every:
+            while self.frame.step < step:
+                self.forward()
+            while self.frame.step > step:
+                self.back()
+        else:
+            self.frame = self.recording.state(step)
+        return self.frame
+
+    def output(self) -> List[str]:
+        return self.recording.output[:self.frame.output_len]
+
+
+def record_ast(ast, env=None, **kwargs) -> Recording:
+    bytecode, constants = compile_to_bytecode(ast)
+    return record_execution(bytecode, {v: k for k, v in constants.items()}, env, **kwargs)
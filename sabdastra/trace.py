@@ -0,0 +1,318 @@
+# Stage tracing: spans, counters and histograms
+# Off by default. While disabled, a @traced function costs one flag check and
+# span() hands back a shared no-op context manager, so the core pipeline can
+# stay instrumented permanently. When enabled, every finished span updates a
+# duration histogram, the "latest" table and a ring of recent spans, and is
+# passed to the registered exporters (JSON lines file, Prometheus text).
+#
+#   SABDASTRA_TRACE=1                    record in memory only
+#   SABDASTRA_TRACE=jsonl:trace.jsonl    also append each span to a file
+#   SABDASTRA_TRACE=prometheus:9464      also serve /metrics on localhost
+#
+# Importing this module never reads the variable; the app and the CLI pass it
+# to configure() themselves, so library users, benchmarks and worker processes
+# don't open files or bind ports behind their back.
+
+import bisect
+import functools
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, TextIO, Tuple
+
+# upper bounds in seconds, Prometheus style (+Inf is implied)
+BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+RECENT_SPANS = 256
+
+_enabled = False
+_LOCK = threading.Lock()
+_local = threading.local()
+
+
+class Span(NamedTuple):
+    name: str
+    start: float        # wall clock, seconds since the epoch
+    duration: float     # seconds
+    parent: Optional[str]
+    error: Optional[str]
+    attrs: dict
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation."""
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            seen += n
+            if seen >= rank and n:
+                return bound
+        return 0.0
+
+
+COUNTERS: Dict[str, float] = {}
+HISTOGRAMS: Dict[str, Histogram] = {}
+LATEST: Dict[str, Span] = {}
+RECENT: Deque[Span] = deque(maxlen=RECENT_SPANS)
+_EXPORTERS: List[Callable[[Span], None]] = []
+
+
+# -----------------------------
+# Switch
+# -----------------------------
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    with _LOCK:
+        COUNTERS.clear()
+        HISTOGRAMS.clear()
+        LATEST.clear()
+        RECENT.clear()
+
+
+# -----------------------------
+# Recording
+# -----------------------------
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("name", "attrs", "parent", "wall", "t0")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.parent = stack[-1] if stack else None
+        stack.append(self.name)
+        self.wall = time.time()
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.t0
+        _local.stack.pop()
+        error = exc_type.__name__ if exc_type is not None else None
+        _record(Span(self.name, self.wall, duration, self.parent, error, self.attrs))
+        return False
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+
+def _record(span: Span) -> None:
+    with _LOCK:
+        hist = HISTOGRAMS.get(span.name)
+        if hist is None:
+            hist = HISTOGRAMS[span.name] = Histogram()
+        hist.observe(span.duration)
+        if span.error:
+            COUNTERS[f"{span.name}.errors"] = COUNTERS.get(f"{span.name}.errors", 0) + 1
+        LATEST[span.name] = span
+        RECENT.append(span)
+        exporters = list(_EXPORTERS)
+    for export in exporters:
+        export(span)
+
+
+def span(name: str, **attrs):
+    """`with span("render.graphviz"):` — times the block when tracing is on."""
+    if not _enabled:
+        return _NOOP
+    return _ActiveSpan(name, attrs)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: run the function inside a span named `name` (default: its __name__)."""
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _ActiveSpan(span_name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def incr(name: str, value: float = 1) -> None:
+    if _enabled:
+        with _LOCK:
+            COUNTERS[name] = COUNTERS.get(name, 0) + value
+
+
+def observe(name: str, value: float) -> None:
+    if _enabled:
+        with _LOCK:
+            hist = HISTOGRAMS.get(name)
+            if hist is None:
+                hist = HISTOGRAMS[name] = Histogram()
+            hist.observe(value)
+
+
+def latest_rows() -> List[dict]:
+    """Most recent duration and running totals per span name, for display."""
+    with _LOCK:
+        return [
+            {"span": name, "last_ms": s.duration * 1000, "parent": s.parent or "",
+             "calls": HISTOGRAMS[name].count, "mean_ms": HISTOGRAMS[name].sum / HISTOGRAMS[name].count * 1000,
+             "p95_le_ms": HISTOGRAMS[name].quantile(0.95) * 1000, "error": s.error or ""}
+            for name, s in sorted(LATEST.items(), key=lambda kv: kv[1].start)
+        ]
+
+
+# -----------------------------
+# Exporters
+# -----------------------------
+def add_exporter(export: Callable[[Span], None]) -> None:
+    with _LOCK:
+        _EXPORTERS.append(export)
+
+
+def remove_exporter(export: Callable[[Span], None]) -> None:
+    with _LOCK:
+        if export in _EXPORTERS:
+            _EXPORTERS.remove(export)
+
+
+class JsonLinesExporter:
+    """Append one JSON object per finished span to a file or text stream."""
+
+    def __init__(self, target):
+        import json
+        self._dumps = json.dumps
+        self._own = isinstance(target, str)
+        self._out: TextIO = open(target, "a", encoding="utf-8", buffering=1) if self._own else target
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        line = self._dumps({
+            "name": span.name, "start": span.start, "duration_ms": span.duration * 1000,
+            "parent": span.parent, "error": span.error, **span.attrs,
+        }, default=str)
+        with self._lock:
+            self._out.write(line + "\n")
+
+    def close(self) -> None:
+        remove_exporter(self)
+        if self._own:
+            self._out.close()
+
+
+def _metric_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+def prometheus_text() -> str:
+    """Counters and span histograms in the Prometheus text exposition format."""
+    lines = []
+    with _LOCK:
+        for name, value in sorted(COUNTERS.items()):
+            metric = f"sabdastra_{_metric_name(name)}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value:g}"]
+        if HISTOGRAMS:
+            lines.append("# TYPE sabdastra_span_seconds histogram")
+        for name, hist in sorted(HISTOGRAMS.items()):
+            cumulative = 0
+            for bound, n in zip(hist.buckets + (float("inf"),), hist.counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'sabdastra_span_seconds_bucket{{span="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'sabdastra_span_seconds_sum{{span="{name}"}} {hist.sum:.9f}')
+            lines.append(f'sabdastra_span_seconds_count{{span="{name}"}} {hist.count}')
+    return "\n".join(lines) + "\n"
+
+
+def serve_prometheus(port: int = 9464, host: str = "127.0.0.1"):
+    """Serve prometheus_text() at /metrics from a daemon thread; returns the server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="sabdastra-metrics", daemon=True).start()
+    return server
+
+
+_configured: Optional[str] = None
+
+
+def configure(spec: str) -> None:
+    """
+    Apply a SABDASTRA_TRACE value: "1", "jsonl:<path>" or "prometheus:<port>".
+    Entry points (app.py, the CLI) call this once at startup; a repeated spec is
+    ignored, and a bad one is logged and leaves tracing off.
+    """
+    global _configured
+    spec = spec.strip()
+    if not spec or spec == "0" or spec == _configured:
+        return
+    kind, _, arg = spec.partition(":")
+    try:
+        if kind == "jsonl":
+            add_exporter(JsonLinesExporter(arg or "trace.jsonl"))
+        elif kind == "prometheus":
+            serve_prometheus(int(arg or 9464))
+        elif kind not in ("1", "memory"):
+            raise ValueError("expected 1, jsonl:<path> or prometheus:<port>")
+    except (OSError, ValueError) as e:
+        import logging
+        logging.getLogger(__name__).warning("Ignoring SABDASTRA_TRACE=%r, tracing stays off: %s", spec, e)
+        return
+    _configured = spec
+    enable()
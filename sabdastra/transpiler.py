@@ -0,0 +1,45 @@
+# transpiler
+from .trace import traced
+
+
+def transpile_body(body, indent):
+    lines = transpile_lines(body, indent)
+    if all(line.lstrip().startswith("#") for line in lines):  # empty, or only bhāva comments
+        lines.append("    " * indent + "pass")
+    return lines
+
+
+def transpile_lines(ast, indent=0):
+    py = []
+    sp = "    " * indent
+    for node in ast:
+        if node['type'] == 'bhava_block':  # Upgrade 2
+            # a bhāva colours its body but opens no Python scope
+            py.append(f"{sp}# Bhāva: {node['bhava']}")
+            py += transpile_lines(node['body'], indent)
+        elif node['type'] == 'function_def':
+            py.append(f"{sp}def {node['name']}({', '.join(node['args'])}):")
+            py += transpile_body(node['body'], indent + 1)
+        elif node['type'] == 'if':
+            py.append(f"{sp}if {node['test']}:")
+            py += transpile_body(node['body'], indent + 1)
+            if node['orelse']:
+                py.append(f"{sp}else:")
+                py += transpile_body(node['orelse'], indent + 1)
+        elif node['type'] == 'for':
+            py.append(f"{sp}for {node['var']} in range({node['iter']}):")  # Assume numeric range for demo
+            py += transpile_body(node['body'], indent + 1)
+        elif node['type'] == 'while':
+            py.append(f"{sp}while {node['test']}:")
+            py += transpile_body(node['body'], indent + 1)
+        elif node['type'] == 'print':
+            py.append(f"{sp}print({node['value']})")
+        elif node['type'] == 'assign':
+            py.append(f"{sp}{node['target']} = {node['value']}")
+        elif node['type'] == 'call':
+            py.append(f"{sp}{node['expr']}()")  # Assume no args for simplicity
+    return py
+
+@traced()
+def transpile_ast(ast):
+    return "\n".join(transpile_lines(ast))
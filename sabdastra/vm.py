@@ -0,0 +1,222 @@
+# Bytecode optimization
+import re
+
+from .trace import traced
+
+OP_CODES = {
+    'LOAD_CONST': 1,
+    'LOAD_VAR': 2,
+    'STORE_VAR': 3,
+    'PRINT': 4,
+    'JUMP_IF_FALSE': 5,
+    'JUMP': 6,
+    'CALL': 7,
+    'RETURN': 8,
+    'ADD': 9,
+    'LOOP_START': 10,
+    'LOOP_END': 11,
+    'SUB': 12,
+    'MUL': 13,
+    'DIV': 14,
+    'LT': 15,
+    'GT': 16,
+    'EQ': 17,
+    'NE': 18,
+    'NEG': 19,
+    # Add more as needed
+}
+OP_NAMES = {code: name for name, code in OP_CODES.items()}
+
+# binary operators, lowest precedence first; each level is left-associative
+PRECEDENCE = [
+    {'<': 'LT', '>': 'GT', '==': 'EQ', '!=': 'NE'},
+    {'+': 'ADD', '-': 'SUB'},
+    {'*': 'MUL', '/': 'DIV'},
+]
+UNARY = {'-': 'NEG', '+': None}  # unary plus compiles to nothing
+OPERATORS = {op for level in PRECEDENCE for op in level}
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+EXPR_TOKEN = re.compile(r"'[^']*'|==|!=|[<>+\-*/]|[^\s'=!<>+\-*/]+")
+MAX_STEPS = 10_000_000  # instruction budget per run: `yatra` loops may never end
+
+
+class StepLimitExceeded(RuntimeError):
+    """A run used up its instruction budget; `output` holds what it printed so far."""
+
+    def __init__(self, max_steps, output):
+        super().__init__(f"Step limit exceeded: {max_steps:,} instructions without finishing "
+                         f"(a yatra loop that never ends?)")
+        self.output = output
+
+
+@traced()
+def compile_to_bytecode(ast):
+    bytecode = []
+    constants = {}  # Constant folding
+    def load_const(value):
+        const_id = constants.setdefault(value, len(constants))
+        bytecode.append((OP_CODES['LOAD_CONST'], const_id))
+
+    def compile_node(node):
+        if node['type'] == 'print':
+            compile_expr(node['value'])
+            bytecode.append((OP_CODES['PRINT'],))
+        elif node['type'] == 'assign':
+            compile_expr(node['value'])
+            bytecode.append((OP_CODES['STORE_VAR'], node['target']))
+        elif node['type'] == 'if':
+            compile_expr(node['test'])
+            jump_false_idx = len(bytecode)
+            bytecode.append((OP_CODES['JUMP_IF_FALSE'], 0))  # Placeholder
+            compile_body(node['body'])
+            jump_idx = len(bytecode)
+            bytecode.append((OP_CODES['JUMP'], 0))  # Placeholder
+            bytecode[jump_false_idx] = (OP_CODES['JUMP_IF_FALSE'], len(bytecode))
+            compile_body(node['orelse'])
+            bytecode[jump_idx] = (OP_CODES['JUMP'], len(bytecode))
+        elif node['type'] == 'for':
+            # like Python's range(): the bound is evaluated once, and var is
+            # set from a hidden counter only when an iteration starts, so it
+            # keeps its last value (or stays unset) after the loop
+            counter = f"{node['var']}#{len(bytecode)}"  # '#' cannot appear in a name
+            bound = counter + ":bound"
+            compile_expr(node['iter'])
+            bytecode.append((OP_CODES['STORE_VAR'], bound))
+            load_const(0)
+            bytecode.append((OP_CODES['STORE_VAR'], counter))
+            loop_start = len(bytecode)
+            bytecode.append((OP_CODES['LOAD_VAR'], counter))
+            bytecode.append((OP_CODES['LOAD_VAR'], bound))
+            bytecode.append((OP_CODES['LT'],))
+            jump_false_idx = len(bytecode)
+            bytecode.append((OP_CODES['JUMP_IF_FALSE'], 0))  # Placeholder for end
+            bytecode.append((OP_CODES['LOAD_VAR'], counter))
+            bytecode.append((OP_CODES['STORE_VAR'], node['var']))
+            compile_body(node['body'])
+            bytecode.append((OP_CODES['LOAD_VAR'], counter))
+            load_const(1)
+            bytecode.append((OP_CODES['ADD'],))
+            bytecode.append((OP_CODES['STORE_VAR'], counter))
+            bytecode.append((OP_CODES['JUMP'], loop_start))
+            bytecode[jump_false_idx] = (OP_CODES['JUMP_IF_FALSE'], len(bytecode))
+        elif node['type'] == 'while':
+            loop_start = len(bytecode)
+            compile_expr(node['test'])
+            jump_false_idx = len(bytecode)
+            bytecode.append((OP_CODES['JUMP_IF_FALSE'], 0))  # Placeholder for end
+            compile_body(node['body'])
+            bytecode.append((OP_CODES['JUMP'], loop_start))
+            bytecode[jump_false_idx] = (OP_CODES['JUMP_IF_FALSE'], len(bytecode))
+        # Add similar for function_def, etc.
+        # For bhava_block, just compile body
+        elif node['type'] == 'bhava_block':
+            compile_body(node['body'])
+        # ... expand for other nodes
+
+    def compile_body(body):
+        for subnode in body:
+            compile_node(subnode)
+
+    def compile_expr(expr):
+        compile_tokens(EXPR_TOKEN.findall(expr), expr)
+
+    def compile_tokens(toks, expr):
+        # split at the last operator of the lowest precedence level present;
+        # an operator right after another one (or first) is unary, not binary
+        for level in PRECEDENCE:
+            for i in range(len(toks) - 1, 0, -1):
+                if toks[i] in level and toks[i - 1] not in OPERATORS:
+                    compile_tokens(toks[:i], expr)
+                    compile_tokens(toks[i + 1:], expr)
+                    bytecode.append((OP_CODES[level[toks[i]]],))
+                    return
+        if not toks:
+            raise ValueError(f"Missing operand in expression: {expr!r}")
+        if toks[0] in UNARY and len(toks) > 1:
+            compile_tokens(toks[1:], expr)
+            if UNARY[toks[0]]:
+                bytecode.append((OP_CODES[UNARY[toks[0]]],))
+            return
+        if len(toks) > 1:
+            raise ValueError(f"Malformed expression: {expr!r}")
+        atom = toks[0]
+        if atom.isdigit():
+            load_const(int(atom))
+        elif len(atom) >= 2 and atom[0] == atom[-1] == "'":
+            load_const(atom[1:-1])
+        elif IDENTIFIER.fullmatch(atom):
+            bytecode.append((OP_CODES['LOAD_VAR'], atom))
+        else:
+            raise ValueError(f"Invalid operand {atom!r} in expression: {expr!r}")
+
+    compile_body(ast)
+    return bytecode, constants
+
+@traced()
+def execute_bytecode(bytecode, constants, env=None, max_steps=MAX_STEPS):
+    if env is None:
+        env = {}
+    stack = []
+    pc = 0
+    output = []
+    const_list = [constants[i] for i in range(len(constants))]  # id -> value, for fast lookup
+    steps = 0
+    while pc < len(bytecode):
+        steps += 1
+        if steps > max_steps:
+            raise StepLimitExceeded(max_steps, output)
+        op = bytecode[pc]
+        pc += 1
+        if op[0] == OP_CODES['LOAD_CONST']:
+            stack.append(const_list[op[1]])
+        elif op[0] == OP_CODES['LOAD_VAR']:
+            stack.append(env.get(op[1], 0))
+        elif op[0] == OP_CODES['STORE_VAR']:
+            env[op[1]] = stack.pop()
+        elif op[0] == OP_CODES['PRINT']:
+            output.append(str(stack.pop()))
+        elif op[0] == OP_CODES['JUMP_IF_FALSE']:
+            if not stack.pop():
+                pc = op[1]
+        elif op[0] == OP_CODES['JUMP']:
+            pc = op[1]
+        elif op[0] == OP_CODES['ADD']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a + b)
+        elif op[0] == OP_CODES['SUB']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a - b)
+        elif op[0] == OP_CODES['MUL']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a * b)
+        elif op[0] == OP_CODES['DIV']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a / b)
+        elif op[0] == OP_CODES['LT']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a < b)
+        elif op[0] == OP_CODES['GT']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a > b)
+        elif op[0] == OP_CODES['EQ']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a == b)
+        elif op[0] == OP_CODES['NE']:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(a != b)
+        elif op[0] == OP_CODES['NEG']:
+            stack.append(-stack.pop())
+        # Add handlers for more ops
+    return output
+
+def interpret_ast(ast, env=None, max_steps=MAX_STEPS):
+    bytecode, constants = compile_to_bytecode(ast)
+    return execute_bytecode(bytecode, {v: k for k, v in constants.items()}, env, max_steps)  # Invert for lookup
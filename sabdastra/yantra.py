@@ -0,0 +1,128 @@
+# yantra geometry + headless renderer
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+
+RENDER_CACHE_SIZE = 64    # rendered images kept per process
+CIRCLE_SEGMENTS = 256     # points used to approximate a circle
+MARGIN = 1.1              # axes extent as a multiple of the drawing's outer radius
+PETAL_SEGMENTS = 32       # points per petal edge
+
+
+# -----------------------------
+# 1. Geometry (vertex arrays)
+# -----------------------------
+def triangle_vertices(count: int = 4, base_radius: float = 1.0, step: float = 0.2) -> np.ndarray:
+    """
+    Closed triangles, each rotated by pi/4 and grown by `step`.
+    Shape: (count, 4, 2)
+    """
+    theta = np.linspace(0, 2 * np.pi, 4)[None, :] + (np.arange(count) * np.pi / 4)[:, None]
+    r = (base_radius + np.arange(count) * step)[:, None]
+    return np.stack([r * np.cos(theta), r * np.sin(theta)], axis=-1)
+
+
+def circle_vertices(radii: Iterable[float], segments: int = CIRCLE_SEGMENTS) -> np.ndarray:
+    """
+    Concentric circles. Shape: (len(radii), segments, 2)
+    """
+    radii = np.asarray(list(radii), dtype=float)[:, None]
+    theta = np.linspace(0, 2 * np.pi, segments)[None, :]
+    return np.stack([radii * np.cos(theta), radii * np.sin(theta)], axis=-1)
+
+
+def petal_vertices(count: int, inner: float, outer: float, segments: int = PETAL_SEGMENTS) -> np.ndarray:
+    """
+    Lotus petals between two radii, built from two mirrored arcs.
+    Shape: (count, 2 * segments, 2)
+    """
+    if count <= 0:
+        return np.empty((0, 2 * segments, 2))
+    half_width = np.pi / count
+    t = np.linspace(0, 1, segments)
+    # radius grows from inner to outer while the petal narrows from its base to the tip
+    r = inner + (outer - inner) * t
+    offset = half_width * np.cos(np.pi * t / 2)
+    side = np.concatenate([-offset, offset[::-1]])
+    radius = np.concatenate([r, r[::-1]])
+    centers = (np.arange(count) * 2 * half_width)[:, None]
+    theta = centers + side[None, :]
+    return np.stack([radius * np.cos(theta), radius * np.sin(theta)], axis=-1)
+
+
+def yantra_geometry(triangles: int = 4, circles: Tuple[float, ...] = (1.5,), petals: int = 0) -> Dict[str, np.ndarray]:
+    outer = max(circles) if circles else 1 + triangles * 0.2
+    return {
+        "triangles": triangle_vertices(triangles),
+        "circles": circle_vertices(circles),
+        "petals": petal_vertices(petals, outer, outer + 0.4),
+    }
+
+
+# -----------------------------
+# 2. Headless rendering
+# -----------------------------
+def _draw(geometry: Dict[str, np.ndarray], size: float, dpi: int) -> Figure:
+    # Figure() is not registered with pyplot, so it is freed as soon as we drop it
+    fig = Figure(figsize=(size, size), dpi=dpi)
+    ax = fig.add_subplot()
+    ax.set_aspect('equal')
+    extent = MARGIN * max((np.abs(v).max() for v in geometry.values() if v.size), default=1.0)
+    ax.set_xlim(-extent, extent)
+    ax.set_ylim(-extent, extent)
+    ax.axis('off')
+    ax.add_collection(PolyCollection(geometry["triangles"], alpha=0.2, facecolor='blue', edgecolor='blue'))
+    ax.add_collection(LineCollection(geometry["circles"], colors='red'))
+    if len(geometry["petals"]):
+        ax.add_collection(PolyCollection(geometry["petals"], facecolor='none', edgecolor='darkorange'))
+    return fig
+
+
+def render_yantra(triangles: int = 4, circles: Iterable[float] = (1.5,), petals: int = 0,
+                  fmt: str = "png", size: float = 6.0, dpi: int = 100) -> bytes:
+    """
+    Render a yantra to PNG or SVG bytes.
+    Results are cached with LRU eviction; `circles` may be any iterable of radii.
+    """
+    return _render_yantra(triangles, tuple(float(r) for r in circles), petals, fmt, size, dpi)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_yantra(triangles: int, circles: Tuple[float, ...], petals: int,
+                   fmt: str, size: float, dpi: int) -> bytes:
+    if fmt not in ("png", "svg"):
+        raise ValueError(f"Unsupported format: {fmt}")
+    fig = _draw(yantra_geometry(triangles, circles, petals), size, dpi)
+    canvas = FigureCanvasAgg(fig) if fmt == "png" else FigureCanvasSVG(fig)
+    buf = io.BytesIO()
+    canvas.print_figure(buf, format=fmt, dpi=dpi)
+    return buf.getvalue()
+
+
+def render_sri_yantra(fmt: str = "png") -> bytes:
+    return render_yantra(fmt=fmt)
+
+
+# -----------------------------
+# 3. Batch mode
+# -----------------------------
+def _render_job(params: dict) -> bytes:
+    return render_yantra(**params)
+
+
+def render_batch(param_sets: List[dict], max_workers: Optional[int] = None) -> List[bytes]:
+    """
+    Render many (typically high-dpi) yantras across a process pool.
+    Each entry in `param_sets` is a dict of render_yantra keyword arguments.
+    """
+    jobs = [dict(p, circles=tuple(p.get("circles", (1.5,)))) for p in param_sets]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_render_job, jobs))
@@ -0,0 +1,61 @@
+from sabdastra.astview import AstView, node_id
+
+
+def flat(n):
+    return [{"type": "print", "value": str(i)} for i in range(n)]
+
+
+def nested(depth):
+    """A chain of `depth` nested ifs with a print at the bottom."""
+    node = {"type": "print", "value": "x"}
+    for _ in range(depth):
+        node = {"type": "if", "test": "1", "body": [node], "orelse": []}
+    return [node]
+
+
+def test_small_tree_is_fully_shown():
+    view = AstView(nested(2))
+    assert view.total_nodes == 4
+    assert view.visible_nodes() == 4
+    assert "dashed" not in view.to_dot()
+    assert view.expandable() == []
+
+
+def test_deep_levels_are_collapsed():
+    view = AstView(nested(8), max_depth=2)
+    dot = view.to_dot()
+    assert view.visible_nodes() == 3
+    assert f'{node_id((0, 0))} [label="if [+7]", style=dashed];' in dot
+    assert [path for path, _ in view.expandable()] == [(0, 0)]
+
+
+def test_expanding_a_path_opens_one_more_level():
+    view = AstView(nested(8), max_depth=2)
+    dot = view.to_dot(expanded={(0, 0)})
+    assert f'{node_id((0, 0))} [label="if"];' in dot
+    assert f"{node_id((0, 0))} -> {node_id((0, 0, 0))};" in dot
+    assert view.visible_nodes({(0, 0)}) == 4
+    assert view.visible_nodes(view.kids) == view.total_nodes == view.full_dot().count("[label=")
+
+
+def test_wide_blocks_show_a_more_node():
+    view = AstView(flat(30), max_children=5)
+    dot = view.to_dot()
+    assert '[label="+25 more", shape=plaintext]' in dot
+    assert view.visible_nodes() == 6
+    assert view.visible_nodes({()}) == 31
+
+
+def test_fragments_are_cached_per_expansion():
+    view = AstView(nested(8), max_depth=2)
+    first = view.to_dot()
+    assert view.to_dot() == first
+    assert view.to_dot(expanded={(0, 0)}) != first
+    assert view.to_dot() == first
+
+
+def test_focus_limits_the_region():
+    view = AstView(nested(3))
+    dot = view.to_dot(focus=(0, 0))
+    assert node_id((0,)) + " " not in dot
+    assert dot.startswith("digraph {\n" + node_id((0, 0)))
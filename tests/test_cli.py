@@ -0,0 +1,60 @@
+import io
+
+from sabdastra import cli
+
+
+def run_cli(argv, stdin, monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    status = cli.main(argv)
+    out, err = capsys.readouterr()
+    return status, out, err
+
+
+def stage_names(err):
+    return [line.split()[0] for line in err.splitlines()[1:]]
+
+
+def test_run_with_timings(monkeypatch, capsys):
+    status, out, err = run_cli(["run", "--time"], "x = 2\nch x\n", monkeypatch, capsys)
+    assert status == 0
+    assert out == "2\n"
+    assert stage_names(err) == ["tokenize", "parse", "compile", "execute", "total"]
+
+
+def test_time_includes_a_stage_that_failed(monkeypatch, capsys):
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli, "execute_bytecode", broken)
+    status, _, err = run_cli(["run", "--time"], "ch 1\n", monkeypatch, capsys)
+    assert status == 1
+    assert "execute" in stage_names(err)
+
+
+def test_stream_keeps_a_separator_for_failing_programs(monkeypatch, capsys):
+    status, out, err = run_cli(["run", "--stream"], "ch 1\n---\nyugma i in\n---\nch 2\n", monkeypatch, capsys)
+    assert status == 1
+    assert out == "1\n---\n---\n2\n---\n"
+    assert "Compilation error" in err
+
+
+def test_run_stops_at_max_steps(monkeypatch, capsys):
+    status, out, err = run_cli(["run", "--max-steps", "50"], "i = 0\nyatra i < 5:\n    ch i\n",
+                               monkeypatch, capsys)
+    assert status == 1
+    assert out.startswith("0\n0\n")
+    assert "Step limit exceeded" in err
+
+
+def test_time_reports_a_run_that_hit_max_steps(monkeypatch, capsys):
+    status, _, err = run_cli(["run", "--time", "--max-steps", "1000"], "i = 0\nyatra i < 5:\n    ch i\n",
+                             monkeypatch, capsys)
+    assert status == 1
+    assert "execute" in stage_names(err)
+
+
+def test_bad_trace_setting_does_not_stop_a_run(monkeypatch, capsys):
+    monkeypatch.setenv("SABDASTRA_TRACE", "bogus")
+    status, out, _ = run_cli(["run"], "ch 1\n", monkeypatch, capsys)
+    assert status == 0
+    assert out == "1\n"
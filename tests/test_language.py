@@ -0,0 +1,149 @@
+import contextlib
+import io
+
+import pytest
+
+from sabdastra.lexer import tokenize
+from sabdastra.parser import parse
+from sabdastra.transpiler import transpile_ast
+from sabdastra.vm import StepLimitExceeded, interpret_ast
+
+
+def run_vm(src):
+    return interpret_ast(parse(tokenize(src)))
+
+
+def run_python(src):
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        exec(compile(transpile_ast(parse(tokenize(src))), "<transpiled>", "exec"), {})
+    return buf.getvalue().splitlines()
+
+
+def both(src):
+    python = run_python(src)
+    assert run_vm(src) == python
+    return python
+
+
+# -----------------------------
+# Lexer
+# -----------------------------
+def test_identifiers_may_contain_digits():
+    assert tokenize("v0 = x12") == [("v0", "=", "x12")]
+
+
+def test_division_is_tokenised():
+    assert tokenize("x = a / 2") == [("x", "=", "a", "/", "2")]
+
+
+# -----------------------------
+# Parser
+# -----------------------------
+def test_block_ends_at_dedent():
+    ast = parse(tokenize("yadi 1 < 2:\n    ch 1\nch 2\n"))
+    assert [node["type"] for node in ast] == ["if", "print"]
+    assert ast[0]["body"] == [{"type": "print", "value": "1"}]
+
+
+def test_nested_blocks_close_together():
+    ast = parse(tokenize("yugma i in 2:\n    yadi i == 1:\n        ch i\nch 9\n"))
+    assert [node["type"] for node in ast] == ["for", "print"]
+    assert ast[0]["body"][0]["body"] == [{"type": "print", "value": "i"}]
+
+
+def test_stray_indent_is_rejected():
+    with pytest.raises(ValueError, match="Unexpected indent"):
+        parse(tokenize("ch 1\n    ch 2\n"))
+
+
+def test_header_without_body():
+    ast = parse(tokenize("yadi 1 < 2:\nch 3\n"))
+    assert ast == [{"type": "if", "test": "1 < 2", "body": [], "orelse": []},
+                   {"type": "print", "value": "3"}]
+
+
+def test_anya_branch():
+    ast = parse(tokenize("yadi 1 > 2:\n    ch 1\nanya:\n    ch 2\n"))
+    assert ast[0]["orelse"] == [{"type": "print", "value": "2"}]
+
+
+# -----------------------------
+# Transpiler
+# -----------------------------
+def test_bhava_opens_no_scope():
+    py = transpile_ast(parse(tokenize("bhava vira:\n    x = 1\nch x\n")))
+    assert py == "# Bhāva: vira\nx = 1\nprint(x)"
+
+
+def test_empty_body_gets_pass():
+    py = transpile_ast(parse(tokenize("yadi 1 < 2:\n    bhava vira:\nch 1\n")))
+    assert py.splitlines()[:3] == ["if 1 < 2:", "    # Bhāva: vira", "    pass"]
+
+
+# -----------------------------
+# VM
+# -----------------------------
+def test_constants_load_by_value():
+    assert both("x = 7\nch x\nch 'namaste'\n") == ["7", "namaste"]
+
+
+@pytest.mark.parametrize("expr, expected", [
+    ("2 + 3 * 4", "14"),
+    ("10 - 4 - 3", "3"),
+    ("8 / 2 / 2", "2.0"),
+    ("1 + 2 < 4", "True"),
+    ("3 == 3", "True"),
+    ("3 != 3", "False"),
+    ("2 > 5", "False"),
+])
+def test_precedence_and_comparisons(expr, expected):
+    assert both(f"ch {expr}\n") == [expected]
+
+
+def test_for_loop_terminates():
+    assert both("yugma i in 3:\n    ch i\n") == ["0", "1", "2"]
+
+
+def test_while_loop():
+    assert both("i = 0\nyatra i < 3:\n    ch i\n    i = i + 1\n") == ["0", "1", "2"]
+
+
+def test_if_else():
+    assert both("x = 5\nyadi x > 3:\n    ch 'big'\nanya:\n    ch 'small'\n") == ["big"]
+
+
+def test_endless_loop_hits_step_limit():
+    with pytest.raises(StepLimitExceeded) as info:
+        interpret_ast(parse(tokenize("i = 0\nyatra i < 5:\n    ch i\n")), max_steps=1000)
+    assert info.value.output[:3] == ["0", "0", "0"]
+
+
+def test_loop_variable_keeps_last_value():
+    assert both("yugma i in 3:\n    ch i\nch i\n") == ["0", "1", "2", "2"]
+
+
+def test_empty_loop_leaves_variable_alone():
+    assert both("i = 7\nyugma i in 0:\n    ch i\nch i\n") == ["7"]
+
+
+def test_loop_bound_is_evaluated_once():
+    assert both("n = 2\nyugma i in n:\n    n = n + 1\n    ch i\n") == ["0", "1"]
+
+
+@pytest.mark.parametrize("expr, expected", [
+    ("-1", "-1"),
+    ("- 2 * 3", "-6"),
+    ("4 - -2", "6"),
+    ("3 * -2 + 1", "-5"),
+    ("+5", "5"),
+    ("1 < -2", "False"),
+])
+def test_unary_minus(expr, expected):
+    assert both(f"x = 2\nch {expr}\n") == [expected]
+
+
+@pytest.mark.parametrize("expr", ["a / / b", "a +", "* 2", "a b"])
+def test_malformed_expressions_are_rejected(expr):
+    with pytest.raises(ValueError):
+        run_vm(f"a = 1\nb = 2\nch {expr}\n")
@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from sabdastra.lexicon import FIELDS, Lexicon, write_lexicon
+
+PHONEMES = ["a", "ā", "ka", "kha", "ga", "gha", "kṣa", "ma", "mā", "na", "ra", "ram", "rama", "rāma", "śa", "sa"]
+
+
+def make_rows(n, seed=0):
+    rng = random.Random(seed)
+    return [{"phoneme": rng.choice(PHONEMES), "bhava": rng.choice(["vira", "shanta", "karuna"]),
+             "chakra": rng.choice(["muladhara", "anahata"]), "rasa": rng.choice(["adbhuta", "hasya"])}
+            for _ in range(n)]
+
+
+def levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        prev, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ca != cb))
+    return row[-1]
+
+
+def all_rows(lex, query, **kwargs):
+    out, page = [], 0
+    while True:
+        result = lex.search(query, page=page, page_size=7, **kwargs)
+        out += result.rows
+        page += 1
+        if page >= result.pages:
+            return out, result.total
+
+
+@pytest.fixture(params=["memory", "file"])
+def lexicon(request, tmp_path):
+    rows = make_rows(300)
+    if request.param == "memory":
+        lex = Lexicon.from_rows(rows)
+    else:
+        path = str(tmp_path / "lex.sblx")
+        assert write_lexicon(path, rows) == 300
+        lex = Lexicon(path)
+    yield lex, rows
+    lex.close()
+
+
+def test_round_trip(lexicon):
+    lex, rows = lexicon
+    assert len(lex) == len(rows)
+    assert [lex.row(i) for i in range(len(rows))] == rows
+
+
+@pytest.mark.parametrize("mode, query, match", [
+    ("exact", "ka", lambda v, q: v == q),
+    ("prefix", "ra", lambda v, q: v.startswith(q)),
+    ("prefix", "", lambda v, q: True),
+    ("contains", "a", lambda v, q: q in v),
+    ("contains", "m", lambda v, q: q in v),
+    ("exact", "zzz", lambda v, q: False),
+])
+def test_search_matches_brute_force(lexicon, mode, query, match):
+    lex, rows = lexicon
+    found, total = all_rows(lex, query, mode=mode)
+    expected = sorted((r for r in rows if match(r["phoneme"], query)), key=lambda r: r["phoneme"])
+    assert total == len(expected)
+    assert sorted(found, key=lambda r: r["phoneme"]) == expected
+    assert [r["phoneme"] for r in found] == [r["phoneme"] for r in expected]  # ordered by value
+
+
+@pytest.mark.parametrize("query, distance", [("rama", 1), ("ka", 1), ("kha", 2), ("x", 1)])
+def test_fuzzy_matches_brute_force(lexicon, query, distance):
+    lex, rows = lexicon
+    found, total = all_rows(lex, query, mode="fuzzy", max_distance=distance)
+    expected = [r for r in rows if levenshtein(r["phoneme"], query) <= distance]
+    assert total == len(expected)
+    assert sorted(map(tuple, (r.values() for r in found))) == sorted(map(tuple, (r.values() for r in expected)))
+    distances = [levenshtein(r["phoneme"], query) for r in found]
+    assert distances == sorted(distances)
+
+
+def test_fuzzy_on_other_columns(lexicon):
+    lex, rows = lexicon
+    found, _ = all_rows(lex, "vora", field="bhava", mode="fuzzy")
+    assert found and all(r["bhava"] == "vira" for r in found)
+
+
+def test_pages_cross_posting_ranges():
+    # five values with 3 rows each: every page of 4 starts inside one range
+    rows = [{"phoneme": p, "bhava": "b", "chakra": "c", "rasa": "r"} for p in "abcde" for _ in range(3)]
+    lex = Lexicon.from_rows(rows)
+    pages = [lex.search("", mode="prefix", page=i, page_size=4) for i in range(4)]
+    assert [len(p.rows) for p in pages] == [4, 4, 4, 3]
+    assert [r["phoneme"] for p in pages for r in p.rows] == [r["phoneme"] for r in rows]
+    assert pages[0].pages == 4 and pages[0].total == 15
+    assert lex.search("", page=9, page_size=4).rows == []
+
+
+def test_empty_lexicon(tmp_path):
+    path = str(tmp_path / "empty.sblx")
+    assert write_lexicon(path, []) == 0
+    for lex in (Lexicon(path), Lexicon.from_rows([])):
+        assert len(lex) == 0
+        for mode in ("prefix", "exact", "contains", "fuzzy"):
+            result = lex.search("a", mode=mode)
+            assert result.rows == [] and result.total == 0 and result.pages == 1
+        lex.close()
+
+
+def test_bad_magic_is_rejected(tmp_path):
+    path = tmp_path / "bad.sblx"
+    path.write_bytes(b"NOPE" + bytes(12))
+    with pytest.raises(ValueError, match="not a v1 lexicon file"):
+        len(Lexicon(str(path)))
+
+
+def test_unknown_field_and_mode():
+    lex = Lexicon.from_rows(make_rows(5))
+    with pytest.raises(ValueError, match="Unknown field"):
+        lex.search("a", field="colour")
+    with pytest.raises(ValueError, match="Unknown search mode"):
+        lex.search("a", mode="regex")
+    assert set(FIELDS) == set(lex.row(0))
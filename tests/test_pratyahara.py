@@ -0,0 +1,66 @@
+import unicodedata
+
+import pytest
+
+from sabdastra.pratyahara import (ASCII_NAMES, PHONEME_ID, PRATYAHARAS, bits, classify, contains,
+                                  difference, intersection, members, segment, union)
+
+
+def test_canonical_pratyaharas():
+    assert members("ac") == ["a", "i", "u", "ṛ", "ḷ", "e", "o", "ai", "au"]
+    assert members("ik") == ["i", "u", "ṛ", "ḷ"]
+    assert members("yaṇ") == ["y", "v", "r", "l"]
+    hal = members("hal")
+    assert hal[0] == "h" and hal[-1] == "s" and len(hal) == 33
+    assert bits("ac") & bits("hal") == 0
+
+
+def test_first_an_is_the_short_one():
+    assert members("aṇ") == ["a", "i", "u"]
+    assert members("aṇ2")[-1] == "l"
+
+
+def test_ascii_aliases():
+    assert ASCII_NAMES["jas"] == "jaś"
+    assert bits("jas") == bits("jaś")
+    assert bits("rk") == bits("ṛk")
+    assert PHONEME_ID["R"] == PHONEME_ID["ṛ"]
+    assert PHONEME_ID["L"] == PHONEME_ID["ḷ"]
+    assert PHONEME_ID["ng"] == PHONEME_ID["ṅ"]
+
+
+def test_ambiguous_and_unknown_names():
+    with pytest.raises(KeyError, match="Ambiguous"):
+        bits("yan")
+    with pytest.raises(KeyError, match="Unknown"):
+        bits("xyz")
+
+
+def test_decomposed_name_is_normalized():
+    assert bits(unicodedata.normalize("NFD", "yaṇ")) == PRATYAHARAS["yaṇ"]
+
+
+def test_long_vowels_share_the_short_vowel_bit():
+    for long, short in (("ā", "a"), ("ī", "i"), ("ū", "u"), ("ṝ", "ṛ")):
+        assert PHONEME_ID[long] == PHONEME_ID[short]
+    assert contains("ik", "ī")
+    assert not contains("ik", "ā")
+
+
+def test_set_operations():
+    assert members(union("ik", "yaṇ")) == ["i", "u", "ṛ", "ḷ", "y", "v", "r", "l"]
+    assert members(intersection("ac", "ik")) == members("ik")
+    assert members(difference("ac", "ik")) == ["a", "e", "o", "ai", "au"]
+    assert intersection() == 0
+
+
+def test_segment_prefers_longest_phoneme():
+    assert segment("khai") == ["kh", "ai"]
+    assert segment("a1") == ["a", "1"]
+
+
+def test_classify():
+    assert classify("rāmaḥ ai") == [("r", "hal"), ("ā", "ac"), ("m", "hal"), ("a", "ac"),
+                                    ("ḥ", None), (" ", None), ("ai", "ac")]
+    # first matching class wins
+    assert classify("iy", ("ik", "ac", "yaṇ")) == [("i", "ik"), ("y", "yaṇ")]
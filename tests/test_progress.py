@@ -0,0 +1,97 @@
+import sqlite3
+import time
+
+import pytest
+
+from sabdastra.progress import MemoryProgressStore, ProgressStore, SQLiteProgressStore, levels_from_bitmap
+
+
+class _SlowConnection:
+    """Runs `during` between a SELECT and the reader taking the lock again."""
+
+    def __init__(self, conn, during):
+        self.conn = conn
+        self.during = during
+
+    def execute(self, sql, params=()):
+        rows = self.conn.execute(sql, params).fetchall()
+        during, self.during = self.during, None
+        if during:
+            during()
+        return rows
+
+
+def test_mark_complete_is_visible(tmp_path):
+    store = SQLiteProgressStore(str(tmp_path / "progress.db"), flush_interval=0.01)
+    try:
+        store.mark_complete("asha", 1)
+        store.mark_complete("asha", 3)
+        assert levels_from_bitmap(store.completed("asha")) == [1, 3]
+        store.flush()
+        assert levels_from_bitmap(store.completed("asha")) == [1, 3]
+    finally:
+        store.close()
+
+
+def test_write_committed_during_read_is_not_cached_stale(tmp_path):
+    store = SQLiteProgressStore(str(tmp_path / "progress.db"), flush_interval=0.01)
+    try:
+        def write_and_commit():
+            store.mark_complete("asha", 1)
+            store.flush()
+
+        store._local.conn = _SlowConnection(store._conn(), write_and_commit)
+        store.completed("asha")  # may or may not include level 1: the write raced it
+        assert store.completed("asha") == 1 << 1
+    finally:
+        store.close()
+
+
+def test_failed_writes_are_reported_not_waited_on(tmp_path):
+    path = str(tmp_path / "progress.db")
+    store = SQLiteProgressStore(path, flush_interval=0.01)
+    other = sqlite3.connect(path)
+    other.execute("DROP TABLE progress")
+    other.commit()
+    store.mark_complete("asha", 1)
+    with pytest.raises(RuntimeError, match="writer failed") as info:
+        store.flush()
+    assert isinstance(info.value.__cause__, sqlite3.OperationalError)
+    with pytest.raises(RuntimeError):
+        store.mark_complete("asha", 2)
+    with pytest.raises(RuntimeError):
+        store.close()
+
+
+def test_locked_database_is_retried(tmp_path):
+    path = str(tmp_path / "progress.db")
+    store = SQLiteProgressStore(path, flush_interval=0.01, busy_timeout=0.01)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    store.mark_complete("asha", 1)
+    time.sleep(0.03)  # at least one attempt finds the database locked
+    other.execute("COMMIT")
+    store.flush()
+    store.close()
+    assert other.execute("SELECT level FROM progress").fetchall() == [(1,)]
+
+
+def test_locked_database_gives_up_after_retries(tmp_path):
+    path = str(tmp_path / "progress.db")
+    store = SQLiteProgressStore(path, flush_interval=0.01, busy_timeout=0.01)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    store.mark_complete("asha", 1)
+    with pytest.raises(RuntimeError, match="writer failed"):
+        store.flush()
+    other.execute("ROLLBACK")
+    with pytest.raises(RuntimeError):
+        store.close()
+
+
+def test_progress_store_is_abstract():
+    with pytest.raises(TypeError):
+        ProgressStore()
+    store = MemoryProgressStore()
+    store.mark_complete("asha", 2)
+    assert store.completed("asha") == 1 << 2
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from sabdastra.recognizer import Match, MantraRegistry, default_registry, phonemes
+
+# one letter per phoneme, so str.find offsets line up with the automaton's
+LETTERS = "amr"
+
+
+def registry(patterns):
+    reg = MantraRegistry()
+    for name, texts in patterns.items():
+        reg.register(name, texts, list)
+    return reg
+
+
+def naive(patterns, text):
+    found = []
+    for name, texts in patterns.items():
+        for pattern in texts:
+            start = text.find(pattern)
+            while start != -1:
+                found.append(Match(name, start, start + len(pattern)))
+                start = text.find(pattern, start + 1)
+    return sorted(found, key=lambda m: (m.end, m.start, m.name))
+
+
+def recognized(reg, text):
+    return sorted(reg.recognize(text), key=lambda m: (m.end, m.start, m.name))
+
+
+def test_overlapping_patterns():
+    patterns = {"a": ["a"], "aa": ["aa"], "ama": ["ama"], "mam": ["mam"], "r": ["ra", "rar"]}
+    text = "aamamaararama"
+    assert recognized(registry(patterns), text) == naive(patterns, text)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_patterns_match_str_find(seed):
+    rng = random.Random(seed)
+    word = lambda n: "".join(rng.choice(LETTERS) for _ in range(n))
+    patterns = {f"m{i}": [word(rng.randint(1, 4)) for _ in range(rng.randint(1, 3))] for i in range(6)}
+    text = word(200)
+    assert recognized(registry(patterns), text) == naive(patterns, text)
+
+
+def test_matches_come_in_end_order():
+    reg = registry({"am": ["am"], "mam": ["mam"]})
+    assert [m.end for m in reg.recognize("amamam")] == sorted(m.end for m in reg.recognize("amamam"))
+
+
+def test_multi_letter_phonemes_are_one_symbol():
+    assert phonemes("rai") == ["r", "ai"]
+    reg = registry({"ra": ["ra"]})
+    # "ai" is its own phoneme, so "rai" does not contain "ra"
+    assert reg.recognize("rai") == []
+    assert reg.recognize("rarai") == [Match("ra", 0, 2)]
+
+
+def test_registering_rebuilds_the_automaton():
+    reg = registry({"a": ["ma"]})
+    assert reg.recognize("rama") == [Match("a", 2, 4)]
+    reg.register("b", ["ram"], list)
+    assert recognized(reg, "rama") == [Match("b", 0, 3), Match("a", 2, 4)]
+
+
+def test_empty_registry_and_text():
+    assert MantraRegistry().recognize("rama") == []
+    assert registry({"a": ["a"]}).recognize("") == []
+
+
+def test_default_registry_dispatch():
+    reg = default_registry()
+    for name in reg.names():
+        assert isinstance(reg.run(name), list)
@@ -0,0 +1,41 @@
+import pytest
+
+from sabdastra.sandhi import NO_RULE, default_engine, join, split
+
+
+@pytest.mark.parametrize("left, right, joined, sutra", [
+    ("deva", "indra", "devendra", "6.1.87"),
+    ("iti", "api", "ityapi", "6.1.77"),
+    ("nau", "ika", "nāvika", "6.1.78"),
+    ("devai", "atra", "devāyatra", "6.1.78"),
+    ("gai", "aka", "gāyaka", "6.1.78"),
+    ("vane", "iva", "vanayiva", "6.1.78"),
+    ("vane", "atra", "vane 'tra", "6.1.109"),
+    ("rāmaḥ", "asti", "rāmo 'sti", "visarga"),
+])
+def test_join(left, right, joined, sutra):
+    assert join(left, right) == joined
+    assert default_engine().explain(left, right).sutra == sutra
+
+
+@pytest.mark.parametrize("word, left, right", [
+    ("nāvika", "nau", "ika"),
+    ("devāyatra", "devai", "atra"),
+    ("devendra", "deva", "indra"),
+])
+def test_split_finds_the_original_words(word, left, right):
+    assert (left, right) in [(l, r) for l, r, _ in split(word)]
+
+
+def test_diphthong_tail_is_not_an_ik_vowel():
+    # the i/u of ai/au must not be read on its own by 6.1.77
+    assert join("nau", "ika") != "navika"
+    assert [r.sutra for l, _, r in split("nāvika") if l == "nau"] == ["6.1.78"]
+
+
+def test_split_finds_a_junction_without_sandhi():
+    assert split("rāmagṛha", {"rāma", "gṛha"}) == [("rāma", "gṛha", NO_RULE)]
+    # deva + indra always takes guṇa, so the bare concatenation is not a split of it
+    assert split("devaindra", {"deva", "indra"}) == []
+    # without a vocabulary only rule-produced junctions are listed
+    assert all(r is not NO_RULE for _, _, r in split("rāmagṛha"))
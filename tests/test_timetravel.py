@@ -0,0 +1,103 @@
+import pytest
+
+from sabdastra.lexer import tokenize
+from sabdastra.parser import parse
+from sabdastra.timetravel import Cursor, record_ast
+from sabdastra.vm import interpret_ast
+
+PROGRAMS = {
+    "loop": "total = 0\ni = 1\nyatra i < 6:\n    total = total + i * i\n    ch total\n    i = i + 1\n",
+    "branches": "x = 7\nyadi x > 3:\n    x = -x\n    ch x\nyadi x > 3:\n    ch 0\nch x / 2\n",
+    "rebind": "a = 1\na = 4 / 4\na = 1 == 1\nch a\n",
+}
+
+
+def record(src, **kwargs):
+    return record_ast(parse(tokenize(src)), **kwargs)
+
+
+def snapshots(src):
+    """Naive oracle: a full copy of the machine after every single step."""
+    rec = record(src, checkpoint_every=1)
+    return rec, rec.checkpoints
+
+
+def same(frame, snap):
+    assert (frame.step, frame.pc, frame.output_len) == (snap.step, snap.pc, snap.output_len)
+    assert frame.env == snap.env and frame.stack == snap.stack
+    # 1, 1.0 and True compare equal; the values must keep their type too
+    assert [type(v) for v in frame.env.values()] == [type(v) for v in snap.env.values()]
+
+
+@pytest.fixture(params=sorted(PROGRAMS))
+def src(request):
+    return PROGRAMS[request.param]
+
+
+def test_recording_matches_the_vm(src):
+    rec = record(src)
+    assert rec.finished
+    assert rec.output == interpret_ast(parse(tokenize(src)))
+
+
+@pytest.mark.parametrize("every", [1, 3, 8, 1024])
+def test_state_at_every_step_matches_snapshots(src, every):
+    oracle, snaps = snapshots(src)
+    rec = record(src, checkpoint_every=every)
+    assert len(rec) == len(oracle) == len(snaps) - 1
+    for step, snap in enumerate(snaps):
+        same(rec.state(step), snap)
+
+
+@pytest.mark.parametrize("every", [1, 4, 1024])
+def test_cursor_seek_matches_snapshots(src, every):
+    _, snaps = snapshots(src)
+    cursor = Cursor(record(src, checkpoint_every=every))
+    # short hops walk, long ones go through checkpoints; visit in both directions
+    order = list(range(len(snaps))) + list(range(len(snaps) - 1, -1, -3)) + [len(snaps) - 1, 0]
+    for step in order:
+        same(cursor.seek(step), snaps[step])
+
+
+def test_back_then_forward_round_trips(src):
+    _, snaps = snapshots(src)
+    cursor = Cursor(record(src, checkpoint_every=4))
+    cursor.seek(len(snaps) - 1)
+    for step in range(len(snaps) - 2, -1, -1):
+        same(cursor.back(), snaps[step])
+    for step in range(1, len(snaps)):
+        same(cursor.forward(), snaps[step])
+
+
+def test_start_and_end_are_clamped(src):
+    rec = record(src)
+    cursor = Cursor(rec)
+    assert cursor.step == 0 and cursor.output() == []
+    assert cursor.back().step == 0
+    assert cursor.seek(-5).step == 0
+    end = cursor.seek(len(rec) + 100)
+    assert end.step == len(rec) and end.pc == len(rec.bytecode)
+    assert cursor.forward().step == len(rec)
+    assert cursor.output() == rec.output
+    assert rec.instruction(end.pc) == "(end)"
+
+
+def test_step_limit_stops_the_recording():
+    src = "i = 0\nyatra i < 5:\n    ch i\n"
+    rec = record(src, max_steps=50)
+    assert not rec.finished
+    assert len(rec) == 50
+    snaps = record(src, checkpoint_every=1, max_steps=50).checkpoints
+    cursor = Cursor(record(src, checkpoint_every=8, max_steps=50))
+    for step in range(50, -1, -1):
+        same(cursor.seek(step), snaps[step])
+    assert cursor.seek(10_000).step == 50
+    assert cursor.forward().step == 50
+    assert rec.output and set(rec.output) == {"0"}
+
+
+def test_empty_program():
+    rec = record("")
+    assert rec.finished and len(rec) == 0 and rec.output == []
+    cursor = Cursor(rec)
+    assert cursor.forward().step == 0 and cursor.back().step == 0
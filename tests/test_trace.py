@@ -0,0 +1,131 @@
+import io
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from sabdastra import trace
+
+
+@pytest.fixture(autouse=True)
+def clean_trace(monkeypatch):
+    trace.disable()
+    trace.reset()
+    monkeypatch.setattr(trace, "_EXPORTERS", [])
+    monkeypatch.setattr(trace, "_configured", None)
+    yield
+    trace.disable()
+    trace.reset()
+
+
+def test_disabled_records_nothing():
+    @trace.traced("work")
+    def work():
+        return 42
+
+    with trace.span("block") as s:
+        s.set(n=1)
+    trace.incr("hits")
+    trace.observe("size", 3.0)
+    assert work() == 42
+    assert not trace.HISTOGRAMS and not trace.COUNTERS and not trace.RECENT
+
+
+def test_spans_nest_and_count_errors():
+    trace.enable()
+
+    @trace.traced()
+    def inner():
+        raise KeyError("x")
+
+    with trace.span("outer", program="p"):
+        with pytest.raises(KeyError):
+            inner()
+    assert [s.name for s in trace.RECENT] == ["inner", "outer"]
+    assert trace.LATEST["inner"].parent == "outer"
+    assert trace.LATEST["inner"].error == "KeyError"
+    assert trace.LATEST["outer"].attrs == {"program": "p"}
+    assert trace.COUNTERS == {"inner.errors": 1}
+    assert [row["span"] for row in trace.latest_rows()] == ["outer", "inner"]
+
+
+def test_histogram_buckets_and_quantile():
+    hist = trace.Histogram((0.1, 1.0))
+    assert hist.quantile(0.5) == 0.0
+    for value in (0.05, 0.05, 0.5, 2.0):
+        hist.observe(value)
+    assert hist.counts == [2, 1, 1]
+    assert hist.quantile(0.5) == 0.1
+    assert hist.quantile(0.75) == 1.0
+    assert hist.quantile(1.0) == float("inf")
+    assert hist.sum == pytest.approx(2.6)
+
+
+def test_prometheus_text():
+    trace.enable()
+    trace.incr("cache.hit", 3)
+    trace.observe("render.svg", 0.002)
+    trace.observe("render.svg", 2.0)
+    text = trace.prometheus_text()
+    assert "# TYPE sabdastra_cache_hit_total counter\nsabdastra_cache_hit_total 3\n" in text
+    assert 'sabdastra_span_seconds_bucket{span="render.svg",le="0.001"} 0' in text
+    assert 'sabdastra_span_seconds_bucket{span="render.svg",le="0.005"} 1' in text
+    assert 'sabdastra_span_seconds_bucket{span="render.svg",le="1"} 1' in text
+    assert 'sabdastra_span_seconds_bucket{span="render.svg",le="+Inf"} 2' in text
+    assert 'sabdastra_span_seconds_count{span="render.svg"} 2' in text
+    assert text.count("# TYPE sabdastra_span_seconds histogram") == 1
+
+
+def test_prometheus_text_empty():
+    assert trace.prometheus_text() == "\n"
+
+
+def test_jsonl_exporter():
+    out = io.StringIO()
+    exporter = trace.JsonLinesExporter(out)
+    trace.add_exporter(exporter)
+    trace.enable()
+    with trace.span("parse", tokens=7):
+        pass
+    exporter.close()
+    with trace.span("after"):
+        pass
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(rows) == 1
+    assert rows[0]["name"] == "parse" and rows[0]["tokens"] == 7
+
+
+def test_configure_memory():
+    trace.configure("1")
+    assert trace.is_enabled()
+
+
+@pytest.mark.parametrize("spec", ["bogus", "prometheus:notaport", "jsonl:/nonexistent/dir/t.jsonl"])
+def test_bad_spec_warns_and_stays_off(spec, caplog):
+    with caplog.at_level(logging.WARNING, logger="sabdastra.trace"):
+        trace.configure(spec)
+    assert not trace.is_enabled()
+    assert "SABDASTRA_TRACE" in caplog.text
+
+
+def test_busy_port_warns_and_stays_off(caplog):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        with caplog.at_level(logging.WARNING, logger="sabdastra.trace"):
+            trace.configure(f"prometheus:{sock.getsockname()[1]}")
+    assert not trace.is_enabled()
+    assert "SABDASTRA_TRACE" in caplog.text
+
+
+def test_import_does_not_read_the_environment():
+    env = dict(os.environ, SABDASTRA_TRACE="bogus")
+    code = "import sabdastra.lexer, sabdastra.trace as t; print(t.is_enabled())"
+    done = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert done.returncode == 0, done.stderr
+    assert done.stdout.strip() == "False"
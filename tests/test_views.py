@@ -0,0 +1,18 @@
+import views
+
+
+def listed(token=None):
+    return set(views.ADMIN_PAGES) & set(views.visible_pages(token))
+
+
+def test_admin_pages_hidden_without_a_token(monkeypatch):
+    monkeypatch.delenv("SABDASTRA_ADMIN_TOKEN", raising=False)
+    assert not listed()
+    assert not listed("anything")
+
+
+def test_admin_pages_need_the_matching_token(monkeypatch):
+    monkeypatch.setenv("SABDASTRA_ADMIN_TOKEN", "s3cret")
+    assert not listed()
+    assert not listed("wrong")
+    assert listed("s3cret") == {"Cache Admin", "Developer"}
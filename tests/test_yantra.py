@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from sabdastra.yantra import (  # noqa: E402
+    _draw, circle_vertices, petal_vertices, render_yantra, triangle_vertices, yantra_geometry,
+)
+
+
+def test_vertex_array_shapes():
+    assert triangle_vertices(3).shape == (3, 4, 2)
+    assert circle_vertices([1.0, 2.0], segments=16).shape == (2, 16, 2)
+    assert petal_vertices(8, 1.0, 1.4, segments=10).shape == (8, 20, 2)
+    assert petal_vertices(0, 1.0, 1.4).shape[0] == 0
+
+
+def test_triangles_are_closed_and_grow():
+    tri = triangle_vertices(3, base_radius=1.0, step=0.5)
+    assert tri[:, 0] == pytest.approx(tri[:, -1])
+    radii = (tri ** 2).sum(axis=-1) ** 0.5
+    assert radii[:, 0] == pytest.approx([1.0, 1.5, 2.0])
+
+
+@pytest.mark.parametrize("fmt, magic", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_render_formats(fmt, magic):
+    assert render_yantra(3, (1.5,), 4, fmt=fmt, dpi=20).startswith(magic)
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported format"):
+        render_yantra(fmt="gif")
+
+
+@pytest.mark.parametrize("triangles, petals", [(1, 0), (4, 0), (9, 0), (9, 16)])
+def test_extent_holds_the_whole_drawing(triangles, petals):
+    geometry = yantra_geometry(triangles, (1.5,), petals)
+    radius = max(abs(v).max() for v in geometry.values() if v.size)
+    low, high = _draw(geometry, 6.0, 50).axes[0].get_xlim()
+    assert low < -radius and high > radius
+
+
+def test_empty_drawing_renders():
+    assert render_yantra(0, (), 0, dpi=20).startswith(b"\x89PNG")
+
+
+def test_circles_may_be_a_list():
+    assert render_yantra(4, [1.5], dpi=20) == render_yantra(4, (1.5,), dpi=20)
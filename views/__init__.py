@@ -0,0 +1,45 @@
+# Streamlit pages, one module per sidebar entry.
+# Each module exposes render() and is only imported when its page is opened,
+# so pandas/graphviz/matplotlib are loaded by the pages that use them.
+
+import importlib
+import os
+from typing import List, Optional
+
+PAGES = {
+    "Welcome": "welcome",
+    "Architecture": "architecture",
+    "Playground": "playground",
+    "Skill Tree": "skill_tree",
+    "Bhāva Explorer": "bhava_explorer",
+    "Maheshwara Hash": "maheshwara_hash",
+    "Mantra Chanting Mode": "mantra_chanting",
+    "Vedic Mathematics": "vedic_mathematics",
+    "Tantric Geometry": "tantric_geometry",
+    "Panini Grammar": "panini_grammar",
+    "Sanskrit Linguistics": "sanskrit_linguistics",
+    "Deploy": "deploy",
+}
+
+# Pages that act on the whole server process. They are listed only when
+# SABDASTRA_ADMIN_TOKEN is set and the URL carries ?admin=<that token>.
+ADMIN_PAGES = {
+    "Cache Admin": "cache_admin",
+    "Developer": "developer",
+}
+
+
+def is_admin(token: Optional[str]) -> bool:
+    expected = os.environ.get("SABDASTRA_ADMIN_TOKEN", "")
+    if not (expected and token):
+        return False
+    import hmac  # pulls in hashlib; only needed when a token is configured
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
+def visible_pages(admin_token: Optional[str] = None) -> List[str]:
+    return list(PAGES) + (list(ADMIN_PAGES) if is_admin(admin_token) else [])
+
+
+def load_page(title: str):
+    return importlib.import_module(f"{__name__}.{PAGES.get(title) or ADMIN_PAGES[title]}")
@@ -0,0 +1,19 @@
+# Architecture page
+import streamlit as st
+
+
+def render():
+    st.markdown("""
+    ## Architecture
+    1. **Maheshwara Core** — phoneme order + cryptographic hash
+    2. **Lexer** — turns transliterated code into tokens (upgraded for yadi/anya/yugma/yatra)
+    3. **Parser** — builds an AST (upgraded for control flow + Bhāva blocks)
+    4. **Transpiler** — converts AST → Python
+    5. **Interpreter** — executes bytecode compiled from AST (optimized with constants, opcodes)
+    6. **Bhāva Layer** — semantic/emotional tagging (upgraded with more rules)
+    7. **Mantra Mode** — chant → AST mapping
+    8. **Vedic Math** — All 16 sutras implemented (advanced)
+    9. **Tantric Geometry** — Coding yantras
+    10. **Panini Grammar** — Sutras, sandhi, quizzes
+    11. **Sanskrit Linguistics** — Key concepts, Vyakarana overview
+    """)
@@ -0,0 +1,37 @@
+# Bhāva Explorer page
+import streamlit as st
+
+from sabdastra.bhava import BHAVA_TABLE, apply_bhava
+from sabdastra.lexicon import FIELDS, default_lexicon
+from views.cache import cached
+
+SEARCH_MODES = ["contains", "prefix", "fuzzy", "exact"]  # contains first: the explorer's original matching
+PAGE_SIZE = 50
+
+
+@cached(max_entries=1, resource=True)
+def lexicon():
+    # $SABDASTRA_LEXICON (.sblx) if set, else the built-in table; opened lazily
+    return default_lexicon()
+
+
+def render():
+    lex = lexicon()
+    col1, col2, col3 = st.columns([3, 1, 1])
+    q = col1.text_input("Search phoneme")
+    field = col2.selectbox("Field", FIELDS)
+    mode = col3.selectbox("Match", SEARCH_MODES)
+    max_distance = st.slider("Max edit distance", 1, 3, 1) if mode == "fuzzy" else 1
+    query_mode = mode if q else "prefix"  # empty search lists everything
+    result = lex.search(q, field, query_mode, max_distance, 0, PAGE_SIZE)
+    page_no = st.number_input("Page", min_value=1, max_value=result.pages, value=1) - 1
+    if page_no:
+        result = lex.search(q, field, query_mode, max_distance, page_no, PAGE_SIZE)
+    st.caption(f"{result.total} entries, page {page_no + 1} of {result.pages}")
+    st.dataframe(result.rows)
+    # Demo Bhāva application (upgrade 2)
+    bhava_code = st.text_area("Apply Bhāva to code", "ch 'Hello'")
+    bhava_select = st.selectbox("Bhāva", [b['bhava'] for b in BHAVA_TABLE])
+    if st.button("Apply Bhāva"):
+        modified = apply_bhava(bhava_code, bhava_select)
+        st.code(modified)
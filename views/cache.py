@@ -0,0 +1,102 @@
+# Cached rendering layer shared by the pages.
+# Wraps st.cache_data / st.cache_resource with a bounded size and hit/miss
+# counters (Streamlit does not expose its own), reported on the Cache Admin page.
+
+import functools
+import hashlib
+import threading
+from typing import Callable, Dict
+
+import streamlit as st
+
+# qualified function name -> {"calls", "misses", "max_entries", "kind"}
+CACHE_STATS: Dict[str, dict] = {}
+_CLEARERS: Dict[str, Callable[[], None]] = {}
+_LOCK = threading.Lock()  # sessions rerun on separate threads
+
+
+def cached(max_entries: int = 64, resource: bool = False):
+    """
+    Cache a function with st.cache_data (returns copies) or, with
+    resource=True, st.cache_resource (shared object; callers must not mutate).
+    Arguments prefixed with '_' are not hashed, as in Streamlit.
+    """
+    def decorator(fn):
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        stats = CACHE_STATS.setdefault(name, {
+            "calls": 0, "misses": 0, "max_entries": max_entries,
+            "kind": "resource" if resource else "data",
+        })
+
+        # body only runs on a cache miss
+        @functools.wraps(fn)
+        def on_miss(*args, **kwargs):
+            with _LOCK:
+                stats["misses"] += 1
+            return fn(*args, **kwargs)
+
+        backend = st.cache_resource if resource else st.cache_data
+        cached_fn = backend(max_entries=max_entries, show_spinner=False)(on_miss)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _LOCK:
+                stats["calls"] += 1
+            return cached_fn(*args, **kwargs)
+
+        wrapper.clear = cached_fn.clear
+        _CLEARERS[name] = cached_fn.clear
+        return wrapper
+    return decorator
+
+
+def source_key(src: str) -> str:
+    return hashlib.sha256(src.encode("utf-8")).hexdigest()
+
+
+def clear_all() -> None:
+    for clear in _CLEARERS.values():
+        clear()
+    with _LOCK:
+        for stats in CACHE_STATS.values():
+            stats["calls"] = stats["misses"] = 0
+
+
+def stats_rows():
+    rows = []
+    for name, s in sorted(CACHE_STATS.items()):
+        hits = s["calls"] - s["misses"]
+        rows.append({
+            "cache": name, "kind": s["kind"], "max_entries": s["max_entries"],
+            "calls": s["calls"], "hits": hits, "misses": s["misses"],
+            "hit_rate": round(hits / s["calls"], 3) if s["calls"] else None,
+        })
+    return rows
+
+
+# -----------------------------
+# Static tables
+# -----------------------------
+def _table_source(name: str):
+    from sabdastra.bhava import BHAVA_TABLE
+    from sabdastra.grammar import PANINI_CONCEPTS, SANSKRIT_LINGUISTICS
+    from sabdastra.vedic import VEDIC_SUTRAS
+    return {
+        "bhava": BHAVA_TABLE,
+        "vedic_sutras": VEDIC_SUTRAS,
+        "panini": PANINI_CONCEPTS,
+        "linguistics": SANSKRIT_LINGUISTICS,
+    }[name]
+
+
+@cached(max_entries=8, resource=True)
+def static_frame(name: str):
+    # shared DataFrame, treated as read-only by the pages
+    import pandas as pd
+    return pd.DataFrame(_table_source(name))
+
+
+@cached(max_entries=8, resource=True)
+def static_index(name: str, key: str) -> Dict[str, dict]:
+    # row lookup by a unique column, instead of filtering the DataFrame per rerun
+    return {row[key]: row for row in _table_source(name)}
@@ -0,0 +1,17 @@
+# Cache Admin page
+import streamlit as st
+
+from views.cache import clear_all, stats_rows
+
+
+def render():
+    st.header("Cache Admin")
+    st.write("Hit rates for the page caches in this server process.")
+    rows = stats_rows()
+    calls = sum(r["calls"] for r in rows)
+    hits = sum(r["hits"] for r in rows)
+    st.metric("Overall hit rate", f"{hits / calls:.1%}" if calls else "n/a")
+    st.dataframe(rows)
+    if st.button("Clear all caches"):
+        clear_all()
+        st.success("Caches cleared.")
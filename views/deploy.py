@@ -0,0 +1,12 @@
+# Deploy page
+import streamlit as st
+
+
+def render():
+    st.markdown("""
+    ## Deploy Instructions
+    1. Copy app.py, the sabdastra/ core package and the views/ pages to GitHub
+    2. Add requirements.txt: streamlit pandas graphviz matplotlib numpy
+    3. `streamlit run app.py`
+    4. Deploy via Streamlit Community Cloud
+    """)
@@ -0,0 +1,26 @@
+# Developer page
+import streamlit as st
+
+from sabdastra import trace
+
+
+def render():
+    st.header("Developer")
+    st.write("Latest per-stage timings from the tracing layer in this server process.")
+    on = st.toggle("Record spans", value=trace.is_enabled())
+    if on != trace.is_enabled():
+        if on:
+            trace.enable()
+        else:
+            trace.disable()
+    rows = trace.latest_rows()
+    if not rows:
+        st.info("No spans recorded yet. Turn recording on and compile something in the Playground.")
+    else:
+        st.dataframe(rows)
+        st.bar_chart({r["span"]: r["last_ms"] for r in rows}, horizontal=True, x_label="last run (ms)")
+    col1, col2 = st.columns(2)
+    col1.download_button("Prometheus metrics", trace.prometheus_text(), "metrics.txt", "text/plain")
+    if col2.button("Reset"):
+        trace.reset()
+        st.rerun()
@@ -0,0 +1,10 @@
+# Maheshwara Hash page
+import streamlit as st
+
+from sabdastra.hash import maheshwara_hash
+
+
+def render():
+    txt = st.text_area("Text / Code")
+    if st.button("Hash"):
+        st.code(maheshwara_hash(txt))
@@ -0,0 +1,39 @@
+# Mantra Chanting Mode page
+import streamlit as st
+
+from sabdastra.recognizer import default_registry
+from views.cache import cached
+
+
+@cached(max_entries=1, resource=True)
+def registry():
+    # automaton and per-mantra bytecode are built once per server process
+    return default_registry()
+
+
+def render():
+    # Upgrade 6: Mantra-based execution
+    st.markdown("Chant a mantra to generate and execute code.")
+    mantras = registry()
+    mantra = st.selectbox("Mantra", mantras.names())
+    if st.button("Chant"):
+        compiled = mantras.compiled(mantra)
+        st.subheader("Generated AST")
+        st.json(compiled["ast"])
+        st.subheader("Generated Code")
+        st.code(compiled["python"])
+        st.subheader("VM Execution")
+        output = mantras.run(mantra)
+        st.code("\n".join(output))
+
+    st.subheader("Recognize a chant transcript")
+    transcript = st.text_area("Type or paste a transcript", "om bhur bhuvah svah tat savitur varenyam")
+    if st.button("Recognize"):
+        results = mantras.dispatch(transcript)
+        if not results:
+            st.info("No known mantra recognized.")
+        st.dataframe([
+            {"mantra": m.name, "start": m.start, "end": m.end, "text": transcript[m.start:m.end],
+             "output": "\n".join(out)}
+            for m, out in results
+        ])
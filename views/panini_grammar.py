@@ -0,0 +1,57 @@
+# Panini Grammar page
+import streamlit as st
+
+from sabdastra import pratyahara
+from sabdastra.grammar import SANDHI_RULES
+from sabdastra.sandhi import default_engine
+from views.cache import static_frame
+
+
+def render():
+    st.header("Explore Panini Grammar 📜🕉️")
+    st.write("""
+    Panini's Ashtadhyayi with sutras, sandhi rules, quiz.
+    """)
+    tab1, tab2, tab3, tab4 = st.tabs(["Sutras", "Sandhi Rules", "Pratyāhāras", "Quiz"])
+    with tab1:
+        df_panini = static_frame("panini")
+        st.dataframe(df_panini)
+    with tab2:
+        for rule in SANDHI_RULES:
+            st.write(rule)
+        engine = default_engine()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Join**")
+            left = st.text_input("First word", "deva")
+            right = st.text_input("Second word", "indra")
+            rule = engine.explain(left, right)
+            st.success(f"{left} + {right} = {engine.join(left, right)}"
+                       + (f" ({rule.sutra}: {rule.left} + {rule.right} → {rule.output})" if rule else " (no sandhi)"))
+        with col2:
+            st.markdown("**Split**")
+            compound = st.text_input("Compound", "devendra")
+            known = st.text_input("Known words (optional, comma sep)", "deva,indra")
+            vocab = {w.strip() for w in known.split(",") if w.strip()} or None
+            st.dataframe([{"left": a, "right": b, "sutra": r.sutra} for a, b, r in engine.split(compound, vocab)])
+    with tab3:
+        name = st.text_input("Pratyāhāra", "ac")
+        try:
+            st.success(" ".join(pratyahara.members(name)))
+        except KeyError as e:
+            st.error(e.args[0])
+        text = st.text_input("Classify", "devendraḥ")
+        st.dataframe([{"phoneme": p, "class": c or "-"}
+                      for p, c in pratyahara.classify(text, ("ac", "haś", "khar"))])
+    with tab4:
+        questions = [
+            {"q": "What is sutra 6.1.77 for?", "options": ["Vowel sandhi", "Verb endings"], "ans": "Vowel sandhi"},
+            # Add more
+        ]
+        score = 0
+        for q in questions:
+            ans = st.radio(q["q"], q["options"])
+            if ans == q["ans"]:
+                score += 1
+        if st.button("Submit"):
+            st.write(f"Score: {score}/{len(questions)}")
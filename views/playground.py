@@ -0,0 +1,172 @@
+# Playground page
+import json
+
+import streamlit as st
+
+from sabdastra.astview import AstView
+from sabdastra.trace import span
+from sabdastra.lexer import tokenize
+from sabdastra.parser import parse
+from sabdastra.timetravel import Cursor, Recording, record_ast
+from sabdastra.transpiler import transpile_ast
+from sabdastra.vm import StepLimitExceeded, compile_to_bytecode, interpret_ast
+from views.cache import cached, source_key
+
+
+# Compiled artifacts keyed by the sha256 of the source; _src itself is not hashed
+@cached(max_entries=32)
+def front_end(key: str, _src: str) -> dict:
+    tokens = tokenize(_src)
+    ast = parse(tokens)
+    with span("json.dumps.ast"):
+        return {
+            "ast": ast,
+            "tokens_json": json.dumps(tokens),
+            "ast_json": json.dumps(ast),
+        }
+
+
+@cached(max_entries=32, resource=True)
+def ast_view(key: str, _src: str) -> AstView:
+    # shared so its per-subtree DOT fragments survive reruns
+    return AstView(front_end(key, _src)["ast"])
+
+
+def render_ast(key: str, src: str) -> None:
+    view = ast_view(key, src)
+    state = st.session_state.setdefault("ast_expanded", {"key": key, "paths": set()})
+    if state["key"] != key:
+        state.update(key=key, paths=set())
+    expanded = state["paths"]
+    with span("render.dot"):
+        dot = view.to_dot(expanded)
+    st.caption(f"Showing {view.visible_nodes(expanded)} of {view.total_nodes} nodes (dashed nodes are collapsed)")
+    with span("render.graphviz", bytes=len(dot)):
+        st.graphviz_chart(dot)
+    options = view.expandable(expanded)
+    col1, col2 = st.columns([4, 1])
+    if options:
+        choice = col1.selectbox("Expand subtree", options, format_func=lambda o: o[1])
+        if col2.button("Expand"):
+            expanded.add(choice[0])
+            st.rerun()
+    if expanded and col2.button("Collapse all"):
+        expanded.clear()
+        st.rerun()
+
+
+@cached(max_entries=32)
+def python_output(key: str, _src: str) -> str:
+    return transpile_ast(front_end(key, _src)["ast"])
+
+
+# instruction budget for Playground runs; a yatra loop may never end
+STEP_LIMIT = 1_000_000
+
+
+@cached(max_entries=32)
+def vm_output(key: str, _src: str) -> dict:
+    ast = front_end(key, _src)["ast"]
+    bytecode, constants = compile_to_bytecode(ast)
+    with span("json.dumps.bytecode"):
+        bytecode_json = json.dumps({"bytecode": bytecode, "constants": constants})
+    try:
+        output, error = interpret_ast(ast, max_steps=STEP_LIMIT), None
+    except StepLimitExceeded as e:  # cached too, so reruns do not spin again
+        output, error = e.output, str(e)
+    return {
+        "bytecode_json": bytecode_json,
+        "output": output,
+        "error": error,
+    }
+
+
+@cached(max_entries=8, resource=True)
+def recording(key: str, _src: str) -> Recording:
+    # shared and read-only; each session steps through it with its own Cursor
+    return record_ast(front_end(key, _src)["ast"], max_steps=STEP_LIMIT)
+
+
+def render_stepper(key: str, src: str) -> None:
+    rec = recording(key, src)
+    if not len(rec):
+        st.info("Nothing to step through: the program runs no instructions.")
+        return
+    state = st.session_state.setdefault("stepper", {"key": None})
+    if state["key"] != key:
+        state.update(key=key, cursor=Cursor(rec))
+        st.session_state.step = 0
+    cursor = state["cursor"]
+
+    def move(to):
+        st.session_state.step = max(0, min(to, len(rec)))
+
+    cols = st.columns(4)
+    cols[0].button("⏮ Start", on_click=move, args=(0,))
+    cols[1].button("◀ Back", on_click=lambda: move(st.session_state.step - 1))
+    cols[2].button("Forward ▶", on_click=lambda: move(st.session_state.step + 1))
+    cols[3].button("End ⏭", on_click=move, args=(len(rec),))
+    st.slider("Step", 0, len(rec), key="step")
+    frame = cursor.seek(st.session_state.step)
+    st.caption(f"Step {frame.step:,} of {len(rec):,}"
+               + ("" if rec.finished else f" (recording stopped at {STEP_LIMIT:,} instructions)"))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Bytecode**")
+        lo = max(0, frame.pc - 3)
+        st.code("\n".join(f"{'▶' if pc == frame.pc else ' '} {pc:4d} {rec.instruction(pc)}"
+                          for pc in range(lo, min(len(rec.bytecode) + 1, frame.pc + 4))))
+        st.markdown("**Stack** (top last)")
+        st.code(repr(frame.stack))
+    with col2:
+        st.markdown("**env**")
+        # names with '#' are the VM's hidden yugma counters and bounds
+        st.dataframe([{"name": k, "value": repr(v)} for k, v in frame.env.items() if "#" not in k])
+        st.markdown("**Output so far**")
+        st.code("\n".join(cursor.output()[-20:]))
+
+
+def render():
+    src = st.text_area("Śabdāstra Code", """bhava vira:
+    kar greet(nama):
+        yadi nama == 'Mahan':
+            ch 'Namaste' nama
+        anya:
+            ch 'Hello' nama
+    yugma i in 3:
+        greet 'Mahan'
+""", height=220)
+    mode = st.radio("Execution Mode", ["Transpile to Python", "Interpret in VM"])
+    if st.button("Compile"):
+        st.session_state.compiled_src = src
+    # results stay up across reruns (e.g. expanding AST nodes) until the code changes
+    if st.session_state.get("compiled_src") == src:
+        try:
+            key = source_key(src)
+            compiled = front_end(key, src)
+            # Upgrade 3: Visual AST Tree Viewer
+            st.subheader("AST Visualization")
+            render_ast(key, src)
+            with span("render.json"):
+                st.subheader("Tokens")
+                st.json(compiled["tokens_json"])
+                st.subheader("AST")
+                st.json(compiled["ast_json"])
+            if mode == "Transpile to Python":
+                py = python_output(key, src)
+                st.subheader("Python Output")
+                st.code(py, language="python")
+            else:
+                st.subheader("Bytecode")
+                run = vm_output(key, src)
+                with span("render.json"):
+                    st.json(run["bytecode_json"])
+                st.subheader("VM Output")
+                st.code("\n".join(run["output"]))
+                if run["error"]:
+                    st.error(run["error"])
+                st.subheader("Step Through")
+                render_stepper(key, src)
+        except Exception as e:
+            st.error(f"Compilation error: {e}")
@@ -0,0 +1,14 @@
+# Sanskrit Linguistics page
+import streamlit as st
+
+from views.cache import static_frame
+
+
+def render():
+    st.header("Explore Sanskrit Linguistics 🗣️🕉️")
+    st.write("""
+    Key concepts in Sanskrit linguistics, Vyakarana, Panini.
+    """)
+    df_ling = static_frame("linguistics")
+    st.dataframe(df_ling)
+    st.write("Overview: Sanskrit linguistics centers on Vyakarana, the science of grammar, pioneered by Panini in Ashtadhyayi. It includes phonetics, morphology, syntax, semantics. Key: sphota theory, eternal words (nitya), pratyaharas, etc.")
@@ -0,0 +1,53 @@
+# Skill Tree page
+import uuid
+
+import streamlit as st
+
+from sabdastra.progress import is_unlocked, open_store
+from views.cache import cached
+
+
+@cached(max_entries=1, resource=True)
+def progress_store():
+    # one store (and writer thread) per server process, shared by all sessions
+    return open_store()
+
+
+def learner_id() -> str:
+    # kept in the URL so a reconnect or another server process finds the same progress
+    if "learner" not in st.query_params:
+        st.query_params["learner"] = uuid.uuid4().hex[:12]
+    return st.query_params["learner"]
+
+
+def render():
+    st.markdown("""
+    ## Skill Tree
+    Complete levels sequentially. Mark as done to unlock next.
+    """)
+    levels = [
+        {'id':1,'title':'Level 1 — Basics','desc':'Tokens, kar (def), ch (print), basic function.','code':'kar greet(nama):\n    ch "Namaste" nama\ngreet "Mahan"'},
+        {'id':2,'title':'Level 2 — Control flow','desc':'yadi (if), anya (else).','code':'yadi 1 == 1:\n    ch "True"\nanya:\n    ch "False"'},
+        {'id':3,'title':'Level 3 — Loops','desc':'yugma (for), yatra (while).','code':'yugma i in 3:\n    ch i\nyatra i < 5:\n    ch i\n    i = i + 1'},
+        {'id':4,'title':'Level 4 — Bhāva Syntax','desc':'bhava blocks for semantic tagging.','code':'bhava vira:\n    ch "Heroic mode"'},
+        {'id':5,'title':'Level 5 — Advanced (Sādhanā)','desc':'Integrate Maheshwara Hash, Mantras, VM.','code':'ch maheshwara_hash("secret")'},
+        {'id':6,'title':'Level 6 — Vedic Math','desc':'Use Vedic functions.','code':'ch vedic_multiply(8, 9)'},
+        {'id':7,'title':'Level 7 — Tantric Geometry','desc':'Draw yantras.','code':'draw_sri_yantra()'},
+        {'id':8,'title':'Level 8 — Panini Grammar','desc':'Explore sutras and sandhi.','code':'# See Panini page'},
+        {'id':9,'title':'Level 9 — Sanskrit Linguistics','desc':'Key concepts in Vyakarana.','code':'# See Linguistics page'},
+    ]
+    store = progress_store()
+    learner = learner_id()
+    st.caption(f"Learner: {learner} (bookmark this page to keep your progress)")
+    completed = store.completed(learner)
+    for lvl in levels:
+        unlocked = is_unlocked(completed, lvl['id'])  # Previous must be done
+        with st.expander(f"{lvl['title']} {'(Unlocked)' if unlocked else '(Locked)'}"):
+            if unlocked:
+                st.write(lvl['desc'])
+                st.code(lvl['code'])
+                if st.button(f"Mark Level {lvl['id']} Complete"):
+                    store.mark_complete(learner, lvl['id'])
+                    st.success(f"Level {lvl['id']} completed! XP +100")
+            else:
+                st.info("Complete previous levels to unlock.")
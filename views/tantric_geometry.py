@@ -0,0 +1,21 @@
+# Tantric Geometry page
+import streamlit as st
+
+from sabdastra.yantra import render_yantra
+
+
+# Tantric Geometry function
+def draw_sri_yantra(triangles=4, circles=(1.5,), petals=0):
+    # Rendered headlessly and cached in sabdastra/yantra.py; no pyplot figure is left open
+    st.image(render_yantra(triangles, tuple(circles), petals))
+
+
+def render():
+    st.header("Explore Tantric Geometry 🌀🕉️")
+    st.write("""
+    Code to draw sacred yantras like Sri Yantra using Matplotlib.
+    """)
+    n_triangles = st.slider("Triangles", 1, 9, 4)
+    n_petals = st.slider("Lotus petals", 0, 16, 0)
+    if st.button("Draw Sri Yantra"):
+        draw_sri_yantra(n_triangles, (1.5,), n_petals)
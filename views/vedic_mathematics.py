@@ -0,0 +1,123 @@
+# Vedic Mathematics page
+import streamlit as st
+
+from sabdastra.vedic import (
+    anurupye_proportion, chalana_diff, ekanyunena_mult_by_9, gunaka_factor_sum,
+    gunita_product_sum, purana_fraction, sheshanyankena_remainder, shunyam_equation,
+    sopaantyadvayam_div_by_11, vedic_add, vedic_divide, vedic_multiply, vedic_square,
+    vyashti_div, yaavadunam_square,
+)
+from views.cache import static_frame, static_index
+
+
+def render():
+    st.header("Explore Vedic Mathematics 🔢🕉️")
+    st.write("""
+    All 16 sutras with advanced algorithms. Select to explore.
+    """)
+    df_sutras = static_frame("vedic_sutras")
+    st.dataframe(df_sutras)
+    sutras = static_index("vedic_sutras", "name")
+    sutra_select = st.selectbox("Select Sutra", list(sutras))
+    desc = sutras[sutra_select]['desc']
+    example = sutras[sutra_select]['example']
+    st.write(f"Description: {desc}")
+    st.write(f"Example: {example}")
+    col1, col2 = st.columns(2)
+    with col1:
+        if "Multiply" in sutra_select or "Nikhilam" in sutra_select:
+            a = st.number_input("A", value=8)
+            b = st.number_input("B", value=9)
+            if st.button("Calculate"):
+                result = vedic_multiply(a, b)
+                st.success(f"Result: {result}")
+        elif "Square" in sutra_select or "Ekadhikena" in sutra_select:
+            n = st.number_input("N", value=15)
+            if st.button("Calculate"):
+                result = vedic_square(n)
+                st.success(f"Result: {result}")
+        elif "Yaavadunam" in sutra_select:
+            n = st.number_input("N", value=15)
+            base = st.number_input("Base", value=10)
+            if st.button("Calculate"):
+                result = yaavadunam_square(n, base)
+                st.success(f"Result: {result}")
+        elif "Divide" in sutra_select or "Paraavartya" in sutra_select:
+            dividend = st.number_input("Dividend", value=10)
+            divisor = st.number_input("Divisor", value=2)
+            if st.button("Calculate"):
+                result = vedic_divide(dividend, divisor)
+                st.success(result)
+        elif "Add" in sutra_select or "Sankalana" in sutra_select:
+            nums = st.text_input("Numbers (comma sep)", "1,2,3")
+            if st.button("Calculate"):
+                numbers = [int(x) for x in nums.split(",")]
+                result = vedic_add(numbers)
+                st.success(f"Sum: {result}")
+        elif "Shunyam" in sutra_select:
+            coeffs = st.text_input("Coeffs (comma sep a,b,c,d)", "1,2,1,2")
+            if st.button("Calculate"):
+                coeffs_list = [int(x) for x in coeffs.split(",")]
+                result = shunyam_equation(coeffs_list)
+                st.success(f"Result: {result}")
+        elif "Anurupye" in sutra_select:
+            a = st.number_input("A", value=2)
+            b = st.number_input("B", value=0)
+            ratio = st.number_input("Ratio", value=3)
+            if st.button("Calculate"):
+                result = anurupye_proportion(a, b, ratio)
+                st.success(f"Result: {result}")
+        elif "Purana" in sutra_select:
+            num = st.number_input("Numerator", value=1)
+            den = st.number_input("Denominator", value=2)
+            if st.button("Calculate"):
+                result = purana_fraction(num, den)
+                st.success(f"Result: {result}")
+        elif "Chalana" in sutra_select:
+            a = st.number_input("A", value=5)
+            b = st.number_input("B", value=3)
+            if st.button("Calculate"):
+                result = chalana_diff(a, b)
+                st.success(f"Result: {result}")
+        elif "Vyashti" in sutra_select:
+            dividend = st.number_input("Dividend", value=10)
+            divisor = st.number_input("Divisor", value=2)
+            if st.button("Calculate"):
+                result = vyashti_div(dividend, divisor)
+                st.success(f"Result: {result}")
+        elif "Sheshanyankena" in sutra_select:
+            n = st.number_input("N", value=10)
+            d = st.number_input("D", value=3)
+            if st.button("Calculate"):
+                result = sheshanyankena_remainder(n, d)
+                st.success(f"Remainder: {result}")
+        elif "Sopaantyadvayam" in sutra_select:
+            n = st.number_input("N", value=22)
+            if st.button("Calculate"):
+                result = sopaantyadvayam_div_by_11(n)
+                st.success(f"Divisible by 11: {result}")
+        elif "Ekanyunena" in sutra_select:
+            n = st.number_input("N", value=10)
+            if st.button("Calculate"):
+                result = ekanyunena_mult_by_9(n)
+                st.success(f"Result: {result}")
+        elif "Gunitasamuchyah" in sutra_select:
+            a = st.number_input("A", value=2)
+            b = st.number_input("B", value=3)
+            c = st.number_input("C", value=4)
+            if st.button("Calculate"):
+                result = gunita_product_sum(a, b, c)
+                st.success(f"Equal: {result}")
+        elif "Gunakasamuchyah" in sutra_select:
+            a = st.number_input("A", value=2)
+            b = st.number_input("B", value=3)
+            c = st.number_input("Sum", value=5)
+            if st.button("Calculate"):
+                result = gunaka_factor_sum(a, b, c)
+                st.success(f"True: {result}")
+    with col2:
+        st.write("Example: ...")  # Add from search
+    st.code("""
+# Example in Śabdāstra
+ch vedic_multiply(8, 9)
+""")
@@ -0,0 +1,14 @@
+# Welcome page
+import streamlit as st
+
+
+def render():
+    st.markdown("""
+    ### What is Śabdāstra?
+    Śabdāstra is a Sanskrit-inspired programming language where **sound → meaning → logic**.
+    This lab teaches it step-by-step:
+    - Tokenizer → AST → Transpiler / Interpreter
+    - Bhāva-tagged semantics (expanded)
+    - Maheshwara-based hashing
+    - NEW: Full grammar (if/else/loops), Bhāva blocks, AST viewer, progress saving, VM (bytecode optimized with constant folding), Mantra modes, All 16 Vedic Sutras (advanced impl), Tantric Geometry, Panini Grammar, Sanskrit Linguistics
+    """)